@@ -0,0 +1,126 @@
+"""Benchmark cache throughput under thread contention.
+
+Runs the same mixed get/set workload against MemoryCache (one lock) and
+StripedMemoryCache (one lock per stripe), plus the global-cache lookup every
+request makes and cached requests through ScrythonRequestHandler._fetch_raw()
+(which also count per-endpoint stats), at increasing thread counts. On a free-threaded build
+(python3.13t) the striped cache should keep scaling with threads; on a
+GIL build the gap is smaller, since only one thread runs Python at a time.
+
+Usage:
+    python benchmarks/cache_contention.py
+    python benchmarks/cache_contention.py --threads 1 4 16 64 --ops 50000 --stripes 32
+"""
+
+import argparse
+import sys
+import sysconfig
+import threading
+import time
+from collections.abc import Callable
+
+from scrython.base import ScrythonRequestHandler
+from scrython.cache import (
+    CacheBackend,
+    MemoryCache,
+    StripedMemoryCache,
+    get_global_cache,
+    set_global_cache,
+)
+
+KEYS = [f"{i:064x}" for i in range(4096)]
+DATA = {"object": "card", "name": "Lightning Bolt"}
+
+
+def cache_workload(cache: CacheBackend, ops: int, offset: int) -> None:
+    """Mostly reads, like a warm cache: one set per nine gets."""
+    for i in range(ops):
+        key = KEYS[(i * 7 + offset) % len(KEYS)]
+        if i % 10 == 0:
+            cache.set(key, DATA, 60)
+        else:
+            cache.get(key)
+
+
+def global_workload(_cache: CacheBackend, ops: int, _offset: int) -> None:
+    """Fetch the global cache, as every request does."""
+    for _ in range(ops):
+        get_global_cache()
+
+
+class _Named(ScrythonRequestHandler):
+    _endpoint = "cards/named"
+
+
+def request_workload(_cache: CacheBackend, ops: int, offset: int) -> None:
+    """Cached requests through the full request path, against the global cache."""
+    handler = _Named.__new__(_Named)
+    for i in range(ops):
+        key = KEYS[(i * 7 + offset) % len(KEYS)]
+        handler._fetch_raw(
+            f"https://api.scryfall.com/cards/named?exact={key}", cache_key=key, cache=True
+        )
+
+
+def run(
+    workload: Callable[[CacheBackend, int, int], None],
+    cache: CacheBackend,
+    threads: int,
+    ops: int,
+) -> float:
+    """Run the workload on all threads at once and return operations per second."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(offset: int) -> None:
+        barrier.wait()
+        workload(cache, ops, offset)
+
+    workers = [threading.Thread(target=worker, args=(n * 613,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--ops", type=int, default=20_000, help="operations per thread")
+    parser.add_argument("--stripes", type=int, default=16)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    print(f"Python {sys.version.split()[0]}, free-threaded build: {free_threaded}, GIL: {gil}")
+    print(f"{args.ops:,} operations per thread, {args.stripes} stripes\n")
+
+    print(
+        f"{'threads':>7} {'MemoryCache':>14} {'Striped':>14} {'speedup':>8} {'global':>14} "
+        f"{'req Memory':>14} {'req Striped':>14}"
+    )
+    for threads in args.threads:
+        memory = MemoryCache(max_entries=None)
+        striped = StripedMemoryCache(stripes=args.stripes, max_entries=None)
+        for key in KEYS:
+            memory.set(key, DATA, 60)
+            striped.set(key, DATA, 60)
+
+        memory_rate = run(cache_workload, memory, threads, args.ops)
+        striped_rate = run(cache_workload, striped, threads, args.ops)
+        set_global_cache(memory)
+        global_rate = run(global_workload, memory, threads, args.ops)
+        memory_request_rate = run(request_workload, memory, threads, args.ops)
+        set_global_cache(striped)
+        striped_request_rate = run(request_workload, striped, threads, args.ops)
+        print(
+            f"{threads:>7} {memory_rate:>12,.0f}/s {striped_rate:>12,.0f}/s "
+            f"{striped_rate / memory_rate:>7.2f}x {global_rate:>12,.0f}/s "
+            f"{memory_request_rate:>12,.0f}/s {striped_request_rate:>12,.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
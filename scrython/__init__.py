@@ -1,3 +1,14 @@
-from . import bulk_data, cards, catalogs, migrations, rulings, sets, symbology
+from . import aio, bulk_data, cards, catalogs, migrations, rulings, sets, symbology
+from .batch import fetch_many
 
-__all__ = ["bulk_data", "cards", "catalogs", "migrations", "rulings", "sets", "symbology"]
+__all__ = [
+    "aio",
+    "bulk_data",
+    "cards",
+    "catalogs",
+    "migrations",
+    "rulings",
+    "sets",
+    "symbology",
+    "fetch_many",
+]
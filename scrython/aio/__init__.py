@@ -0,0 +1,13 @@
+from . import cards, catalogs, rulings, sets
+from .base import AsyncScryfallListMixin, AsyncScrythonRequestHandler
+from .rate_limiter import AsyncRateLimiter
+
+__all__ = [
+    "cards",
+    "catalogs",
+    "rulings",
+    "sets",
+    "AsyncRateLimiter",
+    "AsyncScryfallListMixin",
+    "AsyncScrythonRequestHandler",
+]
@@ -0,0 +1,345 @@
+import asyncio
+import json
+import urllib.error
+import urllib.parse
+from collections.abc import AsyncIterator, Generator
+from typing import Any, TypeVar
+
+from ..base import _VALIDATOR_HEADERS, ScryfallError, ScrythonRequestHandler, _response_validators
+from ..base_mixins import ScryfallListMixin
+from ..cache import CacheEntry, generate_cache_key, get_global_cache
+from ..cache_policy import TTLPolicy
+from ..entity_cache import get_global_entity_cache
+from ..rate_limiter import EndpointRateLimiters, RateLimiter
+from ..retry import THROTTLE_STATUSES, RetryPolicy, is_transient_error, retry_after_from
+from ..singleflight import get_global_async_single_flight
+from .transport import get_global_async_pool
+
+_HandlerT = TypeVar("_HandlerT", bound="AsyncScrythonRequestHandler")
+
+# Background revalidation tasks by cache key (also keeps them from being
+# garbage collected while running)
+_revalidating: dict[str, asyncio.Task] = {}
+
+
+class AsyncScrythonRequestHandler(ScrythonRequestHandler):
+    """
+    Base class for asyncio Scryfall API requests.
+
+    Async endpoint classes take the same arguments as their synchronous
+    counterparts, but the request is only sent when the object is awaited.
+    Awaiting returns the object itself, populated with the response, so all
+    mixin properties work exactly as they do on the synchronous classes.
+
+    Requests share the global cache and the global rate limiter with the
+    synchronous classes, awaiting their rate-limit slot instead of blocking.
+
+    Example:
+        card = await scrython.aio.cards.Named(fuzzy='Lightning Bolt')
+        print(card.name)
+
+        # Run many lookups concurrently on one event loop
+        cards = await asyncio.gather(
+            *(scrython.aio.cards.ById(id=card_id) for card_id in card_ids)
+        )
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._build_path(**kwargs)
+        self._build_params(**kwargs)
+        self._request_kwargs = kwargs
+
+    def __await__(self: _HandlerT) -> Generator[Any, None, _HandlerT]:
+        return self._load().__await__()
+
+    async def _load(self: _HandlerT) -> _HandlerT:
+        await self._fetch_async(**self._request_kwargs)
+
+        if self._scryfall_data["object"] == "error":
+            raise ScryfallError(self._scryfall_data, self._scryfall_data["details"])
+
+        return self
+
+    async def _fetch_raw_async(
+        self, url: str, cache_key: str | None = None, **kwargs: Any
+    ) -> dict[str, Any]:
+        """
+        Low-level async HTTP fetch for absolute URLs.
+
+        Async counterpart of ScrythonRequestHandler._fetch_raw(), accepting
+        the same options.
+
+        Args:
+            url: Full absolute URL to fetch
+            cache_key: Optional cache key to use (if not provided, caching is skipped)
+            **kwargs: Optional parameters:
+                - cache (bool): Enable (True) or disable (False) caching
+                  (default: as decided by the global TTLPolicy)
+                - cache_ttl (int): Cache TTL in seconds (default: the
+                  TTLPolicy rule's TTL, or 3600)
+                - rate_limit (bool): Enable rate limiting (default: True)
+                - rate_limit_per_second (float): Rate limit (default: 10.0)
+                - retry (bool): Retry 429, 5xx and connection errors (default: True)
+                - retry_policy (RetryPolicy): Policy to use instead of the global one
+                - single_flight (bool): Share one request between concurrent
+                  identical calls (default: True)
+                - entity_cache (bool): Index cached cards by all of their
+                  identifiers (default: True, only applies with cache=True)
+                - stale_while_revalidate (float): Seconds past expiry a cached
+                  response may be returned while it is refreshed in the
+                  background (default: 0)
+                - stale_if_error (float): Seconds past expiry a cached response
+                  may be returned when the request fails with a 429, 5xx or
+                  connection error (default: 0)
+                - data (dict): POST data (optional)
+
+        Returns:
+            dict: Parsed JSON response from Scryfall API
+
+        Raises:
+            Exception: On HTTP errors or request failures
+        """
+        cache_ttl = TTLPolicy.get_global_policy().ttl_for(self, url, **kwargs)
+        kwargs = {**kwargs, "cache": cache_ttl is not None, "cache_ttl": cache_ttl}
+        use_cache = kwargs["cache"]
+        stale_while_revalidate = kwargs.get("stale_while_revalidate", 0)
+        stale_if_error = kwargs.get("stale_if_error", 0)
+        entry: CacheEntry | None = None
+
+        if use_cache and cache_key is not None:
+            entry = self._lookup_cache(cache_key)
+            if entry is not None:
+                stale_for = entry.stale_for()
+                if stale_for < 0:
+                    return entry.data
+                if stale_for <= stale_while_revalidate:
+                    self._revalidate_async(url, cache_key, entry, **kwargs)
+                    return entry.data
+
+        try:
+            return await self._shared_request_async(url, cache_key, entry, **kwargs)
+        except Exception as exc:
+            if (
+                entry is not None
+                and entry.stale_for() <= stale_if_error
+                and is_transient_error(exc)
+            ):
+                return entry.data
+            raise
+
+    async def _shared_request_async(
+        self,
+        url: str,
+        cache_key: str | None = None,
+        cached: CacheEntry | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Send a request, sharing it with concurrent identical calls if enabled.
+
+        Async counterpart of ScrythonRequestHandler._shared_request().
+        """
+        if (
+            kwargs.get("single_flight", True)
+            and cache_key is not None
+            and TTLPolicy.get_global_policy().shareable(self, url)
+        ):
+            return await get_global_async_single_flight().do(
+                cache_key, lambda: self._request_async(url, cache_key, cached, **kwargs)
+            )
+
+        return await self._request_async(url, cache_key, cached, **kwargs)
+
+    def _revalidate_async(
+        self, url: str, cache_key: str, cached: CacheEntry, **kwargs: Any
+    ) -> None:
+        """
+        Refresh a cached response in a background task.
+
+        Async counterpart of ScrythonRequestHandler._revalidate().
+        """
+        task = _revalidating.get(cache_key)
+        if task is not None and not task.done():
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._shared_request_async(url, cache_key, cached, **kwargs)
+            except Exception:
+                pass
+            finally:
+                _revalidating.pop(cache_key, None)
+
+        _revalidating[cache_key] = asyncio.get_running_loop().create_task(refresh())
+
+    async def _request_async(
+        self,
+        url: str,
+        cache_key: str | None = None,
+        cached: CacheEntry | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Send a request to url, with rate limiting and retries, and cache the result.
+
+        Async counterpart of ScrythonRequestHandler._request().
+        """
+        use_cache = kwargs.get("cache", False)
+        cache_ttl = kwargs.get("cache_ttl", 3600)
+
+        rate_limit = kwargs.get("rate_limit", True)
+        retry = kwargs.get("retry", True)
+        policy = kwargs.get("retry_policy") or RetryPolicy.get_global_policy()
+        if retry:
+            policy.budget.record_request()
+
+        request = self._build_request(url, **kwargs)
+        if cached is not None and cached.validators:
+            for name, value in cached.validators.items():
+                request.add_header(_VALIDATOR_HEADERS[name], value)
+
+        response_data: dict[str, Any] | None = None
+        validators: dict[str, str] | None = None
+        attempt = 0
+        while True:
+            limiter = await self._wait_for_rate_limit_async(url, **kwargs) if rate_limit else None
+
+            try:
+                response = await get_global_async_pool().request(
+                    request.get_method(), url, request.data, dict(request.header_items())  # type: ignore[arg-type]
+                )
+            except (urllib.error.HTTPError, urllib.error.URLError) as exc:
+                # Not Modified: the cached body is still current
+                if (
+                    cached is not None
+                    and isinstance(exc, urllib.error.HTTPError)
+                    and exc.code == 304
+                ):
+                    response_data = cached.data
+                    validators = {
+                        **(cached.validators or {}),
+                        **(_response_validators(exc.headers) or {}),
+                    }
+                    break
+
+                retry_after = retry_after_from(exc)
+
+                if (
+                    limiter is not None
+                    and isinstance(exc, urllib.error.HTTPError)
+                    and exc.code in THROTTLE_STATUSES
+                ):
+                    limiter.penalize(retry_after)
+
+                if retry and policy.should_retry(exc, attempt):
+                    await asyncio.sleep(policy.delay(attempt, retry_after))
+                    attempt += 1
+                    continue
+
+                if isinstance(exc, urllib.error.HTTPError):
+                    raise Exception(f"{exc}: {url}") from exc
+                raise
+
+            break
+
+        if limiter is not None:
+            limiter.recover()
+
+        if response_data is None:
+            charset = response.info().get_param("charset") or "utf-8"
+            response_data = json.loads(response.read().decode(charset))  # type: ignore[arg-type]
+            if use_cache:
+                validators = _response_validators(response.info())
+
+        TTLPolicy.get_global_policy().record_bulk_update(response_data)
+
+        if use_cache and cache_key is not None and response_data.get("object") != "error":
+            get_global_cache().set_entry(cache_key, response_data, cache_ttl, validators)
+
+        if use_cache and kwargs.get("entity_cache", True):
+            get_global_entity_cache().add_response(
+                response_data, cache_ttl, by_name=self._entity_by_name(**kwargs)
+            )
+
+        return response_data
+
+    async def _wait_for_rate_limit_async(self, url: str, **kwargs: Any) -> RateLimiter:
+        """
+        Wait until the rate limiters allow a request to url.
+
+        Async counterpart of ScrythonRequestHandler._wait_for_rate_limit().
+
+        Returns:
+            The global RateLimiter that was waited on, shared with
+            synchronous requests
+        """
+        endpoint_limiters = EndpointRateLimiters.get_global_limiter()
+        if endpoint_limiters is not None:
+            delay = endpoint_limiters.reserve(urllib.parse.urlsplit(url).path)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        rate_limit_per_second = kwargs.get("rate_limit_per_second", 10.0)
+        limiter = RateLimiter.get_global_limiter(rate_limit_per_second)
+        delay = limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return limiter
+
+    async def _fetch_async(self, **kwargs: Any) -> None:
+        """
+        Fetch data from Scryfall API using the endpoint template.
+
+        Args:
+            **kwargs: Optional parameters passed to _fetch_raw_async()
+        """
+        card = self._entity_lookup(**kwargs)
+        if card is not None:
+            self._scryfall_data = card
+            if hasattr(self, "_scryfall_namespace"):
+                delattr(self, "_scryfall_namespace")
+            return
+
+        url = f"https://api.scryfall.com/{self.endpoint}?{self._encoded_query_params}"
+        cache_key = generate_cache_key(self.endpoint, self._query_params)
+
+        self._scryfall_data = await self._fetch_raw_async(url, cache_key=cache_key, **kwargs)
+
+        if hasattr(self, "_scryfall_namespace"):
+            delattr(self, "_scryfall_namespace")
+
+
+class AsyncScryfallListMixin(ScryfallListMixin):
+    """List mixin whose iter_all() is an async generator."""
+
+    async def iter_all(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """
+        Async generator that auto-paginates through all results.
+
+        Yields items from the current page, then awaits each subsequent page.
+        Accepts the same options as ScryfallListMixin.iter_all().
+
+        Yields:
+            Individual items from all pages
+
+        Example:
+            results = await scrython.aio.cards.Search(q='c:red')
+            async for card in results.iter_all():
+                print(card.name)
+        """
+        import hashlib
+
+        for item in self.data:
+            yield item
+
+        has_more = self.has_more
+        next_page = self.next_page
+        while has_more and next_page:
+            cache_key = hashlib.sha256(next_page.encode()).hexdigest()
+            next_data = await self._fetch_raw_async(next_page, cache_key=cache_key, **kwargs)  # type: ignore[attr-defined]
+
+            for item in next_data.get("data", []):
+                yield self.list_data_type(item) if self.list_data_type else item
+
+            has_more = next_data.get("has_more", False)
+            next_page = next_data.get("next_page")
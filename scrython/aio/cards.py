@@ -0,0 +1,96 @@
+"""Async card endpoints. See scrython.cards for full documentation of each endpoint."""
+
+from ..base_mixins import ScryfallCatalogMixin
+from ..cards.cards import Object
+from ..cards.cards_mixins import CardsObjectMixin
+from ..cards.loader import AsyncCollectionCoalescingMixin
+from .base import AsyncScryfallListMixin, AsyncScrythonRequestHandler
+
+
+class Search(AsyncScryfallListMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.Search`."""
+
+    _endpoint = "/cards/search"
+    list_data_type = Object
+
+
+class Named(AsyncCollectionCoalescingMixin, CardsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.Named`."""
+
+    _endpoint = "/cards/named"
+    _collection_identifier = {"name": "exact"}
+    _collection_identifier_optional = {"set": "set"}
+    _entity_identifier = {"name": "exact", "set": "set"}
+
+
+class Autocomplete(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.Autocomplete`."""
+
+    _endpoint = "/cards/autocomplete"
+
+
+class Random(CardsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.Random`."""
+
+    _endpoint = "/cards/random"
+
+
+class Collection(AsyncScryfallListMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.Collection`."""
+
+    _endpoint = "/cards/collection"
+    list_data_type = Object
+
+
+class ByCodeNumber(AsyncCollectionCoalescingMixin, CardsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.ByCodeNumber`."""
+
+    _endpoint = "/cards/:code/:number/:lang?"
+    _collection_identifier = {"set": "code", "collector_number": "number"}
+    _entity_identifier = {"set": "code", "collector_number": "number"}
+    _entity_identifier_optional = {"lang": "lang"}
+
+
+class ByMultiverseId(AsyncCollectionCoalescingMixin, CardsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.ByMultiverseId`."""
+
+    _endpoint = "/cards/multiverse/:id"
+    _collection_identifier = {"multiverse_id": "id"}
+    _entity_identifier = {"multiverse_id": "id"}
+
+
+class ByMTGOId(AsyncCollectionCoalescingMixin, CardsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.ByMTGOId`."""
+
+    _endpoint = "/cards/mtgo/:id"
+    _collection_identifier = {"mtgo_id": "id"}
+    _entity_identifier = {"mtgo_id": "id"}
+
+
+class ByArenaId(CardsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.ByArenaId`."""
+
+    _endpoint = "/cards/arena/:id"
+    _entity_identifier = {"arena_id": "id"}
+
+
+class ByTCGPlayerId(CardsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.ByTCGPlayerId`."""
+
+    _endpoint = "/cards/tcgplayer/:id"
+    _entity_identifier = {"tcgplayer_id": "id"}
+
+
+class ByCardMarketId(CardsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.ByCardMarketId`."""
+
+    _endpoint = "/cards/cardmarket/:id"
+    _entity_identifier = {"cardmarket_id": "id"}
+
+
+class ById(AsyncCollectionCoalescingMixin, CardsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.cards.ById`."""
+
+    _endpoint = "/cards/:id"
+    _collection_identifier = {"id": "id"}
+    _entity_identifier = {"id": "id"}
@@ -0,0 +1,124 @@
+"""Async catalog endpoints. See scrython.catalogs for full documentation of each endpoint."""
+
+from ..base_mixins import ScryfallCatalogMixin
+from .base import AsyncScrythonRequestHandler
+
+
+class CardNames(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.CardNames`."""
+
+    _endpoint = "/catalog/card-names"
+
+
+class CreatureTypes(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.CreatureTypes`."""
+
+    _endpoint = "/catalog/creature-types"
+
+
+class PlaneswalkerTypes(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.PlaneswalkerTypes`."""
+
+    _endpoint = "/catalog/planeswalker-types"
+
+
+class CardTypes(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.CardTypes`."""
+
+    _endpoint = "/catalog/card-types"
+
+
+class KeywordAbilities(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.KeywordAbilities`."""
+
+    _endpoint = "/catalog/keyword-abilities"
+
+
+class KeywordActions(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.KeywordActions`."""
+
+    _endpoint = "/catalog/keyword-actions"
+
+
+class ArtifactTypes(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.ArtifactTypes`."""
+
+    _endpoint = "/catalog/artifact-types"
+
+
+class EnchantmentTypes(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.EnchantmentTypes`."""
+
+    _endpoint = "/catalog/enchantment-types"
+
+
+class LandTypes(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.LandTypes`."""
+
+    _endpoint = "/catalog/land-types"
+
+
+class SpellTypes(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.SpellTypes`."""
+
+    _endpoint = "/catalog/spell-types"
+
+
+class ArtistNames(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.ArtistNames`."""
+
+    _endpoint = "/catalog/artist-names"
+
+
+class WordBank(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.WordBank`."""
+
+    _endpoint = "/catalog/word-bank"
+
+
+class Supertypes(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.Supertypes`."""
+
+    _endpoint = "/catalog/supertypes"
+
+
+class BattleTypes(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.BattleTypes`."""
+
+    _endpoint = "/catalog/battle-types"
+
+
+class Powers(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.Powers`."""
+
+    _endpoint = "/catalog/powers"
+
+
+class Toughnesses(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.Toughnesses`."""
+
+    _endpoint = "/catalog/toughnesses"
+
+
+class Loyalties(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.Loyalties`."""
+
+    _endpoint = "/catalog/loyalties"
+
+
+class Watermarks(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.Watermarks`."""
+
+    _endpoint = "/catalog/watermarks"
+
+
+class AbilityWords(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.AbilityWords`."""
+
+    _endpoint = "/catalog/ability-words"
+
+
+class FlavorWords(ScryfallCatalogMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.catalogs.FlavorWords`."""
+
+    _endpoint = "/catalog/flavor-words"
@@ -0,0 +1,76 @@
+"""Asyncio-aware rate limiting for Scryfall API requests.
+
+The synchronous RateLimiter blocks its thread with ``time.sleep``. This
+limiter instead reserves a slot from the same token bucket and awaits
+``asyncio.sleep`` until that slot, so waiting coroutines never block the
+event loop. Async requests draw from the same global limiter as synchronous
+ones, so a process mixing both still gets a single budget.
+"""
+
+import asyncio
+
+from ..rate_limiter import RateLimiter
+
+
+class AsyncRateLimiter(RateLimiter):
+    """
+    Rate limiter for coroutines.
+
+    Each call to wait() reserves the next free slot from the token bucket
+    (see RateLimiter) and then sleeps until that slot without holding any
+    lock, so slots are granted in call order. Reservations are protected by a
+    threading.Lock, making a single limiter safe to share between event loops
+    in different threads.
+
+    There is no separate async global limiter: requests made with
+    scrython.aio reserve their slots from RateLimiter.get_global_limiter(),
+    whatever its type (e.g. a SharedRateLimiter), and await the delay.
+    """
+
+    @classmethod
+    def get_global_limiter(  # type: ignore[override]
+        cls, calls_per_second: float = 10.0, burst: int = 1
+    ) -> RateLimiter:
+        """
+        Get the global rate limiter, shared with synchronous requests.
+
+        Same as RateLimiter.get_global_limiter().
+
+        Args:
+            calls_per_second: Rate limit to use if creating a new limiter
+            burst: Burst capacity to use if creating a new limiter
+
+        Returns:
+            The global RateLimiter instance
+        """
+        return RateLimiter.get_global_limiter(calls_per_second, burst)
+
+    @classmethod
+    def set_global_limiter(cls, limiter: RateLimiter) -> None:
+        """
+        Replace the global rate limiter used by all requests, sync and async.
+
+        Same as RateLimiter.set_global_limiter().
+
+        Args:
+            limiter: The limiter to use
+        """
+        RateLimiter.set_global_limiter(limiter)
+
+    @classmethod
+    def reset_global_limiter(cls) -> None:
+        """Reset the global rate limiter (same as RateLimiter.reset_global_limiter())."""
+        RateLimiter.reset_global_limiter()
+
+    async def wait(self) -> None:  # type: ignore[override]
+        """
+        Wait until the rate limit allows the next call.
+
+        Example:
+            limiter = AsyncRateLimiter(calls_per_second=10)
+            await limiter.wait()
+            await make_api_call()
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
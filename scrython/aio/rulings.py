@@ -0,0 +1,39 @@
+"""Async ruling endpoints. See scrython.rulings for full documentation of each endpoint."""
+
+from ..rulings.rulings import Object
+from .base import AsyncScryfallListMixin, AsyncScrythonRequestHandler
+
+
+class ById(AsyncScryfallListMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.rulings.ById`."""
+
+    _endpoint = "/cards/:id/rulings"
+    list_data_type = Object
+
+
+class ByMultiverseId(AsyncScryfallListMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.rulings.ByMultiverseId`."""
+
+    _endpoint = "/cards/multiverse/:id/rulings"
+    list_data_type = Object
+
+
+class ByMTGOId(AsyncScryfallListMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.rulings.ByMTGOId`."""
+
+    _endpoint = "/cards/mtgo/:id/rulings"
+    list_data_type = Object
+
+
+class ByArenaId(AsyncScryfallListMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.rulings.ByArenaId`."""
+
+    _endpoint = "/cards/arena/:id/rulings"
+    list_data_type = Object
+
+
+class ByCodeNumber(AsyncScryfallListMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.rulings.ByCodeNumber`."""
+
+    _endpoint = "/cards/:code/:number/rulings"
+    list_data_type = Object
@@ -0,0 +1,30 @@
+"""Async set endpoints. See scrython.sets for full documentation of each endpoint."""
+
+from ..sets.sets import Object
+from ..sets.sets_mixins import SetsObjectMixin
+from .base import AsyncScryfallListMixin, AsyncScrythonRequestHandler
+
+
+class All(AsyncScryfallListMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.sets.All`."""
+
+    _endpoint = "/sets"
+    list_data_type = Object
+
+
+class ByCode(SetsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.sets.ByCode`."""
+
+    _endpoint = "/sets/:code"
+
+
+class ByTCGPlayerId(SetsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.sets.ByTCGPlayerId`."""
+
+    _endpoint = "/sets/tcgplayer/:id"
+
+
+class ById(SetsObjectMixin, AsyncScrythonRequestHandler):
+    """Async counterpart of :class:`scrython.sets.ById`."""
+
+    _endpoint = "/sets/:id"
@@ -0,0 +1,399 @@
+"""Asyncio HTTP transport for Scryfall API requests.
+
+A minimal HTTP/1.1 client built on ``asyncio`` streams, so that thousands of
+concurrent lookups can share one event loop without a thread per request.
+Like ``scrython.transport``, connections are kept alive and reused per host.
+
+Only the features Scrython needs are implemented: GET/POST with a bytes
+body, Content-Length and chunked response bodies, redirects, and
+``urllib.error.HTTPError`` for non-2xx responses. Proxies are not supported.
+"""
+
+import asyncio
+import email.parser
+import http.client
+import io
+import os
+import time
+import urllib.error
+import urllib.parse
+import weakref
+from typing import Any
+
+from ..transport import create_ssl_context
+
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 10
+
+PoolKey = tuple[str, str, int]
+_Streams = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class _StaleConnection(Exception):
+    """Raised when a reused connection was closed by the server while idle."""
+
+
+# Failures on a reused connection that mean the server dropped it: retried
+# once on a fresh connection (OSError covers resets and dead TLS sockets)
+_STALE_CONNECTION_ERRORS = (_StaleConnection, asyncio.IncompleteReadError, OSError)
+
+
+class AsyncResponse:
+    """
+    A fully read HTTP response.
+
+    Provides the same accessors as the synchronous responses used by
+    ScrythonRequestHandler: ``status``, ``headers``, ``info()`` and ``read()``.
+    """
+
+    def __init__(
+        self, url: str, status: int, reason: str, headers: http.client.HTTPMessage, body: bytes
+    ) -> None:
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    def info(self) -> http.client.HTTPMessage:
+        return self.headers
+
+    def read(self) -> bytes:
+        return self.body
+
+
+class AsyncConnectionPool:
+    """
+    Pool of keep-alive asyncio stream connections keyed by host.
+
+    A pool is bound to the event loop it is first used on, because asyncio
+    streams cannot be shared between loops. Use get_global_async_pool() to
+    get the pool for the running loop. Like ConnectionPool, a pool used in a
+    forked child drops the idle connections it inherited without closing them.
+
+    Example:
+        pool = AsyncConnectionPool()
+        response = await pool.request('GET', 'https://api.scryfall.com/sets/lea')
+        data = json.loads(response.read())
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        idle_timeout: float = 30.0,
+        timeout: float | None = None,
+    ) -> None:
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_connections_per_host: Maximum number of idle connections kept
+                                      per host. Default: 10.
+            idle_timeout: Seconds an idle connection may be reused. Default: 30.0.
+            timeout: Overall timeout in seconds for a single request, or None
+                     for no timeout.
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.ssl_context = create_ssl_context()
+        self._idle: dict[PoolKey, list[tuple[_Streams, float]]] = {}
+        self._pid = os.getpid()
+
+    def _check_pid(self) -> None:
+        """Forget connections inherited from the parent process after a fork."""
+        if self._pid != os.getpid():
+            self._idle = {}
+            self._pid = os.getpid()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncResponse:
+        """
+        Send a request and read the full response, following redirects.
+
+        Args:
+            method: HTTP method ('GET' or 'POST')
+            url: Absolute URL
+            body: Optional request body
+            headers: Optional request headers
+
+        Returns:
+            AsyncResponse for the final response
+
+        Raises:
+            urllib.error.HTTPError: On non-2xx responses
+            urllib.error.URLError: On connection failures
+        """
+        headers = dict(headers or {})
+
+        for _ in range(_MAX_REDIRECTS + 1):
+            if self.timeout is not None:
+                response = await asyncio.wait_for(
+                    self._send(method, url, body, headers), self.timeout
+                )
+            else:
+                response = await self._send(method, url, body, headers)
+
+            location = response.headers.get("Location")
+            if response.status in _REDIRECT_CODES and location:
+                url = urllib.parse.urljoin(url, location)
+                if response.status == 303 or (
+                    response.status in (301, 302) and method not in ("GET", "HEAD")
+                ):
+                    method = "GET"
+                    body = None
+                    headers = {
+                        k: v
+                        for k, v in headers.items()
+                        if k.lower() not in ("content-type", "content-length")
+                    }
+                continue
+
+            if not 200 <= response.status < 300:
+                raise urllib.error.HTTPError(
+                    url,
+                    response.status,
+                    response.reason,
+                    response.headers,
+                    io.BytesIO(response.body),
+                )
+
+            return response
+
+        raise urllib.error.HTTPError(
+            url, response.status, "Too many redirects", response.headers, io.BytesIO(b"")
+        )
+
+    async def _send(
+        self, method: str, url: str, body: bytes | None, headers: dict[str, str]
+    ) -> AsyncResponse:
+        """Send one request, retrying once on a fresh connection if a pooled one went stale."""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise urllib.error.URLError(f"unsupported URL scheme: {scheme!r}")
+
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        key: PoolKey = (scheme, host, port)
+
+        selector = parts.path or "/"
+        if parts.query:
+            selector = f"{selector}?{parts.query}"
+
+        request = self._encode_request(method, selector, host, port, scheme, body, headers)
+
+        streams = self._acquire(key)
+        if streams is not None:
+            try:
+                return await self._exchange(key, streams, method, url, request)
+            except _STALE_CONNECTION_ERRORS:
+                # The server closed the idle connection; fall through to a new one
+                pass
+
+        try:
+            streams = await asyncio.open_connection(
+                host,
+                port,
+                ssl=self.ssl_context if scheme == "https" else None,
+                server_hostname=host if scheme == "https" else None,
+            )
+            return await self._exchange(key, streams, method, url, request)
+        except (_StaleConnection, OSError, asyncio.IncompleteReadError) as exc:
+            raise urllib.error.URLError(exc) from exc
+
+    @staticmethod
+    def _encode_request(
+        method: str,
+        selector: str,
+        host: str,
+        port: int,
+        scheme: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> bytes:
+        """Serialize the request line, headers and body."""
+        default_port = 443 if scheme == "https" else 80
+        lines = [f"{method} {selector} HTTP/1.1"]
+
+        header_names = {name.lower() for name in headers}
+        if "host" not in header_names:
+            lines.append(f"Host: {host}" if port == default_port else f"Host: {host}:{port}")
+        if "accept-encoding" not in header_names:
+            lines.append("Accept-Encoding: identity")
+        if body is not None:
+            lines.append(f"Content-Length: {len(body)}")
+
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        return head + (body or b"")
+
+    async def _exchange(
+        self, key: PoolKey, streams: _Streams, method: str, url: str, request: bytes
+    ) -> AsyncResponse:
+        """Write a request on streams and read back the complete response."""
+        reader, writer = streams
+        try:
+            writer.write(request)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            if not status_line:
+                raise _StaleConnection()
+
+            version, status, reason = self._parse_status_line(status_line)
+
+            header_lines = []
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                header_lines.append(line.decode("latin-1"))
+
+            headers = email.parser.Parser(_class=http.client.HTTPMessage).parsestr(
+                "".join(header_lines)
+            )
+
+            keep_alive = version == "HTTP/1.1" and (
+                headers.get("Connection", "").lower() != "close"
+            )
+            body = await self._read_body(reader, headers, method, status)
+            if body is None:
+                # Body delimited by connection close
+                body = await reader.read()
+                keep_alive = False
+        except BaseException:
+            writer.close()
+            raise
+
+        if keep_alive:
+            self._release(key, streams)
+        else:
+            writer.close()
+
+        return AsyncResponse(url, status, reason, headers, body)
+
+    @staticmethod
+    def _parse_status_line(line: bytes) -> tuple[str, int, str]:
+        """Parse 'HTTP/1.1 200 OK' into its parts."""
+        try:
+            version, status, *reason = line.decode("latin-1").strip().split(" ", 2)
+            return version, int(status), reason[0] if reason else ""
+        except ValueError as exc:
+            raise http.client.BadStatusLine(line.decode("latin-1", "replace")) from exc
+
+    @staticmethod
+    async def _read_body(
+        reader: asyncio.StreamReader, headers: Any, method: str, status: int
+    ) -> bytes | None:
+        """
+        Read a response body according to its framing headers.
+
+        Returns:
+            The body, or None if the body is delimited by connection close
+        """
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            return b""
+
+        if "chunked" in headers.get("Transfer-Encoding", "").lower():
+            chunks: list[bytes] = []
+            while True:
+                size_line = await reader.readline()
+                size = int(size_line.split(b";", 1)[0].strip(), 16)
+                if size == 0:
+                    # Skip optional trailers up to the terminating blank line
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+
+        content_length = headers.get("Content-Length")
+        if content_length is not None:
+            return await reader.readexactly(int(content_length))
+
+        return None
+
+    def _acquire(self, key: PoolKey) -> _Streams | None:
+        """Pop a fresh idle connection for key, discarding expired ones."""
+        self._check_pid()
+        now = time.monotonic()
+        idle = self._idle.get(key, [])
+        while idle:
+            streams, last_used = idle.pop()
+            if now - last_used <= self.idle_timeout and not streams[0].at_eof():
+                return streams
+            streams[1].close()
+        return None
+
+    def _release(self, key: PoolKey, streams: _Streams) -> None:
+        """Return a connection to the pool, or close it if the pool is full."""
+        self._check_pid()
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.max_connections_per_host:
+            idle.append((streams, time.monotonic()))
+        else:
+            streams[1].close()
+
+    def idle_count(self) -> int:
+        """
+        Get the number of idle connections currently held by the pool.
+
+        Returns:
+            Number of idle connections across all hosts
+        """
+        self._check_pid()
+        return sum(len(idle) for idle in self._idle.values())
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        self._check_pid()
+        for idle in self._idle.values():
+            for (_, writer), _ in idle:
+                writer.close()
+        self._idle.clear()
+
+
+# One pool per event loop, since asyncio streams are bound to their loop
+_global_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncConnectionPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_global_async_pool() -> AsyncConnectionPool:
+    """
+    Get or create the connection pool for the running event loop.
+
+    Returns:
+        The AsyncConnectionPool bound to the current event loop
+    """
+    loop = asyncio.get_running_loop()
+    pool = _global_pools.get(loop)
+    if pool is None:
+        pool = _global_pools[loop] = AsyncConnectionPool()
+    return pool
+
+
+def reset_global_async_pools() -> None:
+    """
+    Drop all per-loop pools.
+
+    Useful for testing to ensure a clean state between tests.
+    """
+    for pool in list(_global_pools.values()):
+        pool.clear()
+    _global_pools.clear()
+
+
+def _reset_after_fork() -> None:
+    """Drop the parent's per-loop pools in a forked child without closing their sockets."""
+    _global_pools.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
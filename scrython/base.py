@@ -1,12 +1,64 @@
 import json
+import threading
+import time
 import types
 import urllib.error
 import urllib.parse
 from typing import Any
-from urllib.request import Request, urlopen
+from urllib.request import Request
+
+from .cache import CacheEntry, generate_cache_key, get_global_cache
+from .cache_policy import TTLPolicy
+from .entity_cache import get_global_entity_cache
+from .rate_limiter import EndpointRateLimiters, RateLimiter
+from .retry import THROTTLE_STATUSES, RetryPolicy, is_transient_error, retry_after_from
+from .singleflight import get_global_single_flight
+from .transport import urlopen
+
+# Cache keys with a background revalidation running
+_revalidating: set[str] = set()
+_revalidating_lock = threading.Lock()
+
+# Response headers stored with cache entries, and the request headers that
+# send them back to revalidate an entry
+_VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+# Keyword arguments that configure the client rather than the request: kept
+# out of the query string and the cache key
+CLIENT_OPTIONS = frozenset(
+    {
+        "cache",
+        "cache_ttl",
+        "rate_limit",
+        "rate_limit_per_second",
+        "retry",
+        "retry_policy",
+        "single_flight",
+        "entity_cache",
+        "stale_while_revalidate",
+        "stale_if_error",
+        "coalesce",
+        "max_workers",
+    }
+)
+
+
+def _response_validators(headers: Any) -> dict[str, str] | None:
+    """
+    Get the validator headers (ETag, Last-Modified) of a response.
+
+    Args:
+        headers: The response's headers (an email.message.Message)
 
-from .cache import generate_cache_key, get_global_cache
-from .rate_limiter import RateLimiter
+    Returns:
+        Dict of validator headers, or None if the response has none
+    """
+    validators = {}
+    for name in _VALIDATOR_HEADERS:
+        value = headers.get(name) if headers is not None else None
+        if isinstance(value, str):
+            validators[name] = value
+    return validators or None
 
 
 class ScryfallError(Exception):
@@ -58,6 +110,9 @@ class ScrythonRequestHandler:
     _accept: str = "application/json"
     _content_type: str = "application/json"
     _endpoint: str = ""
+    # Card identifier fields answered from the entity cache, mapped to kwargs
+    _entity_identifier: dict[str, str] = {}
+    _entity_identifier_optional: dict[str, str] = {}
 
     @classmethod
     def set_user_agent(cls, user_agent: str) -> None:
@@ -130,16 +185,33 @@ class ScrythonRequestHandler:
 
         This method handles rate limiting, caching, and HTTP request execution
         for any URL (including pagination URLs). It's used by both _fetch() for
-        endpoint-based requests and iter_all() for pagination.
+        endpoint-based requests and iter_all() for pagination. Requests are sent
+        over the pooled keep-alive connections from scrython.transport, so
+        consecutive calls reuse the same TLS session.
 
         Args:
             url: Full absolute URL to fetch
             cache_key: Optional cache key to use (if not provided, caching is skipped)
             **kwargs: Optional parameters:
-                - cache (bool): Enable caching (default: False)
-                - cache_ttl (int): Cache TTL in seconds (default: 3600)
+                - cache (bool): Enable (True) or disable (False) caching
+                  (default: as decided by the global TTLPolicy, which caches
+                  catalogs, sets, symbology and migrations)
+                - cache_ttl (int): Cache TTL in seconds (default: the
+                  TTLPolicy rule's TTL, or 3600)
                 - rate_limit (bool): Enable rate limiting (default: True)
                 - rate_limit_per_second (float): Rate limit (default: 10.0)
+                - retry (bool): Retry 429, 5xx and connection errors (default: True)
+                - retry_policy (RetryPolicy): Policy to use instead of the global one
+                - single_flight (bool): Share one request between concurrent
+                  identical calls (default: True)
+                - entity_cache (bool): Index cached cards by all of their
+                  identifiers (default: True, only applies with cache=True)
+                - stale_while_revalidate (float): Seconds past expiry a cached
+                  response may be returned while it is refreshed in the
+                  background (default: 0)
+                - stale_if_error (float): Seconds past expiry a cached response
+                  may be returned when the request fails with a 429, 5xx or
+                  connection error (default: 0)
                 - data (dict): POST data (optional)
 
         Returns:
@@ -148,59 +220,278 @@ class ScrythonRequestHandler:
         Raises:
             Exception: On HTTP errors or request failures
         """
-        # Caching (disabled by default, requires cache_key)
-        use_cache = kwargs.get("cache", False)
-        cache_ttl = kwargs.get("cache_ttl", 3600)  # Default 1 hour
+        # Caching (as decided by the TTL policy, requires cache_key)
+        cache_ttl = TTLPolicy.get_global_policy().ttl_for(self, url, **kwargs)
+        kwargs = {**kwargs, "cache": cache_ttl is not None, "cache_ttl": cache_ttl}
+        use_cache = kwargs["cache"]
+        stale_while_revalidate = kwargs.get("stale_while_revalidate", 0)
+        stale_if_error = kwargs.get("stale_if_error", 0)
+        entry: CacheEntry | None = None
 
         # Check cache first if enabled and cache_key provided
         if use_cache and cache_key is not None:
-            cache = get_global_cache()
-            cached_data = cache.get(cache_key)
+            # Expired entries may still be served stale, or revalidated
+            entry = self._lookup_cache(cache_key)
+            if entry is not None:
+                stale_for = entry.stale_for()
+                if stale_for < 0:
+                    # Cache hit - return cached data
+                    return entry.data
+                if stale_for <= stale_while_revalidate:
+                    self._revalidate(url, cache_key, entry, **kwargs)
+                    return entry.data
+
+        try:
+            return self._shared_request(url, cache_key, entry, **kwargs)
+        except Exception as exc:
+            # Fall back to the stale entry while Scryfall is unavailable
+            if (
+                entry is not None
+                and entry.stale_for() <= stale_if_error
+                and is_transient_error(exc)
+            ):
+                return entry.data
+            raise
+
+    def _lookup_cache(self, cache_key: str) -> CacheEntry | None:
+        """
+        Look up a cached response, counting the outcome under this endpoint.
+
+        Args:
+            cache_key: Cache key of the request
+
+        Returns:
+            The cached entry (possibly expired but kept for serving stale), or None
+        """
+        cache = get_global_cache()
+        entry = cache.get_entry(cache_key)
+
+        if entry is None:
+            outcome = "misses"
+        elif entry.stale_for() < 0:
+            outcome = "hits"
+        else:
+            outcome = "stale_hits"
+        cache.stats.record_lookup(type(self)._endpoint.strip("/"), outcome)
+        return entry
+
+    def _shared_request(
+        self,
+        url: str,
+        cache_key: str | None = None,
+        cached: CacheEntry | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Send a request, sharing it with concurrent identical calls if enabled.
+
+        Args:
+            url: Full absolute URL to fetch
+            cache_key: Optional cache key identifying identical calls
+            cached: Expired cache entry to revalidate, if any
+            **kwargs: Optional parameters (see _fetch_raw())
+
+        Returns:
+            dict: Parsed JSON response from Scryfall API
+        """
+        # Share one request between concurrent identical calls (enabled by default),
+        # unless every call should get its own response (e.g. cards/random)
+        if (
+            kwargs.get("single_flight", True)
+            and cache_key is not None
+            and TTLPolicy.get_global_policy().shareable(self, url)
+        ):
+            return get_global_single_flight().do(
+                cache_key, lambda: self._request(url, cache_key, cached, **kwargs)
+            )
+
+        return self._request(url, cache_key, cached, **kwargs)
+
+    def _revalidate(self, url: str, cache_key: str, cached: CacheEntry, **kwargs: Any) -> None:
+        """
+        Refresh a cached response in a background thread.
 
-            if cached_data is not None:
-                # Cache hit - return cached data
-                return cached_data
+        At most one refresh runs per cache key; a failed refresh leaves the
+        stale entry in place for the next caller to retry.
+
+        Args:
+            url: Full absolute URL to fetch
+            cache_key: Cache key to refresh
+            cached: The expired cache entry
+            **kwargs: Optional parameters (see _fetch_raw())
+        """
+        with _revalidating_lock:
+            if cache_key in _revalidating:
+                return
+            _revalidating.add(cache_key)
+
+        def refresh() -> None:
+            try:
+                self._shared_request(url, cache_key, cached, **kwargs)
+            except Exception:
+                pass
+            finally:
+                with _revalidating_lock:
+                    _revalidating.discard(cache_key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _request(
+        self,
+        url: str,
+        cache_key: str | None = None,
+        cached: CacheEntry | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Send a request to url, with rate limiting and retries, and cache the result.
+
+        If an expired cache entry with validators is given, the request is
+        conditional, and a 304 Not Modified response refreshes the entry
+        instead of downloading it again.
+
+        Args:
+            url: Full absolute URL to fetch
+            cache_key: Optional cache key to store the response under
+            cached: Expired cache entry to revalidate, if any
+            **kwargs: Optional parameters (see _fetch_raw())
+
+        Returns:
+            dict: Parsed JSON response from Scryfall API
+        """
+        use_cache = kwargs.get("cache", False)
+        cache_ttl = kwargs.get("cache_ttl", 3600)  # Default 1 hour
 
         # Rate limiting (enabled by default)
         rate_limit = kwargs.get("rate_limit", True)
 
-        if rate_limit:
-            # Get rate limit setting
-            rate_limit_per_second = kwargs.get("rate_limit_per_second", 10.0)
+        # Retries (enabled by default)
+        retry = kwargs.get("retry", True)
+        policy = kwargs.get("retry_policy") or RetryPolicy.get_global_policy()
+        if retry:
+            policy.budget.record_request()
+
+        # Create and configure HTTP request
+        request = self._build_request(url, **kwargs)
+        if cached is not None and cached.validators:
+            for name, value in cached.validators.items():
+                request.add_header(_VALIDATOR_HEADERS[name], value)
+
+        attempt = 0
+        while True:
+            limiter = self._wait_for_rate_limit(url, **kwargs) if rate_limit else None
+
+            # Execute HTTP request
+            try:
+                with urlopen(request) as response:
+                    charset = response.info().get_param("charset") or "utf-8"
+                    decoded = response.read().decode(charset)  # type: ignore[arg-type]
+
+                    response_data = json.loads(decoded)
+                    validators = _response_validators(response.info()) if use_cache else None
+            except (urllib.error.HTTPError, urllib.error.URLError) as exc:
+                # Not Modified: the cached body is still current
+                if (
+                    cached is not None
+                    and isinstance(exc, urllib.error.HTTPError)
+                    and exc.code == 304
+                ):
+                    response_data = cached.data
+                    validators = {
+                        **(cached.validators or {}),
+                        **(_response_validators(exc.headers) or {}),
+                    }
+                    break
+
+                retry_after = retry_after_from(exc)
+
+                # Slow the shared limiter down after throttling responses
+                if (
+                    limiter is not None
+                    and isinstance(exc, urllib.error.HTTPError)
+                    and exc.code in THROTTLE_STATUSES
+                ):
+                    limiter.penalize(retry_after)
+
+                if retry and policy.should_retry(exc, attempt):
+                    time.sleep(policy.delay(attempt, retry_after))
+                    attempt += 1
+                    continue
+
+                if isinstance(exc, urllib.error.HTTPError):
+                    raise Exception(f"{exc}: {request.get_full_url()}") from exc
+                raise
+
+            break
+
+        if limiter is not None:
+            limiter.recover()
+
+        TTLPolicy.get_global_policy().record_bulk_update(response_data)
+
+        # Store in cache if enabled and cache_key provided
+        if use_cache and cache_key is not None and response_data.get("object") != "error":
+            cache = get_global_cache()
+            cache.set_entry(cache_key, response_data, cache_ttl, validators)
+
+        # Index the cards in the response for lookups by any identifier
+        if use_cache and kwargs.get("entity_cache", True):
+            get_global_entity_cache().add_response(
+                response_data, cache_ttl, by_name=self._entity_by_name(**kwargs)
+            )
+
+        return response_data
 
-            # Get or create global rate limiter
-            limiter = RateLimiter.get_global_limiter(rate_limit_per_second)
+    def _wait_for_rate_limit(self, url: str, **kwargs: Any) -> RateLimiter:
+        """
+        Wait until the rate limiters allow a request to url.
+
+        Args:
+            url: Full absolute URL about to be requested
+            **kwargs: Optional parameters:
+                - rate_limit_per_second (float): Rate limit (default: 10.0)
+
+        Returns:
+            The global RateLimiter that was waited on
+        """
+        # Wait for the endpoint family's own budget first (if enabled), so
+        # the global limiter stays the last gate before the request is sent
+        endpoint_limiters = EndpointRateLimiters.get_global_limiter()
+        if endpoint_limiters is not None:
+            endpoint_limiters.wait(urllib.parse.urlsplit(url).path)
 
-            # Wait if necessary to respect rate limit
-            limiter.wait()
+        # Get rate limit setting
+        rate_limit_per_second = kwargs.get("rate_limit_per_second", 10.0)
 
+        # Get or create global rate limiter
+        limiter = RateLimiter.get_global_limiter(rate_limit_per_second)
+
+        # Wait if necessary to respect rate limit
+        limiter.wait()
+        return limiter
+
+    def _build_request(self, url: str, **kwargs: Any) -> Request:
+        """
+        Create the HTTP request for url with Scryfall's required headers.
+
+        Args:
+            url: Full absolute URL to request
+            **kwargs: Optional parameters:
+                - data (dict): POST data, sent as a JSON body (optional)
+
+        Returns:
+            Configured urllib Request (POST if data was given, otherwise GET)
+        """
         # Prepare POST data if provided
         data: bytes | None = None
         if data_param := kwargs.get("data"):
             data = json.dumps(data_param).encode("utf-8")
 
-        # Create and configure HTTP request
         request = Request(url, data=data)
         request.add_header("User-Agent", self._user_agent)
         request.add_header("Accept", self._accept)
         request.add_header("Content-Type", self._content_type)
-
-        # Execute HTTP request
-        try:
-            with urlopen(request) as response:
-                charset = response.info().get_param("charset") or "utf-8"
-                decoded = response.read().decode(charset)
-
-                response_data = json.loads(decoded)
-
-                # Store in cache if enabled and cache_key provided
-                if use_cache and cache_key is not None and response_data.get("object") != "error":
-                    cache = get_global_cache()
-                    cache.set(cache_key, response_data, cache_ttl)
-
-                return response_data
-        except urllib.error.HTTPError as exc:
-            raise Exception(f"{exc}: {request.get_full_url()}") from exc
+        return request
 
     def _fetch(self, **kwargs: Any) -> None:
         """
@@ -212,6 +503,14 @@ class ScrythonRequestHandler:
         Args:
             **kwargs: Optional parameters passed to _fetch_raw()
         """
+        # Answer single-card lookups from cards already seen, if possible
+        card = self._entity_lookup(**kwargs)
+        if card is not None:
+            self._scryfall_data = card
+            if hasattr(self, "_scryfall_namespace"):
+                delattr(self, "_scryfall_namespace")
+            return
+
         # Build full URL from endpoint template and query parameters
         url = f"https://api.scryfall.com/{self.endpoint}?{self._encoded_query_params}"
 
@@ -225,13 +524,65 @@ class ScrythonRequestHandler:
         if hasattr(self, "_scryfall_namespace"):
             delattr(self, "_scryfall_namespace")
 
+    def _entity_lookup(self, **kwargs: Any) -> dict[str, Any] | None:
+        """
+        Look this request's card up in the entity cache.
+
+        Only applies to cached JSON requests (see TTLPolicy) on endpoints that
+        declare ``_entity_identifier``.
+
+        Args:
+            **kwargs: The request's parameters
+
+        Returns:
+            The card object dict if already held, None otherwise
+        """
+        if (
+            not self._entity_identifier
+            or not kwargs.get("entity_cache", True)
+            or kwargs.get("format", "json") != "json"
+            or kwargs.get("face")
+            or kwargs.get("version")
+            or TTLPolicy.get_global_policy().ttl_for(self, self.endpoint, **kwargs) is None
+        ):
+            return None
+
+        identifier = {}
+        for field, kwarg in self._entity_identifier.items():
+            if kwargs.get(kwarg) is None:
+                return None
+            identifier[field] = kwargs[kwarg]
+
+        for field, kwarg in self._entity_identifier_optional.items():
+            if kwargs.get(kwarg) is not None:
+                identifier[field] = kwargs[kwarg]
+
+        return get_global_entity_cache().get(**identifier)
+
+    def _entity_by_name(self, **kwargs: Any) -> bool:
+        """
+        Whether this request's card may be indexed by name + set.
+
+        Only a lookup by exact name and set says which printing Scryfall picks
+        for that pair; any other response may be one of several printings.
+
+        Args:
+            **kwargs: The request's parameters
+
+        Returns:
+            True for name + set lookups with every identifier given
+        """
+        return "name" in self._entity_identifier and all(
+            kwargs.get(kwarg) is not None for kwarg in self._entity_identifier.values()
+        )
+
     def _build_params(self, **kwargs: Any) -> None:
         self._query_params: dict[str, Any] = {
             "format": kwargs.get("format", "json"),
             "face": kwargs.get("face", ""),
             "version": kwargs.get("version", ""),
             "pretty": kwargs.get("pretty", ""),
-            **kwargs,
+            **{key: value for key, value in kwargs.items() if key not in CLIENT_OPTIONS},
         }
 
         self._encoded_query_params: str = urllib.parse.urlencode(self._query_params)
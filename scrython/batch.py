@@ -0,0 +1,82 @@
+"""Concurrent batch fetching for Scryfall API requests.
+
+Issuing hundreds of independent lookups one after another costs a full
+network round trip per item, so throughput is limited to 1 / latency rather
+than the allowed request rate. fetch_many() runs the lookups on a thread pool
+so that requests stay in flight back-to-back. Every request still goes
+through ScrythonRequestHandler._fetch_raw(), so the global RateLimiter and
+cache apply exactly as they do for serial calls.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+BatchRequest = Callable[[], Any] | tuple[Callable[..., Any], Mapping[str, Any]]
+
+
+def _call(request: BatchRequest) -> Any:
+    """Execute a single batch request."""
+    if isinstance(request, tuple):
+        handler_class, kwargs = request
+        return handler_class(**kwargs)
+    return request()
+
+
+def fetch_many(
+    requests: Iterable[BatchRequest],
+    max_workers: int = 8,
+    return_exceptions: bool = True,
+) -> list[Any]:
+    """
+    Run many request-handler constructions concurrently.
+
+    Each request is either a ``(HandlerClass, kwargs)`` tuple or a zero-argument
+    callable (e.g. ``functools.partial(scrython.cards.ById, id=...)``). Results
+    are returned in the same order as the requests.
+
+    Args:
+        requests: Iterable of (class, kwargs) tuples or zero-argument callables
+        max_workers: Maximum number of requests in flight at once. Default: 8.
+        return_exceptions: If True (default), a failed request puts its
+                           exception in the result list instead of raising.
+                           If False, the first failure (in request order) is
+                           raised once all requests have finished.
+
+    Returns:
+        List of handler objects (or exceptions), in request order
+
+    Example:
+        from scrython import fetch_many
+        from scrython.cards import ById
+
+        results = fetch_many([(ById, {'id': card_id}) for card_id in card_ids])
+        for card_id, result in zip(card_ids, results):
+            if isinstance(result, Exception):
+                print(f"{card_id}: {result}")
+            else:
+                print(result.name)
+    """
+    requests = list(requests)
+    if not requests:
+        return []
+
+    results: list[Any] = [None] * len(requests)
+    failed: list[bool] = [False] * len(requests)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+        futures = [executor.submit(_call, request) for request in requests]
+
+        for index, future in enumerate(futures):
+            try:
+                results[index] = future.result()
+            except Exception as exc:
+                results[index] = exc
+                failed[index] = True
+
+    if not return_exceptions:
+        for index, is_failed in enumerate(failed):
+            if is_failed:
+                raise results[index]
+
+    return results
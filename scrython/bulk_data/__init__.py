@@ -1,3 +1,4 @@
 from .bulk_data import All, ById, ByType, Object
+from .store import BulkStore
 
-__all__ = ["Object", "All", "ById", "ByType"]
+__all__ = ["Object", "All", "ById", "ByType", "BulkStore"]
@@ -1,7 +1,186 @@
-import gzip
+import contextlib
 import json
+import os
+import tempfile
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from typing import Any
-from urllib.request import urlopen
+
+from ..cards.cards import Object as CardObject
+from ..rulings.rulings import Object as RulingObject
+from ..transport import urlopen
+from .json_stream import iter_array
+
+# Read size for streaming downloads: memory use stays around this much
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Wrapper classes for the objects in bulk files, by their "object" field
+OBJECT_TYPES: dict[str, type] = {"card": CardObject, "ruling": RulingObject}
+
+# Filter for bulk objects: a predicate on the raw dict, or a {path: value} spec
+Where = Callable[[dict[str, Any]], bool] | Mapping[str, Any]
+
+_MISSING = object()
+
+
+def _require_tqdm() -> Any:
+    """Import tqdm for progress bars, explaining how to install it if missing."""
+    try:
+        from tqdm import tqdm
+    except ImportError as exc:
+        raise ImportError(
+            "tqdm is required for progress bars. "
+            "Install with: pip install scrython[progress] or pip install tqdm"
+        ) from exc
+    return tqdm
+
+
+def _projector(fields: Iterable[str] | None) -> Any:
+    """
+    Build a function keeping only the given top-level fields of each object.
+
+    Non-dict elements pass through unchanged, and missing fields are left out.
+    Returns None if fields is None (keep everything).
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        raise TypeError("fields must be a list of field names, not a string")
+    keep = tuple(dict.fromkeys(fields))
+
+    def project(item: Any) -> Any:
+        if not isinstance(item, dict):
+            return item
+        return {name: item[name] for name in keep if name in item}
+
+    return project
+
+
+def _get_path(item: Any, path: list[str]) -> Any:
+    """Follow a split dotted path through nested dicts, or return _MISSING."""
+    for name in path:
+        if not isinstance(item, dict) or name not in item:
+            return _MISSING
+        item = item[name]
+    return item
+
+
+def _matches(actual: Any, expected: Any) -> bool:
+    """Compare a field to a where-spec value (see _predicate)."""
+    if isinstance(expected, list | tuple | set | frozenset):
+        if isinstance(actual, list):
+            return any(value in expected for value in actual)
+        return actual in expected
+    if isinstance(actual, list):
+        return expected in actual
+    return bool(actual == expected)
+
+
+def _predicate(where: Where | None) -> Callable[[Any], bool] | None:
+    """
+    Build the filter function for a where argument.
+
+    A callable is used as is. A mapping of dotted field paths to values
+    matches objects where every path is present and its field equals the
+    value; a list, tuple or set of values matches any of them, and a field
+    that is itself a list matches if any of its elements does. For example,
+    {'lang': 'en', 'games': 'paper', 'set': ['neo', 'snc'],
+    'legalities.modern': 'legal'}.
+
+    Returns None if where is None (keep everything).
+    """
+    if where is None:
+        return None
+    if callable(where):
+        return where
+    if not isinstance(where, Mapping):
+        raise TypeError("where must be a callable or a mapping of field paths to values")
+    conditions = [(path.split("."), expected) for path, expected in where.items()]
+
+    def predicate(item: Any) -> bool:
+        for path, expected in conditions:
+            actual = _get_path(item, path)
+            if actual is _MISSING or not _matches(actual, expected):
+                return False
+        return True
+
+    return predicate
+
+
+def _select(
+    items: Iterable[Any],
+    where: Where | None = None,
+    fields: Iterable[str] | None = None,
+    wrap: bool = False,
+) -> Iterator[Any]:
+    """
+    Filter, project and wrap parsed bulk objects, in that order.
+
+    Filtering sees the whole object, so it can test fields that projection
+    drops, and rejected objects are never projected or wrapped.
+    """
+    keep = _predicate(where)
+    project = _projector(fields)
+    for item in items:
+        if keep is not None and not keep(item):
+            continue
+        object_type = None
+        if wrap and isinstance(item, dict):
+            object_type = OBJECT_TYPES.get(item.get("object", ""))
+        if project is not None:
+            item = project(item)
+        if object_type is not None:
+            item = object_type(item)
+        yield item
+
+
+def _iter_body(response: Any, chunk_size: int, progress_bar: Any = None) -> Iterator[bytes]:
+    """
+    Stream a bulk-data response body, gunzipping it incrementally if needed.
+
+    Each read takes at most chunk_size bytes from the network, and each
+    yielded chunk holds at most chunk_size decompressed bytes, so memory use
+    doesn't grow with the size of the file.
+
+    Args:
+        response: The open HTTP response
+        chunk_size: Maximum bytes per read and per yielded chunk
+        progress_bar: Optional tqdm bar updated with the bytes downloaded
+
+    Yields:
+        Chunks of the (decompressed) file
+
+    Raises:
+        zlib.error: If the response claims to be gzip but isn't
+        EOFError: If the gzip stream is truncated
+    """
+    gzipped = response.info().get("Content-Encoding", "").lower() == "gzip"
+    # wbits=MAX_WBITS | 16 expects a gzip header and trailer
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16) if gzipped else None
+
+    while True:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            break
+        if progress_bar is not None:
+            progress_bar.update(len(chunk))
+
+        if decompressor is None:
+            yield chunk
+            continue
+
+        # Bound each output chunk, carrying input over until it's consumed
+        data = decompressor.decompress(chunk, chunk_size)
+        while data:
+            yield data
+            data = decompressor.decompress(decompressor.unconsumed_tail, chunk_size)
+
+    if decompressor is not None:
+        data = decompressor.flush()
+        if data:
+            yield data
+        if not decompressor.eof:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
 
 
 class BulkDataObjectMixin:
@@ -117,6 +296,8 @@ class BulkDataObjectMixin:
         return_data: bool = True,
         chunk_size: int = 8192,
         progress: bool = False,
+        fields: Iterable[str] | None = None,
+        where: Where | None = None,
     ) -> list[dict[str, Any]] | None:
         """
         Download and parse bulk data file from Scryfall.
@@ -126,15 +307,32 @@ class BulkDataObjectMixin:
         headers and handles decompression accordingly. The JSON data is then parsed
         and optionally saved to a file.
 
+        With a filepath, the file is streamed to disk with download_to() and
+        then parsed from there. Without one, the response is decompressed and
+        parsed as it streams in chunk_size pieces, so neither the compressed
+        nor the decompressed file is ever held in memory.
+
         Args:
-            filepath: Optional path to save the decompressed JSON file.
-                     If None, file is not saved to disk.
+            filepath: Optional path to save the decompressed JSON file (as
+                     served by Scryfall). If None, file is not saved to disk.
             return_data: If True, return parsed JSON data. If False and
                         filepath is provided, only saves file without returning data.
                         Default: True.
             chunk_size: Download chunk size in bytes. Default: 8192.
             progress: If True, display a progress bar during download (requires tqdm).
                      Default: False.
+            fields: Optional top-level fields to keep in each object, e.g.
+                   ['id', 'name', 'prices']. Objects are parsed one at a time and
+                   trimmed right away, so only the kept fields stay in memory
+                   (without a filepath, the response is parsed as it streams in
+                   chunk_size pieces). The saved file is not affected.
+                   Default: None (keep all).
+            where: Optional filter applied to each object as it's parsed, so
+                  only matching objects are kept: a function taking the object
+                  dict and returning a bool, or a dict of dotted field paths to
+                  required values (see iter_objects()). Without a filepath, the
+                  response is filtered as it streams in chunk_size pieces. The
+                  saved file is not affected. Default: None (keep all).
 
         Returns:
             List of card/set objects if return_data=True, otherwise None.
@@ -155,72 +353,211 @@ class BulkDataObjectMixin:
             >>> # With progress bar
             >>> cards = bulk.download(progress=True)
 
+            >>> # Only the fields you need
+            >>> cards = bulk.download(fields=['id', 'name', 'set', 'prices'])
+
+            >>> # Only the objects you need
+            >>> cards = bulk.download(where={'lang': 'en', 'games': 'paper'})
+
         Note:
             Bulk data files can be very large (100+ MB compressed, 500+ MB uncompressed).
-            Be mindful of memory usage when loading entire files into memory.
+            Be mindful of memory usage when loading entire files into memory; use
+            download_to(), or filepath with return_data=False, to save them without
+            loading them.
         """
         download_url = self.download_uri
 
-        # Optional progress bar
-        if progress:
-            try:
-                from tqdm import tqdm
-            except ImportError as exc:
-                raise ImportError(
-                    "tqdm is required for progress bars. "
-                    "Install with: pip install scrython[progress] or pip install tqdm"
-                ) from exc
-
-            # Download with progress bar
-            with urlopen(download_url) as response:
-                # Check actual HTTP Content-Encoding header
-                content_encoding = response.info().get("Content-Encoding", "").lower()
-
-                total_size = int(response.headers.get("Content-Length", 0))
-                pbar = tqdm(total=total_size, unit="B", unit_scale=True, desc="Downloading")
-
-                # Read in chunks
-                chunks = []
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    chunks.append(chunk)
-                    pbar.update(len(chunk))
-                pbar.close()
-
-                downloaded_data = b"".join(chunks)
-
-            # Conditionally decompress based on HTTP header
-            if content_encoding == "gzip":
-                with tqdm(
-                    total=len(downloaded_data), unit="B", unit_scale=True, desc="Decompressing"
-                ):
-                    data = gzip.decompress(downloaded_data)
-            else:
-                # Already decompressed or plain JSON
-                data = downloaded_data
-        else:
-            # Download without progress bar
+        if filepath:
+            self.download_to(filepath, chunk_size=chunk_size, progress=progress)
+            if not return_data:
+                return None
+            if fields is not None or where is not None:
+                return list(self.iter_objects(filepath, fields=fields, where=where))
+            with open(filepath, encoding="utf-8") as f:
+                parsed: list[dict[str, Any]] = json.load(f)
+            return parsed
+
+        # Gunzip and parse the body as it streams in, so only the parsed
+        # objects (or the selection) are held, never the file itself
+        tqdm = _require_tqdm() if progress else None
+        progress_bar = None
+        try:
             with urlopen(download_url) as response:
-                # Check actual HTTP Content-Encoding header
-                content_encoding = response.info().get("Content-Encoding", "").lower()
+                if tqdm is not None:
+                    total_size = int(response.headers.get("Content-Length", 0))
+                    progress_bar = tqdm(
+                        total=total_size, unit="B", unit_scale=True, desc="Downloading"
+                    )
+                items = iter_array(_iter_body(response, chunk_size, progress_bar))
+                selected = list(_select(items, where, fields))
+        finally:
+            if progress_bar is not None:
+                progress_bar.close()
+        return selected if return_data else None
+
+    def download_to(
+        self,
+        filepath: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        progress: bool = False,
+        hasher: Any = None,
+    ) -> int:
+        """
+        Stream the bulk data file to disk without loading it into memory.
 
-                if content_encoding == "gzip":
-                    # Decompress with streaming
-                    with gzip.GzipFile(fileobj=response) as gz_file:
-                        data = gz_file.read()
-                else:
-                    # Read plain JSON
-                    data = response.read()
+        The response is read in chunks of chunk_size bytes, gunzipped
+        incrementally if compressed, and written exactly as Scryfall serves
+        it, so memory use stays around chunk_size however large the file is.
+        The file is written to a temporary file in the same directory and
+        renamed over filepath once complete, so readers never see a partial
+        file and a failed download leaves any previous file in place.
 
-        # Parse JSON
-        parsed_data = json.loads(data.decode("utf-8"))
+        Args:
+            filepath: Path to save the decompressed JSON file to.
+            chunk_size: Read and write size in bytes. Default: 1 MiB.
+            progress: If True, display a progress bar during download (requires tqdm).
+                     Default: False.
+            hasher: Optional hashlib object (e.g. hashlib.sha256()) updated with
+                   the bytes written, to checksum the file without reading it
+                   back. Default: None.
 
-        # Save to file if requested
-        if filepath:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(parsed_data, f, indent=2)
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            Exception: If the download fails or the gzip stream is invalid.
+            ImportError: If progress=True but tqdm is not installed.
+
+        Example:
+            >>> bulk = ByType(type='all_cards')
+            >>> bulk.download_to('all_cards.json', progress=True)
+        """
+        tqdm = _require_tqdm() if progress else None
+        progress_bar = None
+        directory = os.path.dirname(os.path.abspath(filepath))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+        written = 0
+        try:
+            with os.fdopen(fd, "wb") as f, urlopen(self.download_uri) as response:
+                if tqdm is not None:
+                    total_size = int(response.headers.get("Content-Length", 0))
+                    progress_bar = tqdm(
+                        total=total_size, unit="B", unit_scale=True, desc="Downloading"
+                    )
+
+                for chunk in _iter_body(response, chunk_size, progress_bar):
+                    f.write(chunk)
+                    written += len(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        finally:
+            if progress_bar is not None:
+                progress_bar.close()
+
+        return written
+
+    def _iter_chunks(self, filepath: str | None, chunk_size: int) -> Iterator[bytes]:
+        """Stream the file's bytes from a local copy, or else from Scryfall."""
+        if filepath is not None:
+            with open(filepath, "rb") as f:
+                yield from iter(lambda: f.read(chunk_size), b"")
+            return
+
+        with urlopen(self.download_uri) as response:
+            yield from _iter_body(response, chunk_size)
+
+    def iter_objects(
+        self,
+        filepath: str | None = None,
+        wrap: bool = False,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        fields: Iterable[str] | None = None,
+        where: Where | None = None,
+    ) -> Iterator[Any]:
+        """
+        Parse the bulk data file incrementally, yielding one object at a time.
+
+        The file is streamed (from Scryfall, or from a local copy saved with
+        download_to()) and parsed as it arrives, so memory use is bounded by
+        chunk_size and the largest single object, not the size of the file.
+        This makes even all_cards (2+ GB) processable in a small container.
 
-        # Return data if requested
-        return parsed_data if return_data else None
+        Args:
+            filepath: Optional path of a local copy of the file to read instead
+                     of downloading it.
+            wrap: If True, yield card and ruling objects wrapped as cards.Object
+                  and rulings.Object (other objects are yielded as dicts).
+                  Default: False.
+            chunk_size: Read size in bytes. Default: 1 MiB.
+            fields: Optional top-level fields to keep in each object, e.g.
+                   ['id', 'name', 'prices']; the rest of each object is dropped
+                   as soon as it's parsed. Default: None (keep all).
+            where: Optional filter; objects that don't match are dropped before
+                  projection and wrapping. Either a function taking the object
+                  dict and returning a bool, or a dict of dotted field paths to
+                  values: every path must be present and equal its value, a
+                  list of values matches any of them, and a list field (like
+                  games) matches if it contains the value. Default: None.
+
+        Yields:
+            Each matching object in the file, as a dict or wrapper object.
+
+        Raises:
+            json.JSONDecodeError: If the file isn't a valid JSON array.
+
+        Example:
+            >>> bulk = ByType(type='all_cards')
+            >>> for card in bulk.iter_objects():
+            ...     if card['lang'] == 'ja':
+            ...         print(card['name'])
+
+            >>> for card in bulk.iter_objects(fields=['id', 'prices']):
+            ...     print(card['id'], card['prices']['usd'])
+
+            >>> english_paper = {'lang': 'en', 'games': 'paper', 'legalities.modern': 'legal'}
+            >>> for card in bulk.iter_objects(where=english_paper):
+            ...     print(card['name'])
+        """
+        items = iter_array(self._iter_chunks(filepath, chunk_size))
+        yield from _select(items, where, fields, wrap)
+
+    def iter_cards(
+        self,
+        filepath: str | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        fields: Iterable[str] | None = None,
+        where: Where | None = None,
+    ) -> Iterator[CardObject]:
+        """
+        Parse a card bulk data file incrementally, yielding cards.Object wrappers.
+
+        See iter_objects(); objects other than cards are skipped.
+
+        Args:
+            filepath: Optional path of a local copy of the file to read instead
+                     of downloading it.
+            chunk_size: Read size in bytes. Default: 1 MiB.
+            fields: Optional top-level fields to keep in each card; properties
+                   of dropped fields raise KeyError (or return None if
+                   optional). Default: None (keep all).
+            where: Optional filter on the card dicts, as for iter_objects().
+                  Default: None.
+
+        Yields:
+            Each matching card in the file, as a cards.Object.
+
+        Example:
+            >>> for card in ByType(type='oracle_cards').iter_cards():
+            ...     print(card.name, card.mana_cost)
+        """
+        items = self.iter_objects(
+            filepath, wrap=True, chunk_size=chunk_size, fields=fields, where=where
+        )
+        for item in items:
+            if isinstance(item, CardObject):
+                yield item
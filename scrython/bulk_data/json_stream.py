@@ -0,0 +1,102 @@
+"""Incremental parsing of JSON arrays.
+
+Bulk data files are one JSON array of up to a few hundred thousand objects
+(2+ GB for all_cards). iter_array() parses such an array from a stream of
+byte chunks and yields one element at a time, so memory use is bounded by
+the chunk size and the largest element rather than the size of the file.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITER = re.compile(r"[,\]]")
+
+
+def iter_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Parse a JSON array incrementally, yielding its elements.
+
+    Each element is decoded with the standard library's C decoder once all
+    of its bytes have arrived; only the unparsed tail of the stream is kept
+    in memory.
+
+    Args:
+        chunks: The UTF-8 encoded array, in chunks of any size
+
+    Yields:
+        Each element of the array, in order
+
+    Raises:
+        json.JSONDecodeError: If the stream isn't a valid JSON array
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunk_iter = iter(chunks)
+    buffer = ""
+    pos = 0
+    eof = False
+    state = "start"
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+
+        # Read more when out of data, or when the element at pos may be incomplete
+        if pos == len(buffer) or state == "value":
+            # Numbers and literals are only complete once a delimiter follows them
+            complete = (
+                eof or buffer[pos : pos + 1] in ("{", "[", '"') or _DELIMITER.search(buffer, pos)
+            )
+            if state == "value" and pos < len(buffer) and complete:
+                try:
+                    element, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    yield element
+                    pos = end
+                    state = "separator"
+                    continue
+
+            if eof:
+                if state == "end":
+                    return
+                raise json.JSONDecodeError("Unexpected end of JSON array", buffer, pos)
+
+            chunk = next(chunk_iter, None)
+            if chunk is None:
+                eof = True
+                text = text_decoder.decode(b"", final=True)
+            else:
+                text = text_decoder.decode(chunk)
+            buffer = buffer[pos:] + text
+            pos = 0
+            continue
+
+        char = buffer[pos]
+        if state == "start":
+            if char != "[":
+                raise json.JSONDecodeError("Expecting '['", buffer, pos)
+            pos += 1
+            state = "first"
+        elif state == "first":
+            if char == "]":
+                pos += 1
+                state = "end"
+            else:
+                state = "value"
+        elif state == "separator":
+            if char == ",":
+                pos += 1
+                state = "value"
+            elif char == "]":
+                pos += 1
+                state = "end"
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+        else:
+            raise json.JSONDecodeError("Extra data", buffer, pos)
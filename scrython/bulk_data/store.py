@@ -0,0 +1,290 @@
+"""Local bulk data store with conditional sync.
+
+Scryfall regenerates its bulk data files about every 12 hours, but a job
+polling more often than that would re-download hundreds of MB of unchanged
+data. BulkStore keeps the files in a directory with a manifest recording
+each file's id, type, updated_at, size and SHA-256, and sync() downloads a
+file only when the bulk-data listing shows a newer updated_at.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import Any, cast
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from ..cache_policy import _parse_timestamp
+from ..types import ScryfallBulkDataData
+from .bulk_data import All, Object
+from .bulk_data_mixins import STREAM_CHUNK_SIZE, BulkDataObjectMixin
+
+# Manifest format version, bumped on incompatible changes
+MANIFEST_VERSION = 1
+
+
+def _is_newer(updated_at: str, recorded: str) -> bool:
+    """Whether a listing's updated_at is later than the recorded one."""
+    new, old = _parse_timestamp(updated_at), _parse_timestamp(recorded)
+    if new is None or old is None:
+        # Unparseable timestamps: any change counts as an update
+        return updated_at != recorded
+    return new > old
+
+
+class BulkStore:
+    """
+    A directory of bulk data files kept in sync with Scryfall.
+
+    Each file is saved as ``<type>.json`` next to a ``manifest.json`` that
+    records, per type, the Scryfall ``id``, ``type`` and ``updated_at`` of
+    the downloaded file, its ``size`` in bytes and its ``sha256``. Downloads
+    stream to a temporary file that is renamed into place when complete
+    (see download_to()), and the manifest is replaced the same way, so a
+    failed or interrupted sync leaves the previous file and manifest intact.
+    Manifest updates hold an exclusive ``flock`` on ``manifest.json.lock``
+    (on POSIX), so processes syncing the same store don't drop each other's
+    entries.
+
+    Example:
+        from scrython.bulk_data import BulkStore
+
+        store = BulkStore('bulk')
+        updated = store.sync('default_cards')  # only downloads if Scryfall has a newer file
+
+        print(store.get('default_cards')['updated_at'])
+        for card in store.iter_objects('default_cards', where={'lang': 'en'}):
+            ...
+
+    Args:
+        directory: Directory holding the files and manifest (created if missing)
+        chunk_size: Download chunk size in bytes. Default: 1 MiB.
+    """
+
+    MANIFEST = "manifest.json"
+    LOCK = "manifest.json.lock"
+
+    def __init__(self, directory: str, chunk_size: int = STREAM_CHUNK_SIZE) -> None:
+        """Initialize the store, creating its directory if needed."""
+        self.directory = directory
+        self.chunk_size = chunk_size
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def manifest_path(self) -> str:
+        """Path of the manifest file."""
+        return os.path.join(self.directory, self.MANIFEST)
+
+    def path(self, bulk_type: str) -> str:
+        """
+        Get the path a bulk data file is stored at.
+
+        Args:
+            bulk_type: Bulk data type, e.g. 'default_cards'
+
+        Returns:
+            Path of the file (which exists once the type has been synced)
+        """
+        return os.path.join(self.directory, f"{bulk_type}.json")
+
+    def manifest(self) -> dict[str, dict[str, Any]]:
+        """
+        Read the manifest.
+
+        Returns:
+            Manifest entries by bulk data type (empty if nothing was synced yet)
+        """
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        files: dict[str, dict[str, Any]] = manifest.get("files", {})
+        return files
+
+    def get(self, bulk_type: str) -> dict[str, Any] | None:
+        """
+        Get the manifest entry for a bulk data type.
+
+        Args:
+            bulk_type: Bulk data type, e.g. 'default_cards'
+
+        Returns:
+            Dict with id, type, updated_at, size and sha256, or None if the
+            type hasn't been synced
+        """
+        return self.manifest().get(bulk_type)
+
+    def is_current(self, bulk: BulkDataObjectMixin) -> bool:
+        """
+        Check whether the stored file is up to date with bulk-data metadata.
+
+        The file must exist with the recorded size, and its updated_at must
+        be no older than the metadata's. Use verify() to also check contents.
+
+        Args:
+            bulk: Bulk data metadata, e.g. from bulk_data.All() or ByType()
+
+        Returns:
+            True if no download is needed
+        """
+        entry = self.get(bulk.type)
+        if entry is None:
+            return False
+        try:
+            size = os.path.getsize(self.path(bulk.type))
+        except OSError:
+            return False
+        return size == entry["size"] and not _is_newer(bulk.updated_at, entry["updated_at"])
+
+    def sync(
+        self,
+        types: str | Iterable[str] | None = None,
+        force: bool = False,
+        progress: bool = False,
+    ) -> list[str]:
+        """
+        Download the bulk data files that changed since the last sync.
+
+        Fetches the bulk-data listing (one API request, never served from the
+        cache) and downloads each requested type whose updated_at is newer
+        than the manifest's, or whose file is missing.
+
+        Args:
+            types: A bulk data type or list of types to sync. Default: None
+                  (every type already in the manifest).
+            force: If True, download even if the stored file is current.
+                  Default: False.
+            progress: If True, display a progress bar for each download
+                     (requires tqdm). Default: False.
+
+        Returns:
+            The types that were downloaded, in listing order
+
+        Raises:
+            KeyError: If a requested type isn't in Scryfall's listing.
+        """
+        if types is None:
+            wanted = set(self.manifest())
+        elif isinstance(types, str):
+            wanted = {types}
+        else:
+            wanted = set(types)
+        if not wanted:
+            return []
+
+        listing = {bulk.type: bulk for bulk in All(cache=False).data}
+        missing = wanted - set(listing)
+        if missing:
+            raise KeyError(f"Unknown bulk data type(s): {', '.join(sorted(missing))}")
+
+        updated = []
+        for bulk_type, bulk in listing.items():
+            if bulk_type in wanted and (force or not self.is_current(bulk)):
+                self._download(bulk, progress)
+                updated.append(bulk_type)
+        return updated
+
+    def verify(self, bulk_type: str) -> bool:
+        """
+        Check a stored file against its recorded size and SHA-256.
+
+        Args:
+            bulk_type: Bulk data type, e.g. 'default_cards'
+
+        Returns:
+            True if the file exists and matches the manifest
+        """
+        entry = self.get(bulk_type)
+        if entry is None:
+            return False
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with open(self.path(bulk_type), "rb") as f:
+                for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                    hasher.update(chunk)
+                    size += len(chunk)
+        except OSError:
+            return False
+        return size == entry["size"] and hasher.hexdigest() == entry["sha256"]
+
+    def iter_objects(self, bulk_type: str, **kwargs: Any) -> Iterator[Any]:
+        """
+        Stream the objects of a stored file.
+
+        Args:
+            bulk_type: Bulk data type, e.g. 'default_cards'
+            **kwargs: Passed to BulkDataObjectMixin.iter_objects() (wrap,
+                     chunk_size, fields, where)
+
+        Yields:
+            Each matching object in the file
+
+        Raises:
+            KeyError: If the type hasn't been synced.
+        """
+        entry = self.get(bulk_type)
+        if entry is None:
+            raise KeyError(f"Bulk data type not synced: {bulk_type}")
+        bulk = Object(cast(ScryfallBulkDataData, entry))
+        yield from bulk.iter_objects(self.path(bulk_type), **kwargs)
+
+    def _download(self, bulk: BulkDataObjectMixin, progress: bool) -> None:
+        """Download one file and record it in the manifest."""
+        hasher = hashlib.sha256()
+        size = bulk.download_to(
+            self.path(bulk.type), chunk_size=self.chunk_size, progress=progress, hasher=hasher
+        )
+        self._record(
+            {
+                "id": bulk.id,
+                "type": bulk.type,
+                "updated_at": bulk.updated_at,
+                "size": size,
+                "sha256": hasher.hexdigest(),
+            }
+        )
+
+    def _record(self, entry: dict[str, Any]) -> None:
+        """Add or replace one manifest entry, re-reading the manifest under the lock."""
+        with self._manifest_lock():
+            files = self.manifest()
+            files[entry["type"]] = entry
+            self._write_manifest(files)
+
+    @contextlib.contextmanager
+    def _manifest_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the manifest's sidecar lock file."""
+        if fcntl is None:  # pragma: no cover - Windows
+            yield
+            return
+
+        fd = os.open(
+            os.path.join(self.directory, self.LOCK), os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o666
+        )
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _write_manifest(self, files: dict[str, dict[str, Any]]) -> None:
+        """Atomically replace the manifest."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": files}, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
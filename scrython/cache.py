@@ -1,14 +1,72 @@
 """Caching layer for Scryfall API responses.
 
-Provides an abstract cache interface and in-memory cache implementation
-with TTL (time-to-live) support for reducing API calls.
+Provides an abstract cache interface, an in-memory cache implementation
+with TTL (time-to-live) support for reducing API calls, persistent
+SQLite and file-system caches that survive restarts and can be shared
+between processes, and a two-tier cache combining the two. Backends can keep
+expired entries for a while (``keep_stale``) so requests may serve them stale,
+keep expired entries that have HTTP validators longer (``keep_validated``) so
+they can be revalidated with a conditional request, and count their hits,
+misses and evictions (``get_stats()``).
 """
 
+import contextlib
 import hashlib
+import importlib
+import json
+import math
+import os
+import re
+import sqlite3
+import struct
+import tempfile
 import threading
 import time
+import weakref
+import zlib
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, NamedTuple
+
+from .cache_stats import COUNTERS, CacheStats, CacheStatsSnapshot
+
+# Optional zstd support: the standard library module (Python 3.14+) or zstandard
+zstd: ModuleType | None
+try:
+    zstd = importlib.import_module("compression.zstd")
+except ImportError:
+    try:
+        zstd = importlib.import_module("zstandard")
+    except ImportError:
+        zstd = None
+
+
+# Default seconds to keep expired entries with an ETag or Last-Modified header,
+# so the next request can revalidate them instead of downloading them again
+KEEP_VALIDATED = 7 * 24 * 3600.0
+
+
+class CacheEntry(NamedTuple):
+    """A cached response together with its expiry time and HTTP validators."""
+
+    data: dict[str, Any]
+    expires_at: float
+    # Response headers for revalidating the entry: ETag and/or Last-Modified
+    validators: dict[str, str] | None = None
+
+    def stale_for(self) -> float:
+        """
+        Get how long ago the entry expired.
+
+        Returns:
+            Seconds since expiry; zero or negative while the entry is fresh
+        """
+        return time.time() - self.expires_at
+
+
+# Guards the lazy creation of each backend's CacheStats
+_stats_lock = threading.Lock()
 
 
 class CacheBackend(ABC):
@@ -16,9 +74,50 @@ class CacheBackend(ABC):
     Abstract base class for cache backends.
 
     Custom cache backends (e.g., Redis, SQLite) can be implemented
-    by subclassing this interface.
+    by subclassing this interface. Lookups through get_entry() and writes
+    through set_entry() are counted in ``stats`` unless overridden; backends
+    overriding them record their own events.
     """
 
+    _stats: CacheStats | None = None
+
+    @property
+    def stats(self) -> CacheStats:
+        """The backend's statistics counters."""
+        if self._stats is None:
+            with _stats_lock:
+                if self._stats is None:
+                    self._stats = CacheStats()
+        return self._stats
+
+    def get_stats(self) -> CacheStatsSnapshot:
+        """
+        Get a snapshot of the backend's statistics.
+
+        Returns:
+            CacheStatsSnapshot with the counters, the number of entries and
+            the size of the stored data (where the backend can tell)
+        """
+        entries, nbytes = self._usage()
+        return self.stats.snapshot(entries, nbytes)
+
+    def reset_stats(self) -> None:
+        """Set the backend's statistics counters back to zero."""
+        self.stats.reset()
+
+    def _usage(self) -> tuple[int | None, int | None]:
+        """Get the number of stored entries and their size in bytes, if known."""
+        return None, None
+
+    def _record_lookup(self, entry: CacheEntry | None) -> None:
+        """Count a lookup as a hit, stale hit or miss by the entry it found."""
+        if entry is None:
+            self.stats.record("misses")
+        elif entry.stale_for() >= 0:
+            self.stats.record("stale_hits")
+        else:
+            self.stats.record("hits")
+
     @abstractmethod
     def get(self, key: str) -> dict[str, Any] | None:
         """
@@ -49,27 +148,107 @@ class CacheBackend(ABC):
         """Clear all cached data."""
         pass
 
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """
+        Retrieve an entry with its expiry time, including recently expired entries.
+
+        Used for ``stale_while_revalidate`` and ``stale_if_error``. Backends
+        that keep expired entries around should override this; the default
+        only returns fresh entries, so they are never served stale.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            CacheEntry if the backend still holds the entry, None otherwise
+        """
+        data = self.get(key)
+        entry = CacheEntry(data, math.inf) if data is not None else None
+        self._record_lookup(entry)
+        return entry
+
+    def set_entry(
+        self,
+        key: str,
+        data: dict[str, Any],
+        ttl: int | float,
+        validators: dict[str, str] | None = None,  # noqa: ARG002
+    ) -> None:
+        """
+        Store data with a TTL together with the response's HTTP validators.
+
+        Validators (ETag, Last-Modified) let an expired entry be revalidated
+        with a conditional request instead of downloaded again. Backends
+        that can store them should override this; the default drops them.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds (int or float)
+            validators: Validator headers, e.g. {'ETag': '"abc"'}, or None
+        """
+        self.set(key, data, ttl)
+        self.stats.record("sets")
+
 
 class MemoryCache(CacheBackend):
     """
-    In-memory cache implementation with TTL support.
+    In-memory cache implementation with TTL support and LRU eviction.
 
-    This cache stores data in memory using a dictionary. Each entry
+    This cache stores data in memory using an ordered dictionary. Each entry
     includes an expiration timestamp. Thread-safe for concurrent access.
 
+    The cache is bounded: once it holds ``max_entries`` entries, or (if set)
+    roughly ``max_bytes`` of JSON-encoded data, the least recently used
+    entries are evicted. get() and set() are O(1).
+
     Note: Data is lost when the program exits.
+
+    Example:
+        # Keep at most 50,000 responses, using up to about 256 MB
+        cache = MemoryCache(max_entries=50_000, max_bytes=256 * 1024 * 1024)
     """
 
-    def __init__(self) -> None:
-        """Initialize an empty in-memory cache."""
-        self._cache: dict[str, tuple[dict[str, Any], float]] = {}
+    def __init__(
+        self,
+        max_entries: int | None = 10_000,
+        max_bytes: int | None = None,
+        keep_stale: float = 0.0,
+        keep_validated: float = KEEP_VALIDATED,
+    ) -> None:
+        """
+        Initialize an empty in-memory cache.
+
+        Args:
+            max_entries: Maximum number of entries, or None for no limit.
+                         Default: 10,000.
+            max_bytes: Approximate maximum size of the cached data in bytes,
+                       measured as the length of each entry's JSON encoding,
+                       or None for no limit (default).
+            keep_stale: Seconds to keep expired entries available to
+                        get_entry() for serving stale. Default: 0.
+            keep_validated: Seconds to keep expired entries that have HTTP
+                            validators (ETag / Last-Modified) available to
+                            get_entry() for revalidation, if longer than
+                            keep_stale. They are still evicted as least
+                            recently used. Default: 7 days.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.keep_stale = keep_stale
+        self.keep_validated = keep_validated
+        self._cache: OrderedDict[str, tuple[dict[str, Any], float, int, dict[str, str] | None]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
         self._lock = threading.Lock()
 
     def get(self, key: str) -> dict[str, Any] | None:
         """
         Retrieve cached data if it exists and hasn't expired.
 
-        Automatically removes expired entries during retrieval.
+        Automatically removes expired entries during retrieval, and marks
+        found entries as most recently used.
 
         Args:
             key: Cache key to retrieve
@@ -77,32 +256,133 @@ class MemoryCache(CacheBackend):
         Returns:
             Cached data dictionary if found and valid, None otherwise
         """
+        entry = self._lookup(key)
+        if entry is not None and entry.stale_for() >= 0:
+            entry = None
+        self._record_lookup(entry)
+        return entry.data if entry is not None else None
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """
+        Retrieve an entry with its expiry time, including expired entries
+        still within keep_stale (or keep_validated, if they have validators).
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            CacheEntry if found, None otherwise
+        """
+        entry = self._lookup(key)
+        self._record_lookup(entry)
+        return entry
+
+    def _kept_for(self, validators: dict[str, str] | None) -> float:
+        """Seconds an entry is kept past expiry."""
+        return max(self.keep_stale, self.keep_validated) if validators else self.keep_stale
+
+    def _lookup(self, key: str) -> CacheEntry | None:
+        """Find an entry, removing it if it is past keep_stale (or keep_validated)."""
         with self._lock:
-            if key in self._cache:
-                data, expiry = self._cache[key]
-                if time.time() < expiry:
-                    return data
-                # Remove expired entry
-                del self._cache[key]
-        return None
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            data, expiry, _, validators = entry
+            if time.time() >= expiry + self._kept_for(validators):
+                # Remove entry that is past serving even stale
+                self._remove(key)
+                self.stats.record("expirations")
+                return None
+
+            self._cache.move_to_end(key)
+            return CacheEntry(data, expiry, validators)
 
     def set(self, key: str, data: dict[str, Any], ttl: int | float) -> None:
         """
-        Store data in cache with a TTL.
+        Store data in cache with a TTL, evicting least recently used entries if full.
 
         Args:
             key: Cache key to store under
             data: Data dictionary to cache
             ttl: Time-to-live in seconds (int or float)
         """
+        self.set_entry(key, data, ttl)
+
+    def set_entry(
+        self,
+        key: str,
+        data: dict[str, Any],
+        ttl: int | float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Store data with a TTL and HTTP validators, evicting least recently used entries if full.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds (int or float)
+            validators: Validator headers, e.g. {'ETag': '"abc"'}, or None
+        """
+        nbytes = len(json.dumps(data)) if self.max_bytes is not None else 0
+
         with self._lock:
+            if key in self._cache:
+                self._remove(key)
+
+            # An entry larger than the whole cache is not worth keeping
+            if self.max_bytes is not None and nbytes > self.max_bytes:
+                return
+
             expiry = time.time() + ttl
-            self._cache[key] = (data.copy(), expiry)
+            self._cache[key] = (data.copy(), expiry, nbytes, validators)
+            self._bytes += nbytes
+            self._evict()
+        self.stats.record("sets")
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry. Caller must hold self._lock."""
+        _, _, nbytes, _ = self._cache.pop(key)
+        self._bytes -= nbytes
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within limits. Caller must hold self._lock."""
+        while (self.max_entries is not None and len(self._cache) > self.max_entries) or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, (_, expiry, nbytes, _) = self._cache.popitem(last=False)
+            self._bytes -= nbytes
+            self.stats.record("expirations" if expiry <= time.time() else "evictions")
+
+    def purge_expired(self) -> int:
+        """
+        Remove all expired entries (past keep_stale, or keep_validated for
+        entries with validators).
+
+        Expired entries are otherwise only dropped when read or evicted, so
+        long-running processes may call this periodically to free memory early.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        with self._lock:
+            expired = [
+                key
+                for key, (_, expiry, _, validators) in self._cache.items()
+                if expiry + self._kept_for(validators) <= now
+            ]
+            for key in expired:
+                self._remove(key)
+        self.stats.record("expirations", len(expired))
+        return len(expired)
 
     def clear(self) -> None:
         """Clear all cached data."""
         with self._lock:
             self._cache.clear()
+            self._bytes = 0
 
     def size(self) -> int:
         """
@@ -114,6 +394,908 @@ class MemoryCache(CacheBackend):
         with self._lock:
             return len(self._cache)
 
+    def size_bytes(self) -> int:
+        """
+        Get the approximate size of the cached data.
+
+        Only tracked when max_bytes is set; otherwise returns 0.
+
+        Returns:
+            Sum of the JSON-encoded sizes of all entries, in bytes
+        """
+        with self._lock:
+            return self._bytes
+
+    def _usage(self) -> tuple[int | None, int | None]:
+        """Get the number of entries, and their size if max_bytes is set."""
+        with self._lock:
+            return len(self._cache), self._bytes if self.max_bytes is not None else None
+
+
+class StripedMemoryCache(CacheBackend):
+    """
+    In-memory cache split into independently locked stripes.
+
+    Each key is assigned by hash to one of ``stripes`` MemoryCache
+    instances, so threads working on different keys rarely wait for the
+    same lock. This scales better than a single MemoryCache under many
+    threads, especially on free-threaded Python builds.
+
+    Limits are divided evenly between the stripes and LRU eviction happens
+    per stripe, so the least recently used entries overall are evicted only
+    approximately.
+
+    Example:
+        from scrython.cache import StripedMemoryCache, set_global_cache
+
+        set_global_cache(StripedMemoryCache(stripes=32, max_entries=100_000))
+    """
+
+    def __init__(
+        self,
+        stripes: int = 16,
+        max_entries: int | None = 10_000,
+        max_bytes: int | None = None,
+        keep_stale: float = 0.0,
+        keep_validated: float = KEEP_VALIDATED,
+    ) -> None:
+        """
+        Initialize an empty striped cache.
+
+        Args:
+            stripes: Number of independently locked stripes. Default: 16.
+            max_entries: Maximum number of entries across all stripes, or
+                         None for no limit. Default: 10,000.
+            max_bytes: Approximate maximum size of the cached data across all
+                       stripes (see MemoryCache), or None for no limit (default).
+            keep_stale: Seconds to keep expired entries available to
+                        get_entry() for serving stale. Default: 0.
+            keep_validated: Seconds to keep expired entries that have HTTP
+                            validators for revalidation (see MemoryCache).
+                            Default: 7 days.
+        """
+        if stripes <= 0:
+            raise ValueError("stripes must be positive")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.keep_stale = keep_stale
+        self.keep_validated = keep_validated
+        self._stripes = [
+            MemoryCache(
+                max_entries=math.ceil(max_entries / stripes) if max_entries is not None else None,
+                max_bytes=math.ceil(max_bytes / stripes) if max_bytes is not None else None,
+                keep_stale=keep_stale,
+                keep_validated=keep_validated,
+            )
+            for _ in range(stripes)
+        ]
+
+    def _stripe(self, key: str) -> MemoryCache:
+        """Get the stripe holding a key."""
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieve cached data if it exists and hasn't expired.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Cached data dictionary if found and valid, None otherwise
+        """
+        return self._stripe(key).get(key)
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """
+        Retrieve an entry with its expiry time, including expired entries
+        still within keep_stale (or keep_validated, if they have validators).
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            CacheEntry if found, None otherwise
+        """
+        return self._stripe(key).get_entry(key)
+
+    def set(self, key: str, data: dict[str, Any], ttl: int | float) -> None:
+        """
+        Store data in cache with a TTL, evicting from the key's stripe if full.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds (int or float)
+        """
+        self._stripe(key).set_entry(key, data, ttl)
+
+    def set_entry(
+        self,
+        key: str,
+        data: dict[str, Any],
+        ttl: int | float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Store data with a TTL and HTTP validators, evicting from the key's stripe if full.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds (int or float)
+            validators: Validator headers, e.g. {'ETag': '"abc"'}, or None
+        """
+        self._stripe(key).set_entry(key, data, ttl, validators)
+
+    def purge_expired(self) -> int:
+        """
+        Remove all expired entries (past keep_stale) from every stripe.
+
+        Returns:
+            Number of entries removed
+        """
+        return sum(stripe.purge_expired() for stripe in self._stripes)
+
+    def clear(self) -> None:
+        """Clear all cached data."""
+        for stripe in self._stripes:
+            stripe.clear()
+
+    def size(self) -> int:
+        """
+        Get the number of cached entries.
+
+        Returns:
+            Number of entries currently in cache
+        """
+        return sum(stripe.size() for stripe in self._stripes)
+
+    def size_bytes(self) -> int:
+        """
+        Get the approximate size of the cached data (tracked only when max_bytes is set).
+
+        Returns:
+            Sum of the JSON-encoded sizes of all entries, in bytes
+        """
+        return sum(stripe.size_bytes() for stripe in self._stripes)
+
+    def get_stats(self) -> CacheStatsSnapshot:
+        """
+        Get a snapshot of the statistics, summed over all stripes.
+
+        Returns:
+            CacheStatsSnapshot with the counters, entries and size of all stripes
+        """
+        snapshots = [stripe.get_stats() for stripe in self._stripes]
+        totals = {counter: sum(getattr(s, counter) for s in snapshots) for counter in COUNTERS}
+        return self.stats.snapshot()._replace(
+            **totals,
+            entries=sum(s.entries or 0 for s in snapshots),
+            bytes=sum(s.bytes or 0 for s in snapshots) if self.max_bytes is not None else None,
+        )
+
+    def reset_stats(self) -> None:
+        """Set the statistics counters of every stripe back to zero."""
+        self.stats.reset()
+        for stripe in self._stripes:
+            stripe.reset_stats()
+
+
+class _ThreadConnection:
+    """A thread's SQLite connection, closed when the thread exits."""
+
+    __slots__ = ("conn", "pid", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.pid = os.getpid()
+
+
+def _close_connection(
+    conn: sqlite3.Connection,
+    pid: int,
+    connections: "set[sqlite3.Connection]",
+    lock: threading.Lock,
+) -> None:
+    """Finalizer for _ThreadConnection: close and forget the connection."""
+    with lock:
+        connections.discard(conn)
+    # A forked child must not touch the parent's connection
+    if pid == os.getpid():
+        conn.close()
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Persistent cache backed by a SQLite database.
+
+    Entries are stored as zlib-compressed JSON with their expiry time in an
+    indexed column, so expired entries can be deleted in bulk. The database
+    uses WAL mode, which lets many processes read while one writes, so
+    several workers can share one cache file and keep it across restarts.
+
+    Each thread (and each process after a fork) gets its own connection,
+    which is closed when the thread exits.
+
+    Example:
+        from scrython.cache import SQLiteCache, set_global_cache
+
+        set_global_cache(SQLiteCache('/var/cache/scrython.db'))
+        card = scrython.cards.Named(fuzzy='Lightning Bolt', cache=True)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        compress_level: int = 6,
+        purge_interval: float | None = 300.0,
+        keep_stale: float = 0.0,
+        keep_validated: float = KEEP_VALIDATED,
+    ) -> None:
+        """
+        Open (or create) a SQLite cache.
+
+        Args:
+            path: Path to the database file
+            compress_level: zlib compression level, 0-9. Default: 6.
+            purge_interval: Seconds between automatic bulk deletes of expired
+                            entries (run during set()), or None to only purge
+                            when purge_expired() is called. Default: 300.
+            keep_stale: Seconds to keep expired entries available to
+                        get_entry() for serving stale. Default: 0.
+            keep_validated: Seconds to keep expired entries that have HTTP
+                            validators (ETag / Last-Modified) available to
+                            get_entry() for revalidation, if longer than
+                            keep_stale. Default: 7 days.
+        """
+        self.path = path
+        self.compress_level = compress_level
+        self.purge_interval = purge_interval
+        self.keep_stale = keep_stale
+        self.keep_validated = keep_validated
+        self._local = threading.local()
+        self._connections: set[sqlite3.Connection] = set()
+        self._lock = threading.Lock()
+        self._last_purge = time.monotonic()
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, "
+                "validators TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+
+            # Databases created before validators were stored lack the column
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+            if "validators" not in columns:
+                with contextlib.suppress(sqlite3.OperationalError):  # Added concurrently
+                    conn.execute("ALTER TABLE cache ADD COLUMN validators TEXT")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        holder: _ThreadConnection | None = getattr(self._local, "holder", None)
+        if holder is None or holder.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            holder = self._local.holder = _ThreadConnection(conn)
+            with self._lock:
+                self._connections.add(conn)
+            # Thread-local values are released when their thread exits
+            weakref.finalize(
+                holder, _close_connection, conn, holder.pid, self._connections, self._lock
+            )
+        return holder.conn
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieve cached data if it exists and hasn't expired.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Cached data dictionary if found and valid, None otherwise
+        """
+        row = (
+            self._connect()
+            .execute("SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time()))
+            .fetchone()
+        )
+        self.stats.record("misses" if row is None else "hits")
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]))
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """
+        Retrieve an entry with its expiry time, including expired entries
+        still within keep_stale (or keep_validated, if they have validators).
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            CacheEntry if found, None otherwise
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT value, expires_at, validators FROM cache WHERE key = ? "
+                "AND (expires_at > ? OR (validators IS NOT NULL AND expires_at > ?))",
+                (key, *self._cutoffs()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            self._record_lookup(None)
+            return None
+        validators = json.loads(row[2]) if row[2] else None
+        entry = CacheEntry(json.loads(zlib.decompress(row[0])), row[1], validators)
+        self._record_lookup(entry)
+        return entry
+
+    def _cutoffs(self) -> tuple[float, float]:
+        """Get the expiry times before which entries without and with validators are dropped."""
+        now = time.time()
+        return now - self.keep_stale, now - max(self.keep_stale, self.keep_validated)
+
+    def set(self, key: str, data: dict[str, Any], ttl: int | float) -> None:
+        """
+        Store data in cache with a TTL.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds (int or float)
+        """
+        self.set_entry(key, data, ttl)
+
+    def set_entry(
+        self,
+        key: str,
+        data: dict[str, Any],
+        ttl: int | float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Store data with a TTL and HTTP validators.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds (int or float)
+            validators: Validator headers, e.g. {'ETag': '"abc"'}, or None
+        """
+        value = zlib.compress(json.dumps(data).encode("utf-8"), self.compress_level)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, validators) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, time.time() + ttl, json.dumps(validators) if validators else None),
+            )
+        self.stats.record("sets")
+
+        if (
+            self.purge_interval is not None
+            and time.monotonic() - self._last_purge >= self.purge_interval
+        ):
+            self.purge_expired()
+
+    def purge_expired(self) -> int:
+        """
+        Delete all expired entries (past keep_stale, or keep_validated for
+        entries with validators) in one statement.
+
+        Returns:
+            Number of entries removed
+        """
+        self._last_purge = time.monotonic()
+        with self._connect() as conn:
+            removed: int = conn.execute(
+                "DELETE FROM cache WHERE expires_at <= ? "
+                "AND (validators IS NULL OR expires_at <= ?)",
+                self._cutoffs(),
+            ).rowcount
+        self.stats.record("expirations", removed)
+        return removed
+
+    def clear(self) -> None:
+        """Clear all cached data."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache")
+
+    def size(self) -> int:
+        """
+        Get the number of stored entries, including expired ones not yet purged.
+
+        Returns:
+            Number of rows in the cache table
+        """
+        return self._connect().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def _usage(self) -> tuple[int | None, int | None]:
+        """Get the number of rows and the compressed size of their values."""
+        count, nbytes = (
+            self._connect().execute("SELECT COUNT(*), SUM(LENGTH(value)) FROM cache").fetchone()
+        )
+        return count, nbytes or 0
+
+    def close(self) -> None:
+        """Close every connection opened by this cache."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class FileCache(CacheBackend):
+    """
+    Persistent cache storing one file per entry in sharded directories.
+
+    Useful where SQLite's file locking is unreliable (e.g. NFS) or many
+    processes write at once. Entries live at ``<directory>/ab/cd/<key>``,
+    named by the SHA256 cache key, and are written to a temporary file and
+    atomically renamed into place, so readers never see a partial entry.
+
+    Each file starts with a small uncompressed header holding the expiry
+    time, so expired entries can be skipped or pruned without decompressing
+    them. Payloads are JSON compressed with zlib, or zstd when available
+    (Python 3.14's ``compression.zstd`` or the ``zstandard`` package).
+
+    Example:
+        from scrython.cache import FileCache, set_global_cache
+
+        set_global_cache(FileCache('/mnt/shared/scrython-cache', max_bytes=2 * 1024**3))
+    """
+
+    # Header: magic, format version, codec, expiry timestamp. Version 2 entries
+    # follow it with the length of a JSON object of validators and the object.
+    _HEADER = struct.Struct("<4sBBd")
+    _VALIDATORS_LENGTH = struct.Struct("<H")
+    _MAGIC = b"SCRY"
+    _CODECS = {"none": 0, "zlib": 1, "zstd": 2}
+    _KEY_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+    def __init__(
+        self,
+        directory: str,
+        compression: str = "zlib",
+        compress_level: int = 6,
+        max_bytes: int | None = None,
+        prune_interval: float | None = 300.0,
+        keep_stale: float = 0.0,
+        keep_validated: float = KEEP_VALIDATED,
+    ) -> None:
+        """
+        Open (or create) a file cache.
+
+        Args:
+            directory: Root directory of the cache
+            compression: 'zlib' (default), 'zstd' or 'none'
+            compress_level: Compression level passed to the codec. Default: 6.
+            max_bytes: Approximate maximum total size of the cache files; the
+                       oldest entries are removed by prune() beyond it.
+                       Default: None (no limit).
+            prune_interval: Seconds between automatic prune() runs (started
+                            from set()), or None to only prune when called.
+                            Default: 300.
+            keep_stale: Seconds to keep expired entries available to
+                        get_entry() for serving stale. Default: 0.
+            keep_validated: Seconds to keep expired entries that have HTTP
+                            validators (ETag / Last-Modified) available to
+                            get_entry() for revalidation, if longer than
+                            keep_stale. Default: 7 days.
+
+        Raises:
+            ValueError: If compression is not a known codec
+            ImportError: If compression is 'zstd' but no zstd module is available
+        """
+        if compression not in self._CODECS:
+            raise ValueError(f"Unknown compression {compression!r}; use 'zlib', 'zstd' or 'none'")
+        if compression == "zstd" and zstd is None:
+            raise ImportError("zstd compression requires Python 3.14+ or the zstandard package")
+
+        self.directory = directory
+        self.compression = compression
+        self.compress_level = compress_level
+        self.max_bytes = max_bytes
+        self.prune_interval = prune_interval
+        self.keep_stale = keep_stale
+        self.keep_validated = keep_validated
+        self._last_prune = time.monotonic()
+        self._prune_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Get the file path for a key, hashing keys that aren't SHA256 hex digests."""
+        if not self._KEY_PATTERN.fullmatch(key):
+            key = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, key[:2], key[2:4], key)
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == "zlib":
+            return zlib.compress(payload, self.compress_level)
+        if self.compression == "zstd":
+            assert zstd is not None
+            return zstd.compress(payload, self.compress_level)
+        return payload
+
+    @staticmethod
+    def _decompress(codec: int, payload: bytes) -> bytes:
+        if codec == 1:
+            return zlib.decompress(payload)
+        if codec == 2:
+            if zstd is None:
+                raise ValueError("zstd-compressed entry but no zstd module is available")
+            return zstd.decompress(payload)
+        return payload
+
+    def _cutoffs(self) -> tuple[float, float]:
+        """Get the expiry times before which entries without and with validators are dropped."""
+        now = time.time()
+        return now - self.keep_stale, now - max(self.keep_stale, self.keep_validated)
+
+    def _read_expiry(self, path: str) -> tuple[float, int] | None:
+        """Read an entry's (expiry, version) from its header, or None if unreadable."""
+        try:
+            with open(path, "rb") as f:
+                header = f.read(self._HEADER.size)
+        except OSError:
+            return None
+        if len(header) < self._HEADER.size:
+            return None
+        magic, version, _, expires_at = self._HEADER.unpack(header)
+        if magic != self._MAGIC:
+            return None
+        return expires_at, version
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieve cached data if it exists and hasn't expired.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Cached data dictionary if found and valid, None otherwise
+        """
+        now = time.time()
+        entry = self._read(key, now, now)
+        self._record_lookup(entry)
+        return entry.data if entry is not None else None
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """
+        Retrieve an entry with its expiry time, including expired entries
+        still within keep_stale (or keep_validated, if they have validators).
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            CacheEntry if found, None otherwise
+        """
+        entry = self._read(key, *self._cutoffs())
+        self._record_lookup(entry)
+        return entry
+
+    def _read(
+        self, key: str, not_expired_before: float, validated_not_expired_before: float
+    ) -> CacheEntry | None:
+        """Read an entry unless it expired before the given time (for its kind of entry)."""
+        try:
+            with open(self._path(key), "rb") as f:
+                header = f.read(self._HEADER.size)
+                if len(header) < self._HEADER.size:
+                    return None
+                magic, version, codec, expires_at = self._HEADER.unpack(header)
+                # Only version 2 entries have validators
+                cutoff = validated_not_expired_before if version >= 2 else not_expired_before
+                if magic != self._MAGIC or cutoff >= expires_at:
+                    return None
+                validators = None
+                if version >= 2:
+                    (length,) = self._VALIDATORS_LENGTH.unpack(f.read(self._VALIDATORS_LENGTH.size))
+                    validators = json.loads(f.read(length))
+                payload = f.read()
+        except OSError:
+            return None
+        except (struct.error, ValueError):
+            return None  # Truncated or corrupt validators
+
+        try:
+            return CacheEntry(json.loads(self._decompress(codec, payload)), expires_at, validators)
+        except Exception:
+            # Corrupt entry (or a codec this process can't read): treat as a miss
+            return None
+
+    def set(self, key: str, data: dict[str, Any], ttl: int | float) -> None:
+        """
+        Store data in cache with a TTL, atomically replacing any existing entry.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds (int or float)
+        """
+        self.set_entry(key, data, ttl)
+
+    def set_entry(
+        self,
+        key: str,
+        data: dict[str, Any],
+        ttl: int | float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Store data with a TTL and HTTP validators, atomically replacing any existing entry.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds (int or float)
+            validators: Validator headers, e.g. {'ETag': '"abc"'}, or None
+        """
+        path = self._path(key)
+        shard = os.path.dirname(path)
+        os.makedirs(shard, exist_ok=True)
+
+        # Entries without validators keep the version 1 layout older readers understand
+        version = 2 if validators else 1
+        header = self._HEADER.pack(
+            self._MAGIC, version, self._CODECS[self.compression], time.time() + ttl
+        )
+        if validators:
+            encoded = json.dumps(validators).encode("utf-8")
+            header += self._VALIDATORS_LENGTH.pack(len(encoded)) + encoded
+        payload = self._compress(json.dumps(data).encode("utf-8"))
+
+        fd, tmp_path = tempfile.mkstemp(dir=shard, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        self.stats.record("sets")
+
+        if (
+            self.prune_interval is not None
+            and time.monotonic() - self._last_prune >= self.prune_interval
+        ):
+            self.prune()
+
+    def _entries(self) -> list[str]:
+        """List the paths of all entry files."""
+        paths: list[str] = []
+        for root, _, files in os.walk(self.directory):
+            paths.extend(os.path.join(root, name) for name in files if not name.startswith("."))
+        return paths
+
+    def prune(self, max_bytes: int | None = None) -> int:
+        """
+        Delete expired entries (past keep_stale, or keep_validated for entries
+        with validators), then the oldest entries beyond the size cap.
+
+        Safe to run from several processes at once. Entries are read only up
+        to their header, never decompressed.
+
+        Args:
+            max_bytes: Size cap to enforce (default: the cache's max_bytes)
+
+        Returns:
+            Number of entries removed
+        """
+        if not self._prune_lock.acquire(blocking=False):
+            return 0  # Another thread is already pruning
+
+        try:
+            self._last_prune = time.monotonic()
+            max_bytes = max_bytes if max_bytes is not None else self.max_bytes
+            cutoff, validated_cutoff = self._cutoffs()
+            expired = evicted = 0
+            live: list[tuple[float, int, str]] = []
+
+            for path in self._entries():
+                header = self._read_expiry(path)
+                try:
+                    if header is None or header[0] <= (
+                        validated_cutoff if header[1] >= 2 else cutoff
+                    ):
+                        os.unlink(path)
+                        expired += 1
+                        continue
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                live.append((stat.st_mtime, stat.st_size, path))
+
+            if max_bytes is not None:
+                total = sum(size for _, size, _ in live)
+                for _, size, path in sorted(live):
+                    if total <= max_bytes:
+                        break
+                    with contextlib.suppress(OSError):
+                        os.unlink(path)
+                        evicted += 1
+                    total -= size
+
+            self.stats.record("expirations", expired)
+            self.stats.record("evictions", evicted)
+            return expired + evicted
+        finally:
+            self._prune_lock.release()
+
+    def clear(self) -> None:
+        """Clear all cached data."""
+        for path in self._entries():
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+
+    def size(self) -> int:
+        """
+        Get the number of stored entries, including expired ones not yet pruned.
+
+        Returns:
+            Number of entry files
+        """
+        return len(self._entries())
+
+    def _usage(self) -> tuple[int | None, int | None]:
+        """Get the number of entry files and their total size on disk."""
+        count = nbytes = 0
+        for path in self._entries():
+            with contextlib.suppress(OSError):
+                nbytes += os.stat(path).st_size
+                count += 1
+        return count, nbytes
+
+
+class TieredCache(CacheBackend):
+    """
+    Two-tier cache: a fast in-process L1 in front of a persistent L2.
+
+    Reads check L1 first, then L2; L2 hits are promoted into L1. Writes go
+    through to both tiers. L1 entries are kept for at most ``l1_ttl``
+    seconds, so hot entries are served from memory while the long tail lives
+    in L2 and survives restarts.
+
+    get_stats() counts lookups across both tiers and reports L2's entries
+    and size; ``l1.get_stats()`` and ``l2.get_stats()`` show each tier.
+
+    Example:
+        from scrython.cache import SQLiteCache, TieredCache, set_global_cache
+
+        set_global_cache(TieredCache(SQLiteCache('/var/cache/scrython.db')))
+    """
+
+    def __init__(
+        self,
+        l2: CacheBackend,
+        l1: CacheBackend | None = None,
+        l1_ttl: int | float = 300,
+        l2_ttl: int | float | None = None,
+    ) -> None:
+        """
+        Initialize a two-tier cache.
+
+        Args:
+            l2: Persistent (or shared) backend, e.g. SQLiteCache or FileCache
+            l1: In-process backend. Default: a new MemoryCache().
+            l1_ttl: Maximum seconds an entry stays in L1, for writes and for
+                    promotions from L2 (whose remaining lifetime is unknown).
+                    Default: 300.
+            l2_ttl: TTL for L2 writes, or None to use the TTL of each set()
+                    (default).
+        """
+        self.l1 = l1 if l1 is not None else MemoryCache()
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.l2_ttl = l2_ttl
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Retrieve cached data from L1, falling back to (and promoting from) L2.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Cached data dictionary if found and valid, None otherwise
+        """
+        data = self.l1.get(key)
+        if data is None:
+            data = self.l2.get(key)
+            if data is not None:
+                self.l1.set(key, data, self.l1_ttl)
+
+        self.stats.record("misses" if data is None else "hits")
+        return data
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """
+        Retrieve an entry from L1, falling back to (and promoting from) L2.
+
+        If neither tier has a fresh entry, the later-expiring stale one is
+        returned.
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            CacheEntry if either tier holds the entry, None otherwise
+        """
+        entry = self._get_entry(key)
+        self._record_lookup(entry)
+        return entry
+
+    def _get_entry(self, key: str) -> CacheEntry | None:
+        """Find the freshest entry in either tier, promoting fresh L2 entries."""
+        l1_entry = self.l1.get_entry(key)
+        if l1_entry is not None and l1_entry.stale_for() < 0:
+            return l1_entry
+
+        l2_entry = self.l2.get_entry(key)
+        if l2_entry is not None and l2_entry.stale_for() < 0:
+            self.l1.set_entry(
+                key,
+                l2_entry.data,
+                min(self.l1_ttl, -l2_entry.stale_for()),
+                l2_entry.validators,
+            )
+            return l2_entry
+
+        entries = [entry for entry in (l1_entry, l2_entry) if entry is not None]
+        return max(entries, key=lambda entry: entry.expires_at, default=None)
+
+    def set(self, key: str, data: dict[str, Any], ttl: int | float) -> None:
+        """
+        Store data in both tiers.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds; L1 uses at most l1_ttl
+        """
+        self.set_entry(key, data, ttl)
+
+    def set_entry(
+        self,
+        key: str,
+        data: dict[str, Any],
+        ttl: int | float,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Store data and HTTP validators in both tiers.
+
+        Args:
+            key: Cache key to store under
+            data: Data dictionary to cache
+            ttl: Time-to-live in seconds; L1 uses at most l1_ttl
+            validators: Validator headers, e.g. {'ETag': '"abc"'}, or None
+        """
+        self.l2.set_entry(key, data, self.l2_ttl if self.l2_ttl is not None else ttl, validators)
+        self.l1.set_entry(key, data, min(ttl, self.l1_ttl), validators)
+        self.stats.record("sets")
+
+    def clear(self) -> None:
+        """Clear both tiers."""
+        self.l1.clear()
+        self.l2.clear()
+
+    def _usage(self) -> tuple[int | None, int | None]:
+        """Get L2's usage, which holds every entry."""
+        return self.l2._usage()
+
 
 def generate_cache_key(endpoint: str, params: dict[str, Any]) -> str:
     """
@@ -140,22 +1322,42 @@ def generate_cache_key(endpoint: str, params: dict[str, Any]) -> str:
 
 
 # Global cache instance
-_global_cache: MemoryCache | None = None
+_global_cache: CacheBackend | None = None
 _cache_lock = threading.Lock()
 
 
-def get_global_cache() -> MemoryCache:
+def get_global_cache() -> CacheBackend:
     """
     Get or create the global cache instance.
 
     Returns:
-        The global MemoryCache instance
+        The global cache (a MemoryCache with default limits unless replaced
+        with set_global_cache())
+    """
+    global _global_cache
+    # Double-checked: only the first call takes the lock
+    cache = _global_cache
+    if cache is None:
+        with _cache_lock:
+            if _global_cache is None:
+                _global_cache = MemoryCache()
+            cache = _global_cache
+    return cache
+
+
+def set_global_cache(cache: CacheBackend) -> None:
+    """
+    Replace the global cache used by requests made with ``cache=True``.
+
+    Args:
+        cache: The cache backend to use
+
+    Example:
+        set_global_cache(MemoryCache(max_entries=50_000, max_bytes=256 * 1024 * 1024))
     """
     global _global_cache
     with _cache_lock:
-        if _global_cache is None:
-            _global_cache = MemoryCache()
-        return _global_cache
+        _global_cache = cache
 
 
 def reset_global_cache() -> None:
@@ -0,0 +1,279 @@
+"""Per-endpoint cache TTL policies.
+
+Scryfall data changes at very different rates: catalogs, sets and symbology
+change a few times a week at most, card data changes with each bulk-data
+update, and a random card must never be served from the cache. TTLPolicy
+maps request-handler classes and endpoint path patterns to a TTL, so
+slow-changing data is cached automatically for as long as it stays valid
+and callers don't need to pass ``cache=True, cache_ttl=...`` everywhere.
+"""
+
+import datetime
+import fnmatch
+import math
+import threading
+import time
+import urllib.parse
+from typing import Any, ClassVar, Literal
+
+# Special TTLs: never cache, and cache until the next bulk-data update
+NEVER: Literal["never"] = "never"
+UNTIL_BULK_UPDATE: Literal["until_bulk_update"] = "until_bulk_update"
+
+TTL = float | Literal["never", "until_bulk_update"]
+
+# Default TTL when caching is requested and no rule matches
+DEFAULT_TTL = 3600.0
+
+# Default rules, as (handler class or endpoint path pattern, TTL)
+DEFAULT_TTL_RULES: tuple[tuple[type | str, TTL], ...] = (
+    ("cards/random", NEVER),
+    ("cards/*/rulings", UNTIL_BULK_UPDATE),
+    ("catalog/*", 86400.0),
+    ("sets", 86400.0),
+    ("sets/*", 86400.0),
+    ("symbology", 86400.0),
+    ("symbology/*", 86400.0),
+    ("migrations", 86400.0),
+    ("migrations/*", 86400.0),
+)
+
+
+def _parse_timestamp(value: Any) -> float | None:
+    """Parse an ISO 8601 timestamp (as in bulk data updated_at) to a Unix time."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+class TTLPolicy:
+    """
+    Decides whether and for how long each request is cached.
+
+    Rules map a request-handler class (matching it and its subclasses) or
+    an fnmatch pattern on the endpoint path (e.g. ``'catalog/*'``) to a TTL
+    in seconds, NEVER or UNTIL_BULK_UPDATE. Rules added later take priority.
+
+    For each request:
+
+    - ``cache=False`` disables caching.
+    - A matching NEVER rule disables caching, even with ``cache=True``.
+    - Otherwise, a matching rule enables caching even without ``cache=True``.
+    - Without a matching rule, only ``cache=True`` enables caching, with
+      ``default_ttl``.
+    - An explicit ``cache_ttl`` always overrides the rule's TTL.
+
+    NEVER also marks an endpoint as not shareable: concurrent identical
+    requests to it (e.g. ``cards/random``) are each sent, instead of sharing
+    one in-flight request (see scrython.singleflight).
+
+    UNTIL_BULK_UPDATE entries expire when Scryfall's bulk data is next
+    expected to update: ``bulk_update_interval`` after the latest bulk-data
+    ``updated_at`` seen in a response (or after ``bulk_update_interval``
+    seconds if none has been seen yet).
+
+    Example:
+        from scrython.cache_policy import NEVER, UNTIL_BULK_UPDATE, TTLPolicy
+
+        policy = TTLPolicy.get_global_policy()
+        policy.register('cards/*', UNTIL_BULK_UPDATE)
+        policy.register(scrython.cards.Search, 600)
+        policy.register('bulk-data*', NEVER)
+    """
+
+    # Class-level (global) policy shared across all requests
+    _global_policy: ClassVar["TTLPolicy | None"] = None
+    _global_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        rules: tuple[tuple[type | str, TTL], ...] | None = DEFAULT_TTL_RULES,
+        default_ttl: float = DEFAULT_TTL,
+        bulk_update_interval: float = 12 * 3600,
+    ) -> None:
+        """
+        Initialize a TTL policy.
+
+        Args:
+            rules: Initial (handler class or path pattern, TTL) rules, lowest
+                   priority first. Default: DEFAULT_TTL_RULES. Pass None or ()
+                   for no rules.
+            default_ttl: TTL for ``cache=True`` requests no rule matches.
+                         Default: 3600.
+            bulk_update_interval: Seconds between Scryfall bulk-data updates.
+                                  Default: 12 hours.
+        """
+        self.default_ttl = default_ttl
+        self.bulk_update_interval = bulk_update_interval
+        self._rules: list[tuple[type | str, TTL]] = []
+        self._last_bulk_update: float | None = None
+        self._lock = threading.Lock()
+
+        for target, ttl in rules or ():
+            self.register(target, ttl)
+
+    def register(self, target: type | str, ttl: TTL) -> None:
+        """
+        Add a rule, taking priority over existing ones.
+
+        Args:
+            target: A request-handler class, or an fnmatch pattern matched
+                    against the endpoint path (leading '/' optional)
+            ttl: Seconds, NEVER or UNTIL_BULK_UPDATE
+
+        Raises:
+            ValueError: If ttl is not a non-negative number, NEVER or UNTIL_BULK_UPDATE
+        """
+        if ttl not in (NEVER, UNTIL_BULK_UPDATE) and not (
+            isinstance(ttl, (int, float)) and ttl >= 0
+        ):
+            raise ValueError(f"Invalid TTL {ttl!r}; use seconds, NEVER or UNTIL_BULK_UPDATE")
+
+        if isinstance(target, str):
+            target = target.lstrip("/")
+        with self._lock:
+            self._rules.insert(0, (target, ttl))
+
+    def match(self, handler: object, url: str) -> TTL | None:
+        """
+        Find the TTL of the highest-priority rule matching a request.
+
+        Args:
+            handler: The request handler making the request
+            url: Full URL of the request
+
+        Returns:
+            The rule's TTL, or None if no rule matches
+        """
+        path = urllib.parse.urlsplit(url).path.lstrip("/")
+        with self._lock:
+            rules = list(self._rules)
+
+        for target, ttl in rules:
+            if isinstance(target, str):
+                if fnmatch.fnmatchcase(path, target):
+                    return ttl
+            elif isinstance(handler, target):
+                return ttl
+        return None
+
+    def shareable(self, handler: object, url: str) -> bool:
+        """
+        Decide whether concurrent identical requests may share one response.
+
+        Args:
+            handler: The request handler making the request
+            url: Full URL of the request
+
+        Returns:
+            False if a NEVER rule matches (each call wants its own response)
+        """
+        return self.match(handler, url) != NEVER
+
+    def ttl_for(self, handler: object, url: str, **kwargs: Any) -> float | None:
+        """
+        Decide whether and for how long to cache a request.
+
+        Args:
+            handler: The request handler making the request
+            url: Full URL of the request
+            **kwargs: The request's options (cache, cache_ttl)
+
+        Returns:
+            TTL in seconds, or None if the request shouldn't be cached
+        """
+        cache = kwargs.get("cache")
+        if cache is False:
+            return None
+
+        ttl = self.match(handler, url)
+        if ttl == NEVER or (ttl is None and not cache):
+            return None
+
+        if kwargs.get("cache_ttl") is not None:
+            return kwargs["cache_ttl"]
+        if ttl is None:
+            return self.default_ttl
+        if ttl == UNTIL_BULK_UPDATE:
+            return self.bulk_update_ttl()
+        return float(ttl)
+
+    def bulk_update_ttl(self) -> float:
+        """
+        Get the seconds until the next expected bulk-data update.
+
+        Returns:
+            Seconds until the next update after the latest one seen, or
+            bulk_update_interval if none has been seen
+        """
+        with self._lock:
+            last = self._last_bulk_update
+        if last is None:
+            return self.bulk_update_interval
+
+        # Updates keep to their schedule, so skip any we haven't seen
+        elapsed = time.time() - last
+        periods = max(1, math.ceil(elapsed / self.bulk_update_interval))
+        return last + periods * self.bulk_update_interval - time.time()
+
+    def record_bulk_update(self, data: dict[str, Any]) -> None:
+        """
+        Note the bulk-data update times in a response, if it has any.
+
+        Args:
+            data: Parsed API response (bulk_data objects and lists of them are used)
+        """
+        items = data.get("data") if data.get("object") == "list" else [data]
+        if not items or not isinstance(items[0], dict) or items[0].get("object") != "bulk_data":
+            return
+
+        times = [_parse_timestamp(item.get("updated_at")) for item in items]
+        latest = max((t for t in times if t is not None), default=None)
+        if latest is None:
+            return
+
+        with self._lock:
+            if self._last_bulk_update is None or latest > self._last_bulk_update:
+                self._last_bulk_update = latest
+
+    @classmethod
+    def get_global_policy(cls) -> "TTLPolicy":
+        """
+        Get or create the global TTL policy.
+
+        Returns:
+            The global TTLPolicy instance
+        """
+        # Double-checked: only the first call takes the lock
+        policy = cls._global_policy
+        if policy is None:
+            with cls._global_lock:
+                if cls._global_policy is None:
+                    cls._global_policy = cls()
+                policy = cls._global_policy
+        return policy
+
+    @classmethod
+    def set_global_policy(cls, policy: "TTLPolicy") -> None:
+        """
+        Replace the global TTL policy used by all requests.
+
+        Args:
+            policy: The TTLPolicy to use
+        """
+        with cls._global_lock:
+            cls._global_policy = policy
+
+    @classmethod
+    def reset_global_policy(cls) -> None:
+        """
+        Reset the global TTL policy.
+
+        This is primarily useful for testing to ensure a clean state
+        between test runs.
+        """
+        with cls._global_lock:
+            cls._global_policy = None
@@ -0,0 +1,187 @@
+"""Cache hit/miss statistics.
+
+Every cache backend counts its lookups, writes, expirations and evictions
+in a CacheStats, and requests add a per-endpoint breakdown of their cache
+lookups, so TTLs and cache sizes can be tuned from measurements.
+"""
+
+import itertools
+import threading
+import weakref
+from typing import NamedTuple
+
+# Counters kept for every backend
+COUNTERS = ("hits", "misses", "stale_hits", "sets", "expirations", "evictions")
+
+# Lookup outcomes kept per endpoint
+LOOKUP_OUTCOMES = ("hits", "misses", "stale_hits")
+
+
+class CacheStatsSnapshot(NamedTuple):
+    """A point-in-time copy of a cache's statistics."""
+
+    # Lookups that found a fresh entry
+    hits: int
+    # Lookups that found nothing usable
+    misses: int
+    # Lookups that found an expired entry still kept for serving stale
+    stale_hits: int
+    # Entries stored
+    sets: int
+    # Entries removed because they expired
+    expirations: int
+    # Unexpired entries removed to stay within size limits
+    evictions: int
+    # Entries currently stored, or None if the backend can't tell
+    entries: int | None
+    # Approximate size of the stored data in bytes, or None if not tracked
+    bytes: int | None
+    # Lookup outcomes by endpoint, e.g. {'cards/named': {'hits': 3, ...}}
+    endpoints: dict[str, dict[str, int]]
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups."""
+        return self.hits + self.misses + self.stale_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that found a fresh entry (0.0 with no lookups)."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+EndpointCounts = dict[str, dict[str, int]]
+
+
+class _ThreadCounts:
+    """One thread's per-endpoint lookup counts (see CacheStats.record_lookup())."""
+
+    __slots__ = ("token", "generation", "endpoints", "__weakref__")
+
+    def __init__(self, token: int, generation: int) -> None:
+        self.token = token
+        self.generation = generation
+        self.endpoints: EndpointCounts = {}
+
+
+def _merge(total: EndpointCounts, endpoints: EndpointCounts) -> None:
+    """Add one set of per-endpoint counts into another."""
+    for endpoint, counts in list(endpoints.items()):
+        merged = total.setdefault(endpoint, dict.fromkeys(LOOKUP_OUTCOMES, 0))
+        for outcome, count in list(counts.items()):
+            merged[outcome] += count
+
+
+def _retire(
+    token: int,
+    lock: threading.Lock,
+    live: dict[int, EndpointCounts],
+    retired: EndpointCounts,
+) -> None:
+    """Finalizer for _ThreadCounts: fold an exited thread's counts into the total."""
+    with lock:
+        endpoints = live.pop(token, None)
+        if endpoints is not None:
+            _merge(retired, endpoints)
+
+
+class CacheStats:
+    """
+    Thread-safe counters for one cache backend.
+
+    Backends record their own events; ScrythonRequestHandler records each
+    request's lookup outcome under its endpoint (the handler's path
+    template, e.g. ``'cards/:code/:number/:lang?'``). Those per-request
+    counts are kept per thread and merged by snapshot(), so concurrent
+    requests don't contend on one lock.
+
+    Example:
+        from scrython.cache import get_global_cache
+
+        stats = get_global_cache().get_stats()
+        print(f"{stats.hit_rate:.0%} of {stats.lookups} lookups hit")
+        for endpoint, counts in stats.endpoints.items():
+            print(endpoint, counts['misses'])
+
+        get_global_cache().reset_stats()
+    """
+
+    def __init__(self) -> None:
+        """Initialize all counters to zero."""
+        self._counts = dict.fromkeys(COUNTERS, 0)
+        self._lock = threading.Lock()
+        # Per-endpoint counts: each thread's own, and those of exited threads
+        self._local = threading.local()
+        self._live: dict[int, EndpointCounts] = {}
+        self._retired: EndpointCounts = {}
+        self._tokens = itertools.count()
+        # Bumped by reset(), so threads start over without sharing a lock
+        self._generation = 0
+
+    def _thread_counts(self) -> EndpointCounts:
+        """Get this thread's per-endpoint counts, registering them on first use."""
+        counts: _ThreadCounts | None = getattr(self._local, "counts", None)
+        if counts is None or counts.generation != self._generation:
+            with self._lock:
+                counts = _ThreadCounts(next(self._tokens), self._generation)
+                self._live[counts.token] = counts.endpoints
+            weakref.finalize(counts, _retire, counts.token, self._lock, self._live, self._retired)
+            # Replacing an outdated holder runs its finalizer, so keep this outside the lock
+            self._local.counts = counts
+        return counts.endpoints
+
+    def record(self, counter: str, count: int = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            counter: One of COUNTERS
+            count: Amount to add. Default: 1.
+        """
+        with self._lock:
+            self._counts[counter] += count
+
+    def record_lookup(self, endpoint: str, outcome: str) -> None:
+        """
+        Count a request's cache lookup under its endpoint.
+
+        Args:
+            endpoint: Endpoint label, e.g. 'cards/named'
+            outcome: One of LOOKUP_OUTCOMES
+        """
+        endpoints = self._thread_counts()
+        counts = endpoints.get(endpoint)
+        if counts is None:
+            counts = endpoints[endpoint] = dict.fromkeys(LOOKUP_OUTCOMES, 0)
+        counts[outcome] += 1
+
+    def snapshot(self, entries: int | None = None, nbytes: int | None = None) -> CacheStatsSnapshot:
+        """
+        Copy the current counters.
+
+        Args:
+            entries: Number of stored entries to report, if known
+            nbytes: Size of the stored data to report, if known
+
+        Returns:
+            CacheStatsSnapshot of the counters
+        """
+        with self._lock:
+            endpoints: EndpointCounts = {}
+            _merge(endpoints, self._retired)
+            for thread_endpoints in self._live.values():
+                _merge(endpoints, thread_endpoints)
+            return CacheStatsSnapshot(
+                **self._counts,
+                entries=entries,
+                bytes=nbytes,
+                endpoints=endpoints,
+            )
+
+    def reset(self) -> None:
+        """Set all counters back to zero."""
+        with self._lock:
+            self._counts = dict.fromkeys(COUNTERS, 0)
+            self._live.clear()
+            self._retired.clear()
+            self._generation += 1
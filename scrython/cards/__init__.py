@@ -13,6 +13,7 @@ from .cards import (
     Random,
     Search,
 )
+from .loader import CardLoader, get_global_loader, reset_global_loader, set_global_loader
 
 __all__ = [
     "Object",
@@ -28,4 +29,8 @@ __all__ = [
     "ByTCGPlayerId",
     "ByCardMarketId",
     "ById",
+    "CardLoader",
+    "get_global_loader",
+    "set_global_loader",
+    "reset_global_loader",
 ]
@@ -1,7 +1,13 @@
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 from ..base import ScrythonRequestHandler
 from ..base_mixins import ScryfallCatalogMixin, ScryfallListMixin
+from ..cache import generate_cache_key
 from ..types import ScryfallCardData
 from .cards_mixins import CardsObjectMixin
+from .loader import CollectionCoalescingMixin, identifier_key
 
 
 class Object(CardsObjectMixin):
@@ -161,7 +167,7 @@ class Search(ScryfallListMixin, ScrythonRequestHandler):
     list_data_type = Object
 
 
-class Named(CardsObjectMixin, ScrythonRequestHandler):
+class Named(CollectionCoalescingMixin, CardsObjectMixin, ScrythonRequestHandler):
     """
     Get a single card by name using fuzzy or exact matching.
 
@@ -175,6 +181,8 @@ class Named(CardsObjectMixin, ScrythonRequestHandler):
         fuzzy: A fuzzy card name to search for (optional, mutually exclusive with exact).
         exact: The exact card name to search for (optional, mutually exclusive with fuzzy).
         set: A set code to limit the search to a specific set (optional).
+        coalesce: If True, batch this lookup with concurrent ones into a single
+            /cards/collection request via the global CardLoader (optional).
 
     Example:
         # Fuzzy search (handles typos)
@@ -189,6 +197,9 @@ class Named(CardsObjectMixin, ScrythonRequestHandler):
     """
 
     _endpoint = "/cards/named"
+    _collection_identifier = {"name": "exact"}
+    _collection_identifier_optional = {"set": "set"}
+    _entity_identifier = {"name": "exact", "set": "set"}
 
 
 class Autocomplete(ScryfallCatalogMixin, ScrythonRequestHandler):
@@ -252,13 +263,18 @@ class Collection(ScryfallListMixin, ScrythonRequestHandler):
 
     Endpoint: POST /cards/collection
 
-    Returns a list of Card objects matching the provided identifiers. Accepts up to
-    75 card identifiers per request. Useful for fetching specific cards in bulk.
+    Returns a list of Card objects matching the provided identifiers. Scryfall
+    accepts up to 75 identifiers per request; longer lists are de-duplicated,
+    split into chunks of 75 and sent concurrently (still through the global rate
+    limiter), then merged into a single list in input order with a combined
+    not_found.
 
     Args:
         data: A dict with 'identifiers' key containing a list of identifier dicts.
             Each identifier dict can contain: id, mtgo_id, multiverse_id, oracle_id,
             illustration_id, name, set+collector_number, etc.
+        max_workers: Maximum number of chunk requests in flight at once when more
+            than 75 identifiers are given (optional, default: 4).
 
     Example:
         # Fetch multiple cards by ID
@@ -272,14 +288,79 @@ class Collection(ScryfallListMixin, ScrythonRequestHandler):
         for card in cards.data:
             print(f"{card.name} - {card.set}")
 
+        # Any number of identifiers
+        inventory = scrython.cards.Collection(data={'identifiers': ten_thousand_ids})
+        print(f"{len(inventory.data)} found, {len(inventory.not_found)} missing")
+
     See: https://scryfall.com/docs/api/cards/collection
     """
 
     _endpoint = "/cards/collection"
     list_data_type = Object
+    max_identifiers = 75
+
+    @property
+    def not_found(self) -> list[dict[str, Any]]:
+        """Identifiers that didn't match any card."""
+        return self._scryfall_data.get("not_found", [])
+
+    def _fetch(self, **kwargs: Any) -> None:
+        data = kwargs.get("data") or {}
+        identifiers = data.get("identifiers")
+        if not isinstance(identifiers, list):
+            super()._fetch(**kwargs)
+            return
+
+        unique: dict[Any, dict[str, Any]] = {}
+        for identifier in identifiers:
+            unique.setdefault(identifier_key(identifier), identifier)
+
+        if len(unique) == len(identifiers) and len(identifiers) <= self.max_identifiers:
+            super()._fetch(**kwargs)
+            return
+
+        deduped = list(unique.values())
+        chunks = [
+            deduped[i : i + self.max_identifiers]
+            for i in range(0, len(deduped), self.max_identifiers)
+        ]
 
-
-class ByCodeNumber(CardsObjectMixin, ScrythonRequestHandler):
+        def fetch_chunk(chunk: list[dict[str, Any]]) -> dict[str, Any]:
+            chunk_data = {**data, "identifiers": chunk}
+            params = {**self._query_params, "data": chunk_data}
+            url = f"https://api.scryfall.com/{self.endpoint}?{urllib.parse.urlencode(params)}"
+            cache_key = generate_cache_key(self.endpoint, params)
+            return self._fetch_raw(url, cache_key=cache_key, **{**kwargs, "data": chunk_data})
+
+        max_workers = kwargs.get("max_workers", 4)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            responses = list(executor.map(fetch_chunk, chunks))
+
+        merged: dict[str, Any] = {
+            "object": "list",
+            "not_found": [],
+            "data": [],
+            "has_more": False,
+        }
+        warnings: list[str] = []
+        for response in responses:
+            if response.get("object") == "error":
+                merged = response
+                break
+            merged["not_found"].extend(response.get("not_found", []))
+            merged["data"].extend(response.get("data", []))
+            warnings.extend(response.get("warnings") or [])
+        else:
+            if warnings:
+                merged["warnings"] = warnings
+
+        self._scryfall_data = merged
+
+        if hasattr(self, "_scryfall_namespace"):
+            delattr(self, "_scryfall_namespace")
+
+
+class ByCodeNumber(CollectionCoalescingMixin, CardsObjectMixin, ScrythonRequestHandler):
     """
     Get a card by its set code and collector number.
 
@@ -292,6 +373,8 @@ class ByCodeNumber(CardsObjectMixin, ScrythonRequestHandler):
         code: The three-to-five-letter set code (required).
         number: The collector number (required, can include letters like "123a").
         lang: The 2-3 character language code (optional, default: 'en').
+        coalesce: If True, batch this lookup with concurrent ones into a single
+            /cards/collection request via the global CardLoader (optional).
 
     Example:
         # Get a specific card from a set
@@ -305,9 +388,12 @@ class ByCodeNumber(CardsObjectMixin, ScrythonRequestHandler):
     """
 
     _endpoint = "/cards/:code/:number/:lang?"
+    _collection_identifier = {"set": "code", "collector_number": "number"}
+    _entity_identifier = {"set": "code", "collector_number": "number"}
+    _entity_identifier_optional = {"lang": "lang"}
 
 
-class ByMultiverseId(CardsObjectMixin, ScrythonRequestHandler):
+class ByMultiverseId(CollectionCoalescingMixin, CardsObjectMixin, ScrythonRequestHandler):
     """
     Get a card by its Multiverse ID.
 
@@ -318,6 +404,8 @@ class ByMultiverseId(CardsObjectMixin, ScrythonRequestHandler):
 
     Args:
         id: The Multiverse ID (required).
+        coalesce: If True, batch this lookup with concurrent ones into a single
+            /cards/collection request via the global CardLoader (optional).
 
     Example:
         card = scrython.cards.ByMultiverseId(id=456789)
@@ -327,9 +415,11 @@ class ByMultiverseId(CardsObjectMixin, ScrythonRequestHandler):
     """
 
     _endpoint = "/cards/multiverse/:id"
+    _collection_identifier = {"multiverse_id": "id"}
+    _entity_identifier = {"multiverse_id": "id"}
 
 
-class ByMTGOId(CardsObjectMixin, ScrythonRequestHandler):
+class ByMTGOId(CollectionCoalescingMixin, CardsObjectMixin, ScrythonRequestHandler):
     """
     Get a card by its Magic Online (MTGO) ID.
 
@@ -340,6 +430,8 @@ class ByMTGOId(CardsObjectMixin, ScrythonRequestHandler):
 
     Args:
         id: The MTGO ID (required).
+        coalesce: If True, batch this lookup with concurrent ones into a single
+            /cards/collection request via the global CardLoader (optional).
 
     Example:
         card = scrython.cards.ByMTGOId(id=67890)
@@ -349,6 +441,8 @@ class ByMTGOId(CardsObjectMixin, ScrythonRequestHandler):
     """
 
     _endpoint = "/cards/mtgo/:id"
+    _collection_identifier = {"mtgo_id": "id"}
+    _entity_identifier = {"mtgo_id": "id"}
 
 
 class ByArenaId(CardsObjectMixin, ScrythonRequestHandler):
@@ -371,6 +465,7 @@ class ByArenaId(CardsObjectMixin, ScrythonRequestHandler):
     """
 
     _endpoint = "/cards/arena/:id"
+    _entity_identifier = {"arena_id": "id"}
 
 
 class ByTCGPlayerId(CardsObjectMixin, ScrythonRequestHandler):
@@ -393,6 +488,7 @@ class ByTCGPlayerId(CardsObjectMixin, ScrythonRequestHandler):
     """
 
     _endpoint = "/cards/tcgplayer/:id"
+    _entity_identifier = {"tcgplayer_id": "id"}
 
 
 class ByCardMarketId(CardsObjectMixin, ScrythonRequestHandler):
@@ -415,9 +511,10 @@ class ByCardMarketId(CardsObjectMixin, ScrythonRequestHandler):
     """
 
     _endpoint = "/cards/cardmarket/:id"
+    _entity_identifier = {"cardmarket_id": "id"}
 
 
-class ById(CardsObjectMixin, ScrythonRequestHandler):
+class ById(CollectionCoalescingMixin, CardsObjectMixin, ScrythonRequestHandler):
     """
     Get a card by its Scryfall ID.
 
@@ -428,6 +525,8 @@ class ById(CardsObjectMixin, ScrythonRequestHandler):
 
     Args:
         id: The Scryfall UUID (required).
+        coalesce: If True, batch this lookup with concurrent ones into a single
+            /cards/collection request via the global CardLoader (optional).
 
     Example:
         card = scrython.cards.ById(id='5f8287b1-5bb6-4e8f-9d78-8f3e3b3e1c6d')
@@ -437,3 +536,5 @@ class ById(CardsObjectMixin, ScrythonRequestHandler):
     """
 
     _endpoint = "/cards/:id"
+    _collection_identifier = {"id": "id"}
+    _entity_identifier = {"id": "id"}
@@ -0,0 +1,430 @@
+"""Coalescing of single-card lookups into /cards/collection requests.
+
+When many threads look up individual cards at about the same time, each
+lookup normally costs one rate-limited request. CardLoader collects those
+lookups over a short window and resolves up to 75 of them with a single
+Collection POST, handing each caller its own card (or a not-found error).
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, ClassVar
+
+from ..base import CLIENT_OPTIONS, ScryfallError
+
+# Identifier shapes accepted by POST /cards/collection
+_IDENTIFIER_SHAPES = (
+    frozenset({"id"}),
+    frozenset({"mtgo_id"}),
+    frozenset({"multiverse_id"}),
+    frozenset({"oracle_id"}),
+    frozenset({"illustration_id"}),
+    frozenset({"name"}),
+    frozenset({"name", "set"}),
+    frozenset({"set", "collector_number"}),
+)
+
+IdentifierKey = tuple[tuple[str, str], ...]
+OptionsKey = tuple[tuple[str, str], ...]
+
+# Per-call options a coalesced lookup passes on to its Collection request
+_FORWARDED_OPTIONS = CLIENT_OPTIONS - {"coalesce", "single_flight"}
+
+
+def identifier_key(identifier: dict[str, Any]) -> IdentifierKey:
+    """
+    Build a hashable, normalized key for a collection identifier.
+
+    Values are compared as strings, and names and set codes case-insensitively,
+    matching how Scryfall echoes identifiers back in ``not_found``.
+
+    Args:
+        identifier: A collection identifier dict (e.g. {'id': '...'})
+
+    Returns:
+        Sorted tuple of (field, normalized value) pairs
+    """
+    normalized = []
+    for field, value in identifier.items():
+        value = str(value)
+        if field in ("name", "set"):
+            value = value.casefold()
+        normalized.append((field, value))
+    return tuple(sorted(normalized))
+
+
+def _card_faces(card: dict[str, Any]) -> list[dict[str, Any]]:
+    return [card, *card.get("card_faces", [])]
+
+
+def identifier_matches(identifier: dict[str, Any], card: dict[str, Any]) -> bool:
+    """
+    Check whether a card object satisfies a collection identifier.
+
+    Args:
+        identifier: A collection identifier dict
+        card: A Scryfall card object dict
+
+    Returns:
+        True if every field of the identifier matches the card
+    """
+    for field, value in identifier.items():
+        value = str(value)
+        if field == "id":
+            matched = card.get("id") == value
+        elif field == "mtgo_id":
+            matched = value in (str(card.get("mtgo_id")), str(card.get("mtgo_foil_id")))
+        elif field == "multiverse_id":
+            matched = value in [str(v) for v in card.get("multiverse_ids") or []]
+        elif field in ("oracle_id", "illustration_id"):
+            matched = any(str(face.get(field)) == value for face in _card_faces(card))
+        elif field == "name":
+            matched = any(
+                str(face.get("name", "")).casefold() == value.casefold()
+                for face in _card_faces(card)
+            )
+        elif field == "set":
+            matched = str(card.get("set", "")).casefold() == value.casefold()
+        elif field == "collector_number":
+            matched = str(card.get("collector_number")) == value
+        else:
+            matched = False
+
+        if not matched:
+            return False
+    return True
+
+
+def _not_found_error(identifier: dict[str, Any]) -> ScryfallError:
+    details = f"No card found matching identifier {identifier}"
+    return ScryfallError(
+        {
+            "object": "error",
+            "status": 404,
+            "code": "not_found",
+            "details": details,
+            "type": None,
+            "warnings": None,
+        },
+        details,
+    )
+
+
+_Lookup = tuple[dict[str, Any], list[Future]]
+_Group = tuple[dict[str, Any], dict[IdentifierKey, _Lookup]]
+
+
+def _options_key(options: dict[str, Any]) -> OptionsKey:
+    """Build a hashable key for a lookup's request options."""
+    return tuple(sorted((name, repr(value)) for name, value in options.items()))
+
+
+class CardLoader:
+    """
+    Batches single-card lookups into /cards/collection requests.
+
+    Lookups made within ``window`` seconds of each other are sent together
+    (up to 75 per request, Scryfall's collection limit). Identical lookups in
+    the same batch share one identifier. Each caller receives a Future that
+    resolves to a cards.Object, or raises ScryfallError (code 'not_found')
+    if Scryfall could not find the card. Lookups with different request
+    options (see load()) are batched separately.
+
+    Example:
+        loader = CardLoader()
+
+        # In many threads at once:
+        card = loader.get(id='5f8287b1-5bb6-4e8f-9d78-8f3e3b3e1c6d')
+        card = loader.get(set='lea', collector_number='161')
+
+        # Or collect futures without blocking:
+        futures = [loader.load(name=name) for name in deck_list]
+        cards = [future.result() for future in futures]
+    """
+
+    max_batch_size: ClassVar[int] = 75
+
+    def __init__(self, window: float = 0.05, **request_kwargs: Any) -> None:
+        """
+        Initialize a loader.
+
+        Args:
+            window: Seconds to wait for more lookups after the first one in a
+                    batch arrives. Default: 0.05.
+            **request_kwargs: Options passed to each Collection request
+                              (e.g. rate_limit, rate_limit_per_second).
+        """
+        self.window = window
+        self.request_kwargs = request_kwargs
+        # Pending lookups, grouped by their request options
+        self._pending: dict[OptionsKey, _Group] = {}
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    def load(self, options: dict[str, Any] | None = None, **identifier: Any) -> Future:
+        """
+        Queue a card lookup and return a Future for its result.
+
+        Args:
+            options: Request options for this lookup's Collection request
+                     (e.g. cache, cache_ttl, retry_policy), applied over the
+                     loader's request_kwargs. Only lookups with equal options
+                     share a batch.
+            **identifier: One collection identifier: id, mtgo_id, multiverse_id,
+                          oracle_id, illustration_id, name, name + set, or
+                          set + collector_number.
+
+        Returns:
+            Future resolving to a cards.Object
+
+        Raises:
+            ValueError: If the identifier is not a valid collection identifier
+        """
+        if frozenset(identifier) not in _IDENTIFIER_SHAPES:
+            raise ValueError(
+                f"Invalid collection identifier {identifier}. Must be one of: id, mtgo_id, "
+                "multiverse_id, oracle_id, illustration_id, name, name + set, "
+                "or set + collector_number"
+            )
+
+        options = {**self.request_kwargs, **(options or {})}
+        future: Future = Future()
+        key = identifier_key(identifier)
+        group_key = _options_key(options)
+        full = None
+
+        with self._lock:
+            group = self._pending.get(group_key)
+            if group is None:
+                group = self._pending[group_key] = (options, {})
+            lookups = group[1]
+            if key in lookups:
+                lookups[key][1].append(future)
+            else:
+                lookups[key] = (identifier, [future])
+
+            if len(lookups) >= self.max_batch_size:
+                full = self._pending.pop(group_key)
+            if self._pending and self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if full is not None:
+            threading.Thread(target=self._dispatch, args=full, daemon=True).start()
+
+        return future
+
+    def get(
+        self,
+        timeout: float | None = None,
+        options: dict[str, Any] | None = None,
+        **identifier: Any,
+    ) -> Any:
+        """
+        Look up a card, blocking until its batch has been resolved.
+
+        Args:
+            timeout: Optional maximum number of seconds to wait
+            options: Request options for the Collection request (see load())
+            **identifier: One collection identifier (see load())
+
+        Returns:
+            cards.Object for the matching card
+
+        Raises:
+            ScryfallError: If the card was not found
+        """
+        return self.load(options, **identifier).result(timeout=timeout)
+
+    def flush(self) -> None:
+        """Send all pending lookups now instead of waiting for the window to close."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            groups = list(self._pending.values())
+            self._pending = {}
+
+        for options, lookups in groups:
+            self._dispatch(options, lookups)
+
+    def _dispatch(self, options: dict[str, Any], lookups: dict[IdentifierKey, _Lookup]) -> None:
+        """Resolve a batch of lookups with a single Collection request."""
+        from .cards import Collection, Object
+
+        batch = list(lookups.values())
+        identifiers = [identifier for identifier, _ in batch]
+        try:
+            response = Collection(data={"identifiers": identifiers}, **options)
+        except Exception as exc:
+            for _, futures in batch:
+                for future in futures:
+                    future.set_exception(exc)
+            return
+
+        cards = response._scryfall_data.get("data", [])
+        not_found = {identifier_key(i) for i in response._scryfall_data.get("not_found", [])}
+
+        # Scryfall returns found cards in request order, skipping the not-found
+        # ones. Only trust the position if the card there matches; otherwise
+        # look for a matching card and continue from it, and never hand out a
+        # card that doesn't match
+        position = 0
+        for identifier, futures in batch:
+            card = None
+            if identifier_key(identifier) not in not_found:
+                if position < len(cards) and identifier_matches(identifier, cards[position]):
+                    card = cards[position]
+                    position += 1
+                else:
+                    index = next(
+                        (i for i, c in enumerate(cards) if identifier_matches(identifier, c)),
+                        None,
+                    )
+                    if index is not None:
+                        card = cards[index]
+                        position = index + 1
+
+            for future in futures:
+                if card is None:
+                    future.set_exception(_not_found_error(identifier))
+                else:
+                    future.set_result(Object(card))
+
+
+class CollectionCoalescingMixin:
+    """
+    Lets single-card endpoints route their lookup through the global CardLoader.
+
+    Endpoint classes declare ``_collection_identifier``, mapping collection
+    identifier fields to their own keyword arguments, and optionally
+    ``_collection_identifier_optional`` for fields that are only included when
+    given. Passing ``coalesce=True`` then resolves the card via a batched
+    Collection request instead of a dedicated request, when the arguments can
+    be expressed as an identifier.
+    """
+
+    _collection_identifier: ClassVar[dict[str, str]] = {}
+    _collection_identifier_optional: ClassVar[dict[str, str]] = {}
+    _scryfall_data: dict[str, Any]
+    _entity_lookup: Callable[..., dict[str, Any] | None]
+
+    def _coalesce_identifier(self, **kwargs: Any) -> dict[str, Any] | None:
+        """
+        Build the collection identifier for this lookup.
+
+        Returns:
+            Identifier dict, or None if the arguments can't be coalesced
+        """
+        if not self._collection_identifier:
+            return None
+
+        identifier = {}
+        for field, kwarg in self._collection_identifier.items():
+            if kwargs.get(kwarg) is None:
+                return None
+            identifier[field] = kwargs[kwarg]
+
+        for field, kwarg in self._collection_identifier_optional.items():
+            if kwargs.get(kwarg) is not None:
+                identifier[field] = kwargs[kwarg]
+
+        # Collection identifiers can't express a specific language or format
+        if kwargs.get("lang") is not None or kwargs.get("format", "json") != "json":
+            return None
+        if kwargs.get("face") or kwargs.get("version"):
+            return None
+
+        return identifier
+
+    @staticmethod
+    def _coalesce_options(**kwargs: Any) -> dict[str, Any]:
+        """Get the per-call options to apply to the coalesced Collection request."""
+        return {name: value for name, value in kwargs.items() if name in _FORWARDED_OPTIONS}
+
+    def _fetch(self, **kwargs: Any) -> None:
+        # Cards already in the entity cache don't need to join a batch
+        if kwargs.get("coalesce") and self._entity_lookup(**kwargs) is None:
+            identifier = self._coalesce_identifier(**kwargs)
+            if identifier is not None:
+                card = get_global_loader().get(
+                    options=self._coalesce_options(**kwargs), **identifier
+                )
+                self._scryfall_data = card._scryfall_data
+                return
+
+        super()._fetch(**kwargs)  # type: ignore[misc]
+
+
+class AsyncCollectionCoalescingMixin(CollectionCoalescingMixin):
+    """
+    CollectionCoalescingMixin for the awaitable endpoints in scrython.aio.
+
+    ``coalesce=True`` lookups join the same global CardLoader batches as the
+    synchronous classes; the batch is sent from the loader's thread and its
+    result is awaited without blocking the event loop.
+    """
+
+    async def _fetch_async(self, **kwargs: Any) -> None:
+        if kwargs.get("coalesce") and self._entity_lookup(**kwargs) is None:
+            identifier = self._coalesce_identifier(**kwargs)
+            if identifier is not None:
+                future = get_global_loader().load(self._coalesce_options(**kwargs), **identifier)
+                card = await asyncio.wrap_future(future)
+                self._scryfall_data = card._scryfall_data
+                return
+
+        await super()._fetch_async(**kwargs)  # type: ignore[misc]
+
+
+# Global loader instance
+_global_loader: CardLoader | None = None
+_loader_lock = threading.Lock()
+
+
+def get_global_loader() -> CardLoader:
+    """
+    Get or create the global CardLoader used by ``coalesce=True`` lookups.
+
+    Returns:
+        The global CardLoader instance
+    """
+    global _global_loader
+    # Double-checked: only the first call takes the lock
+    loader = _global_loader
+    if loader is None:
+        with _loader_lock:
+            if _global_loader is None:
+                _global_loader = CardLoader()
+            loader = _global_loader
+    return loader
+
+
+def set_global_loader(loader: CardLoader) -> None:
+    """
+    Replace the global CardLoader, e.g. to change its window.
+
+    Args:
+        loader: The CardLoader to use for ``coalesce=True`` lookups
+    """
+    global _global_loader
+    with _loader_lock:
+        _global_loader = loader
+
+
+def reset_global_loader() -> None:
+    """
+    Reset the global CardLoader, sending any pending lookups first.
+
+    Useful for testing to ensure a clean state between tests.
+    """
+    global _global_loader
+    with _loader_lock:
+        loader = _global_loader
+        _global_loader = None
+
+    if loader is not None:
+        loader.flush()
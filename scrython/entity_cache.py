@@ -0,0 +1,285 @@
+"""Cross-endpoint cache of card objects, indexed by every identifier.
+
+The response cache is keyed by endpoint and parameters, so a card fetched
+with cards.Named is a miss for cards.ById, ByCodeNumber, ByArenaId and so
+on, and a card seen on a Search page is a miss for all of them. EntityCache
+stores each card object seen in a cached response, including the items of
+list pages and Collection results, under all of its identifiers, so any
+single-card lookup for a printing we already hold is answered locally.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+EntityKey = tuple[tuple[str, str], ...]
+
+# Identifier fields whose values are compared case-insensitively
+_CASEFOLD_FIELDS = frozenset({"name", "set"})
+
+# Single-value identifiers, mapped to the card fields that satisfy them
+_ID_FIELDS = {
+    "id": ("id",),
+    "arena_id": ("arena_id",),
+    "mtgo_id": ("mtgo_id", "mtgo_foil_id"),
+    "tcgplayer_id": ("tcgplayer_id", "tcgplayer_etched_id"),
+    "cardmarket_id": ("cardmarket_id",),
+}
+
+
+def entity_key(identifier: dict[str, Any]) -> EntityKey:
+    """
+    Build a hashable, normalized key for an identifier.
+
+    A set + collector_number identifier without a language refers to the
+    English printing, as it does for /cards/:code/:number.
+
+    Args:
+        identifier: Identifier fields and values (e.g. {'arena_id': 67330})
+
+    Returns:
+        Sorted tuple of (field, normalized value) pairs
+    """
+    if "collector_number" in identifier and identifier.get("lang") is None:
+        identifier = {**identifier, "lang": "en"}
+
+    normalized = []
+    for field, value in identifier.items():
+        value = str(value)
+        if field in _CASEFOLD_FIELDS:
+            value = value.casefold()
+        normalized.append((field, value))
+    return tuple(sorted(normalized))
+
+
+def card_keys(card: dict[str, Any], by_name: bool = False) -> list[EntityKey]:
+    """
+    Get every identifier key a card object can be looked up by.
+
+    Args:
+        card: A Scryfall card object dict
+        by_name: Also include name + set keys. Only correct for the card
+                 /cards/named returned for that name and set, since a set
+                 can hold several printings of one name.
+
+    Returns:
+        List of entity keys for the card
+    """
+    keys = []
+    for field, card_fields in _ID_FIELDS.items():
+        for card_field in card_fields:
+            if card.get(card_field) is not None:
+                keys.append(entity_key({field: card[card_field]}))
+
+    for multiverse_id in card.get("multiverse_ids") or []:
+        keys.append(entity_key({"multiverse_id": multiverse_id}))
+
+    if card.get("set") and card.get("collector_number"):
+        keys.append(
+            entity_key(
+                {
+                    "set": card["set"],
+                    "collector_number": card["collector_number"],
+                    "lang": card.get("lang", "en"),
+                }
+            )
+        )
+
+        # /cards/named returns the English printing, found by its Oracle name
+        # or any of its face names
+        if by_name and card.get("lang", "en") == "en":
+            names = {card.get("name")} | {face.get("name") for face in card.get("card_faces", [])}
+            for name in names - {None}:
+                keys.append(entity_key({"name": name, "set": card["set"]}))
+
+    return keys
+
+
+def _is_name_key(key: EntityKey) -> bool:
+    """Whether key is a name + set key."""
+    return {field for field, _ in key} == {"name", "set"}
+
+
+class EntityCache:
+    """
+    In-memory index of card objects by all of their identifiers.
+
+    Cards are added from every cached response (see ``cache=True``) and
+    answer later single-card lookups by any identifier: Scryfall id,
+    set + collector number (+ language), Arena, MTGO, Multiverse, TCGplayer
+    and Cardmarket ids, and name + set (for cards that /cards/named returned
+    for that name and set). Each card expires after the TTL of
+    the response it came from; the least recently used cards are evicted
+    once ``max_entries`` is reached.
+
+    Example:
+        scrython.cards.Search(q='set:neo', cache=True)
+
+        # Answered from the entity cache, without a request
+        card = scrython.cards.ByCodeNumber(code='neo', number='1', cache=True)
+    """
+
+    def __init__(self, max_entries: int = 50_000) -> None:
+        """
+        Initialize an entity cache.
+
+        Args:
+            max_entries: Maximum number of cards to hold. Default: 50,000.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+
+        self.max_entries = max_entries
+        self._cards: OrderedDict[str, tuple[dict[str, Any], float, list[EntityKey]]] = OrderedDict()
+        self._index: dict[EntityKey, str] = {}
+        self._lock = threading.Lock()
+
+    def add(self, card: dict[str, Any], ttl: int | float, by_name: bool = False) -> None:
+        """
+        Index a card object under all of its identifiers.
+
+        Args:
+            card: A Scryfall card object dict
+            ttl: Time-to-live in seconds
+            by_name: Also index the card by name + set, because /cards/named
+                     returned it for that set. Default: False.
+        """
+        card_id = card.get("id")
+        if card.get("object") != "card" or card_id is None:
+            return
+
+        keys = card_keys(card, by_name)
+        with self._lock:
+            previous = self._cards.get(card_id)
+            if previous is not None and not by_name:
+                # Keep the name + set keys an earlier /cards/named response gave it
+                keys += [
+                    key
+                    for key in previous[2]
+                    if _is_name_key(key) and self._index.get(key) == card_id
+                ]
+            self._remove(card_id)
+            self._cards[card_id] = (card, time.time() + ttl, keys)
+            for key in keys:
+                self._index[key] = card_id
+
+            while len(self._cards) > self.max_entries:
+                self._remove(next(iter(self._cards)))
+
+    def add_response(self, data: dict[str, Any], ttl: int | float, by_name: bool = False) -> None:
+        """
+        Index the card objects in an API response.
+
+        Args:
+            data: A card object, or a list object whose data contains cards
+            ttl: Time-to-live in seconds
+            by_name: The response is a /cards/named card requested with a set,
+                     so also index it by name + set. Default: False.
+        """
+        if data.get("object") == "card":
+            self.add(data, ttl, by_name)
+        elif data.get("object") == "list":
+            for item in data.get("data") or []:
+                if isinstance(item, dict):
+                    self.add(item, ttl)
+
+    def get(self, **identifier: Any) -> dict[str, Any] | None:
+        """
+        Look up a card by one of its identifiers.
+
+        Args:
+            **identifier: e.g. id=..., arena_id=..., set=... + collector_number=...
+                          (+ lang=...), or name=... + set=...
+
+        Returns:
+            The card object dict if held and not expired, None otherwise
+        """
+        key = entity_key(identifier)
+        with self._lock:
+            card_id = self._index.get(key)
+            if card_id is None:
+                return None
+
+            card, expiry, _ = self._cards[card_id]
+            if time.time() >= expiry:
+                self._remove(card_id)
+                return None
+
+            self._cards.move_to_end(card_id)
+            return card
+
+    def _remove(self, card_id: str) -> None:
+        """Remove a card and its index entries. Caller must hold self._lock."""
+        entry = self._cards.pop(card_id, None)
+        if entry is None:
+            return
+
+        for key in entry[2]:
+            # Another printing may have claimed the key since
+            if self._index.get(key) == card_id:
+                del self._index[key]
+
+    def clear(self) -> None:
+        """Remove all cards."""
+        with self._lock:
+            self._cards.clear()
+            self._index.clear()
+
+    def size(self) -> int:
+        """
+        Get the number of cards held (including expired ones not yet removed).
+
+        Returns:
+            Number of cards
+        """
+        with self._lock:
+            return len(self._cards)
+
+
+# Global entity cache instance
+_global_entity_cache: EntityCache | None = None
+_entity_cache_lock = threading.Lock()
+
+
+def get_global_entity_cache() -> EntityCache:
+    """
+    Get or create the global EntityCache shared by all requests.
+
+    Returns:
+        The global EntityCache instance
+    """
+    global _global_entity_cache
+    # Double-checked: only the first call takes the lock
+    cache = _global_entity_cache
+    if cache is None:
+        with _entity_cache_lock:
+            if _global_entity_cache is None:
+                _global_entity_cache = EntityCache()
+            cache = _global_entity_cache
+    return cache
+
+
+def set_global_entity_cache(cache: EntityCache) -> None:
+    """
+    Replace the global EntityCache, e.g. to change its size.
+
+    Args:
+        cache: The EntityCache to use for all requests
+    """
+    global _global_entity_cache
+    with _entity_cache_lock:
+        _global_entity_cache = cache
+
+
+def reset_global_entity_cache() -> None:
+    """
+    Reset the global EntityCache.
+
+    Useful for testing to ensure a clean state between tests.
+    """
+    global _global_entity_cache
+    with _entity_cache_lock:
+        if _global_entity_cache is not None:
+            _global_entity_cache.clear()
+        _global_entity_cache = None
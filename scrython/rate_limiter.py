@@ -2,20 +2,53 @@
 
 Scryfall requests a rate limit of 10 requests per second. This module
 provides a thread-safe rate limiter that enforces this limit by default,
-while allowing users to opt-out or customize the rate limit.
+while allowing users to opt-out or customize the rate limit, and a
+SharedRateLimiter that enforces one budget across all processes on a host.
 """
 
+import mmap
+import os
+import stat
+import struct
+import tempfile
 import threading
 import time
-from typing import ClassVar
+from collections.abc import Mapping
+from typing import ClassVar, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+_LimiterT = TypeVar("_LimiterT", bound="RateLimiter")
+
+# Scryfall's stricter limits for expensive endpoint families, in calls per second
+DEFAULT_ENDPOINT_LIMITS: dict[str, float] = {
+    "cards/search": 2.0,
+    "cards/named": 2.0,
+    "cards/random": 2.0,
+    "cards/collection": 2.0,
+}
 
 
 class RateLimiter:
     """
     Thread-safe rate limiter using token bucket algorithm.
 
-    This limiter enforces a maximum number of calls per second by tracking
-    the time between calls and sleeping if necessary to maintain the rate limit.
+    The bucket holds up to ``burst`` tokens and refills at ``calls_per_second``.
+    It is implemented as a generic cell rate algorithm (GCRA): instead of
+    counting tokens, the limiter tracks the theoretical arrival time of the
+    next call on a monotonic clock, so wall-clock adjustments can't disturb
+    the spacing.
+
+    Callers reserve a slot under the lock and then sleep outside it, so slots
+    are handed out in call order (FIFO) and waiting threads don't queue behind
+    one sleeper.
+
+    After a throttling response, penalize() cuts the rate and recover() adds
+    it back gradually on later successes (AIMD), never exceeding
+    ``calls_per_second``.
 
     The limiter is thread-safe and can be shared across multiple threads.
     """
@@ -24,44 +57,102 @@ class RateLimiter:
     _global_limiter: ClassVar["RateLimiter | None"] = None
     _global_lock: ClassVar[threading.Lock] = threading.Lock()
 
-    def __init__(self, calls_per_second: float = 10.0) -> None:
+    def __init__(self, calls_per_second: float = 10.0, burst: int = 1) -> None:
         """
         Initialize a rate limiter.
 
         Args:
             calls_per_second: Maximum number of calls allowed per second.
                              Default is 10.0 per Scryfall guidelines.
+            burst: Number of calls that may be made back-to-back after an idle
+                   period. Default is 1 (calls are always evenly spaced).
         """
+        if calls_per_second <= 0:
+            raise ValueError("calls_per_second must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
         self.calls_per_second = calls_per_second
+        self.burst = burst
         self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0.0
+        self.current_rate = calls_per_second
+        self._tat = 0.0  # Theoretical arrival time of the next call
         self.lock = threading.Lock()
 
+    def reserve(self) -> float:
+        """
+        Reserve the next slot without waiting.
+
+        Returns:
+            Seconds the caller must wait before its slot begins (0.0 if none)
+        """
+        with self.lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+            # Up to burst - 1 intervals of credit can be spent ahead of schedule
+            slot = max(now, tat - (self.burst - 1) * self.min_interval)
+            self._tat = tat + self.min_interval
+        return slot - now
+
     def wait(self) -> None:
         """
         Block until the rate limit allows the next call.
 
         This method is thread-safe and will sleep if necessary to maintain
         the configured rate limit. Multiple threads calling this method will
-        be properly synchronized.
+        be properly synchronized, and the sleep happens outside the lock.
 
         Example:
             limiter = RateLimiter(calls_per_second=10)
             limiter.wait()  # May sleep to enforce rate limit
             make_api_call()
         """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def penalize(self, retry_after: float | None = None, factor: float = 0.5) -> None:
+        """
+        Slow down after a throttling response (multiplicative decrease).
+
+        Halves the current rate (by default), down to a floor of 1/10 of the
+        configured rate, and if the server sent Retry-After, holds back every
+        caller until it has passed.
+
+        Args:
+            retry_after: Seconds the server asked clients to wait, if any
+            factor: Multiplier applied to the current rate. Default: 0.5.
+        """
         with self.lock:
-            now = time.time()
-            time_since_last = now - self.last_call
+            self.current_rate = max(self.calls_per_second / 10, self.current_rate * factor)
+            self.min_interval = 1.0 / self.current_rate
+        if retry_after:
+            self._defer(time.monotonic() + retry_after)
 
-            if time_since_last < self.min_interval:
-                sleep_time = self.min_interval - time_since_last
-                time.sleep(sleep_time)
+    def recover(self, step: float = 0.05) -> None:
+        """
+        Speed back up after a successful response (additive increase).
 
-            self.last_call = time.time()
+        Args:
+            step: Fraction of the configured rate added back per call. Default: 0.05.
+        """
+        if self.current_rate >= self.calls_per_second:
+            return
+        with self.lock:
+            self.current_rate = min(
+                self.calls_per_second, self.current_rate + self.calls_per_second * step
+            )
+            self.min_interval = 1.0 / self.current_rate
+
+    def _defer(self, until: float) -> None:
+        """Make the next slot start no earlier than the monotonic time until."""
+        with self.lock:
+            self._tat = max(self._tat, until)
 
     @classmethod
-    def get_global_limiter(cls, calls_per_second: float = 10.0) -> "RateLimiter":
+    def get_global_limiter(
+        cls: type[_LimiterT], calls_per_second: float = 10.0, burst: int = 1
+    ) -> _LimiterT:
         """
         Get or create the global rate limiter instance.
 
@@ -71,14 +162,33 @@ class RateLimiter:
 
         Args:
             calls_per_second: Rate limit to use if creating a new limiter
+            burst: Burst capacity to use if creating a new limiter
 
         Returns:
             The global RateLimiter instance
         """
+        # Double-checked: only the first call takes the lock
+        limiter = cls._global_limiter
+        if limiter is None:
+            with cls._global_lock:
+                if cls._global_limiter is None:
+                    cls._global_limiter = cls(calls_per_second, burst)
+                limiter = cls._global_limiter
+        return limiter  # type: ignore[return-value]
+
+    @classmethod
+    def set_global_limiter(cls, limiter: "RateLimiter") -> None:
+        """
+        Replace the global rate limiter used by all requests.
+
+        Args:
+            limiter: The limiter to use, e.g. a SharedRateLimiter
+
+        Example:
+            RateLimiter.set_global_limiter(SharedRateLimiter(calls_per_second=10))
+        """
         with cls._global_lock:
-            if cls._global_limiter is None:
-                cls._global_limiter = cls(calls_per_second)
-            return cls._global_limiter
+            cls._global_limiter = limiter
 
     @classmethod
     def reset_global_limiter(cls) -> None:
@@ -90,3 +200,300 @@ class RateLimiter:
         """
         with cls._global_lock:
             cls._global_limiter = None
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Rate limiter shared by every process on a host.
+
+    The token bucket state lives in a small memory-mapped file, and each
+    reservation holds an exclusive ``flock`` on it, so gunicorn or Celery
+    workers using the same path draw from a single budget instead of each
+    getting the full rate. Install it as the global limiter to apply it to all
+    requests:
+
+    Example:
+        from scrython.rate_limiter import RateLimiter, SharedRateLimiter
+
+        RateLimiter.set_global_limiter(SharedRateLimiter(calls_per_second=10))
+
+    Requires POSIX file locking (fcntl), so it is not available on Windows.
+
+    The default state file is private to the current user: its name includes
+    the uid, it is created with mode 0o600, and an existing file there is only
+    used if it is a regular file owned by that user. Pass ``path`` to share a
+    budget between users; that file is created with mode 0o666 (less the
+    umask). Symlinks are never followed.
+    """
+
+    # Layout: theoretical arrival time, then the monotonic and wall clock
+    # readings when it was written (used to detect a reboot)
+    _STATE = struct.Struct("ddd")
+
+    def __init__(
+        self, calls_per_second: float = 10.0, burst: int = 1, path: str | None = None
+    ) -> None:
+        """
+        Initialize a shared rate limiter.
+
+        Args:
+            calls_per_second: Maximum combined calls per second across processes.
+                             Default is 10.0 per Scryfall guidelines.
+            burst: Number of calls that may be made back-to-back after an idle
+                   period. Default is 1.
+            path: State file shared by the cooperating processes. Default is
+                  ``scrython-ratelimit-<uid>`` in the system temp directory.
+
+        Raises:
+            RuntimeError: If the platform has no POSIX file locking (Windows).
+        """
+        if fcntl is None:
+            raise RuntimeError(
+                "SharedRateLimiter requires POSIX file locking (fcntl), "
+                "which is not available on this platform"
+            )
+
+        super().__init__(calls_per_second, burst)
+        self._private = path is None
+        self.path = path or os.path.join(tempfile.gettempdir(), f"scrython-ratelimit-{os.getuid()}")
+        self._fd: int | None = None
+        self._map: mmap.mmap | None = None
+        self._pid: int | None = None
+
+    def _open(self) -> tuple[int, mmap.mmap]:
+        """
+        Open and map the state file, reopening after a fork.
+
+        flock() locks belong to the open file description, which a forked
+        child shares with its parent, so each process needs its own.
+        """
+        if self._pid != os.getpid() or self._fd is None or self._map is None:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+            mode = 0o600 if self._private else 0o666
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, mode)
+            try:
+                if self._private:
+                    self._check_private(fd)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    if os.fstat(fd).st_size < self._STATE.size:
+                        os.ftruncate(fd, self._STATE.size)
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                self._map = mmap.mmap(fd, self._STATE.size)
+            except BaseException:
+                os.close(fd)
+                raise
+
+            self._fd = fd
+            self._pid = os.getpid()
+
+        return self._fd, self._map
+
+    def _check_private(self, fd: int) -> None:
+        """
+        Refuse a default state file that another user created or replaced.
+
+        Raises:
+            PermissionError: If the file isn't a regular file owned by this user
+        """
+        info = os.fstat(fd)
+        if not stat.S_ISREG(info.st_mode) or info.st_uid != os.getuid():
+            raise PermissionError(
+                f"Refusing to use rate limiter state file {self.path!r}: "
+                "not a regular file owned by the current user"
+            )
+
+    def _read_tat(self, state: mmap.mmap, now: float) -> float:
+        """Read the shared theoretical arrival time. Caller must hold the file lock."""
+        tat, written_mono, written_wall = self._STATE.unpack_from(state)
+
+        # Monotonic clocks restart at boot; discard state from a previous
+        # boot (a wall-clock step also resets it, costing one early slot)
+        if abs((time.time() - written_wall) - (now - written_mono)) > 1.0:
+            return 0.0
+        return tat
+
+    def reserve(self) -> float:
+        """
+        Reserve the next slot in the host-wide bucket without waiting.
+
+        Returns:
+            Seconds the caller must wait before its slot begins (0.0 if none)
+        """
+        with self.lock:
+            fd, state = self._open()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                now = time.monotonic()
+                tat = max(self._read_tat(state, now), now)
+                slot = max(now, tat - (self.burst - 1) * self.min_interval)
+                self._STATE.pack_into(state, 0, tat + self.min_interval, now, time.time())
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        return slot - now
+
+    def _defer(self, until: float) -> None:
+        """Make the next host-wide slot start no earlier than the monotonic time until."""
+        with self.lock:
+            fd, state = self._open()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                now = time.monotonic()
+                tat = self._read_tat(state, now)
+                self._STATE.pack_into(state, 0, max(tat, until), now, time.time())
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """Unmap and close the state file."""
+        with self.lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+class EndpointRateLimiters:
+    """
+    Registry of per-endpoint-family rate limiters.
+
+    Scryfall applies stricter limits to some endpoints (search, named, random
+    and collection) than to the rest of the API. When installed, each request
+    first waits for the bucket of its endpoint family, then for the global
+    RateLimiter, so expensive endpoints stay within their own budget while
+    set and catalog requests only wait on the overall one.
+
+    Families are matched by path prefix, so ``'cards/search'`` also covers the
+    ``next_page`` URLs fetched by iter_all(). Endpoints without a family only
+    use the global limiter.
+
+    Per-endpoint limiting is opt-in:
+
+    Example:
+        from scrython.rate_limiter import EndpointRateLimiters
+
+        # Scryfall's defaults (2/s for search, named, random and collection)
+        EndpointRateLimiters.set_global_limiter(EndpointRateLimiters())
+
+        # Custom budgets
+        EndpointRateLimiters.set_global_limiter(
+            EndpointRateLimiters({'cards/search': 1.0, 'cards/autocomplete': 5.0})
+        )
+    """
+
+    _global_limiter: ClassVar["EndpointRateLimiters | None"] = None
+    _global_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, limits: Mapping[str, "float | RateLimiter"] | None = None) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            limits: Map of endpoint path prefix (e.g. 'cards/search') to calls
+                    per second, or to a RateLimiter instance such as a
+                    SharedRateLimiter. Default: DEFAULT_ENDPOINT_LIMITS.
+        """
+        if limits is None:
+            limits = DEFAULT_ENDPOINT_LIMITS
+
+        self.limiters: dict[str, RateLimiter] = {
+            family.strip("/"): limit if isinstance(limit, RateLimiter) else RateLimiter(limit)
+            for family, limit in limits.items()
+        }
+        # Longest prefix first so 'cards/search' wins over 'cards'
+        self._families = sorted(self.limiters, key=len, reverse=True)
+
+    def family(self, path: str) -> str | None:
+        """
+        Find the endpoint family for a request path.
+
+        Args:
+            path: Endpoint path, with or without leading slash (e.g. '/cards/search')
+
+        Returns:
+            The matching family prefix, or None if the path has no own budget
+        """
+        path = path.strip("/")
+        for family in self._families:
+            if path == family or path.startswith(f"{family}/"):
+                return family
+        return None
+
+    def limiter_for(self, path: str) -> RateLimiter | None:
+        """
+        Get the limiter for a request path.
+
+        Args:
+            path: Endpoint path (e.g. 'cards/search')
+
+        Returns:
+            The family's RateLimiter, or None if the path has no own budget
+        """
+        family = self.family(path)
+        return self.limiters[family] if family is not None else None
+
+    def reserve(self, path: str) -> float:
+        """
+        Reserve a slot in the family bucket for path without waiting.
+
+        Args:
+            path: Endpoint path (e.g. 'cards/search')
+
+        Returns:
+            Seconds the caller must wait before its slot begins (0.0 if none)
+        """
+        limiter = self.limiter_for(path)
+        return limiter.reserve() if limiter is not None else 0.0
+
+    def wait(self, path: str) -> None:
+        """
+        Block until the family bucket for path allows the next call.
+
+        Args:
+            path: Endpoint path (e.g. 'cards/search')
+        """
+        delay = self.reserve(path)
+        if delay > 0:
+            time.sleep(delay)
+
+    @classmethod
+    def get_global_limiter(cls) -> "EndpointRateLimiters | None":
+        """
+        Get the installed per-endpoint registry.
+
+        Returns:
+            The global EndpointRateLimiters, or None if per-endpoint limiting
+            hasn't been enabled
+        """
+        # Reading the reference is atomic, so no lock is needed
+        return cls._global_limiter
+
+    @classmethod
+    def set_global_limiter(cls, limiters: "EndpointRateLimiters | None") -> None:
+        """
+        Install (or, with None, remove) the per-endpoint registry used by all requests.
+
+        Args:
+            limiters: The registry to apply on top of the global RateLimiter
+        """
+        with cls._global_lock:
+            cls._global_limiter = limiters
+
+    @classmethod
+    def reset_global_limiter(cls) -> None:
+        """
+        Remove the per-endpoint registry.
+
+        This is primarily useful for testing to ensure a clean state
+        between test runs.
+        """
+        cls.set_global_limiter(None)
@@ -0,0 +1,291 @@
+"""Retries for throttled and failed Scryfall API requests.
+
+A 429 or 5xx response part-way through a long pagination or bulk-resolution
+job shouldn't throw away every request made so far. RetryPolicy decides
+whether a failed request is retried and how long to wait first: the server's
+Retry-After when given, otherwise jittered exponential backoff. A shared
+RetryBudget caps retries to a fraction of overall traffic, so an outage
+doesn't turn into a retry storm.
+"""
+
+import email.utils
+import random
+import threading
+import time
+import urllib.error
+from typing import ClassVar
+
+# Responses worth retrying: throttling and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Responses after which the rate limiter should slow down
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait (never negative), or None if missing or unparseable
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of requests.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    with the default ratio retries can add at most 20% extra traffic. A small
+    allowance of ``min_per_second`` retries per second lets occasional
+    failures be retried even when traffic is low.
+
+    The budget is thread-safe and is shared by all requests using a policy.
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 10.0
+    ) -> None:
+        """
+        Initialize a retry budget.
+
+        Args:
+            ratio: Retries allowed per request made. Default: 0.2.
+            min_per_second: Retries per second always allowed. Default: 1.0.
+            max_tokens: Maximum number of retries that can be saved up. Default: 10.0.
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the time-based allowance. Caller must hold self._lock."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_tokens, self._tokens + (now - self._last_refill) * self.min_per_second
+        )
+        self._last_refill = now
+
+    def record_request(self) -> None:
+        """Deposit the allowance earned by one (non-retry) request."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """
+        Withdraw one retry from the budget.
+
+        Returns:
+            True if the retry may go ahead, False if the budget is exhausted
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    @property
+    def available(self) -> float:
+        """Number of retries currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class RetryPolicy:
+    """
+    Decides whether and when to retry a failed request.
+
+    Retries 429 and 5xx responses and connection errors, up to
+    ``max_retries`` times per request. The wait before each retry is the
+    server's Retry-After if present, otherwise "full jitter" exponential
+    backoff: a random delay between 0 and ``backoff_base * 2 ** attempt``,
+    capped at ``backoff_max``.
+
+    Example:
+        from scrython.retry import RetryPolicy
+
+        # Retry harder for a long-running job
+        RetryPolicy.set_global_policy(RetryPolicy(max_retries=6, backoff_max=60))
+
+        # Or per request
+        card = scrython.cards.Named(fuzzy='Bolt', retry_policy=RetryPolicy(max_retries=1))
+
+        # Disable retries for one request
+        card = scrython.cards.Named(fuzzy='Bolt', retry=False)
+    """
+
+    # Class-level (global) policy shared across all requests
+    _global_policy: ClassVar["RetryPolicy | None"] = None
+    _global_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        retry_statuses: frozenset[int] = RETRY_STATUSES,
+        retry_connection_errors: bool = True,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        """
+        Initialize a retry policy.
+
+        Args:
+            max_retries: Maximum retries per request. Default: 3.
+            backoff_base: Backoff ceiling for the first retry, in seconds. Default: 0.5.
+            backoff_max: Maximum wait before a retry, in seconds, including
+                         Retry-After. Default: 30.0.
+            retry_statuses: HTTP status codes to retry. Default: 429, 500, 502, 503, 504.
+            retry_connection_errors: Retry on connection failures. Default: True.
+            budget: RetryBudget shared by requests using this policy. Default: a
+                    new RetryBudget().
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.retry_connection_errors = retry_connection_errors
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """
+        Check whether an error is worth retrying at all.
+
+        Args:
+            exc: The exception raised by the request
+
+        Returns:
+            True for retryable HTTP statuses and (if enabled) connection errors
+        """
+        if isinstance(exc, urllib.error.HTTPError):
+            return exc.code in self.retry_statuses
+        return self.retry_connection_errors and isinstance(exc, (urllib.error.URLError, OSError))
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        """
+        Decide whether to retry, spending from the budget if so.
+
+        Args:
+            exc: The exception raised by the request
+            attempt: Number of retries already made for this request
+
+        Returns:
+            True if the request should be retried
+        """
+        if attempt >= self.max_retries or not self.is_retryable(exc):
+            return False
+        return self.budget.try_spend()
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Compute the wait before a retry.
+
+        Args:
+            attempt: Number of retries already made for this request
+            retry_after: Server-requested delay in seconds, if any
+
+        Returns:
+            Seconds to wait before retrying
+        """
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    @classmethod
+    def get_global_policy(cls) -> "RetryPolicy":
+        """
+        Get or create the global retry policy.
+
+        Returns:
+            The global RetryPolicy instance
+        """
+        # Double-checked: only the first call takes the lock
+        policy = cls._global_policy
+        if policy is None:
+            with cls._global_lock:
+                if cls._global_policy is None:
+                    cls._global_policy = cls()
+                policy = cls._global_policy
+        return policy
+
+    @classmethod
+    def set_global_policy(cls, policy: "RetryPolicy") -> None:
+        """
+        Replace the global retry policy used by all requests.
+
+        Args:
+            policy: The RetryPolicy to use
+        """
+        with cls._global_lock:
+            cls._global_policy = policy
+
+    @classmethod
+    def reset_global_policy(cls) -> None:
+        """
+        Reset the global retry policy.
+
+        This is primarily useful for testing to ensure a clean state
+        between test runs.
+        """
+        with cls._global_lock:
+            cls._global_policy = None
+
+
+def retry_after_from(exc: BaseException) -> float | None:
+    """
+    Get the Retry-After delay from a failed request, if the server sent one.
+
+    Args:
+        exc: The exception raised by the request
+
+    Returns:
+        Seconds to wait, or None
+    """
+    if isinstance(exc, urllib.error.HTTPError) and exc.headers is not None:
+        return parse_retry_after(exc.headers.get("Retry-After"))
+    return None
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Check whether a failed request hit throttling, a server error or a connection failure.
+
+    Looks through the wrapper exception raised for HTTP errors to the
+    HTTPError that caused it.
+
+    Args:
+        exc: The exception raised by the request
+
+    Returns:
+        True for 429 and 5xx responses and connection errors, False otherwise
+        (e.g. for 404)
+    """
+    if isinstance(exc.__cause__, urllib.error.HTTPError):
+        exc = exc.__cause__
+    if isinstance(exc, urllib.error.HTTPError):
+        return exc.code in RETRY_STATUSES
+    return isinstance(exc, (urllib.error.URLError, OSError))
@@ -0,0 +1,191 @@
+"""Single-flight deduplication of identical in-flight requests.
+
+The cache only helps once a response has come back. When many threads ask for
+the same resource before that, each would send its own request. SingleFlight
+lets the first caller for a key (the leader) make the request while later
+callers for the same key wait and share its result or its exception.
+Requests are keyed by the same key generate_cache_key() produces.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+class _Call:
+    """State of one in-flight call shared between its leader and waiters."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one.
+
+    Example:
+        flight = SingleFlight()
+
+        # In many threads at once, only one fetch runs:
+        data = flight.do(cache_key, lambda: fetch(url))
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], _T]) -> _T:
+        """
+        Run fn, unless a call for key is already running, in which case wait for it.
+
+        Args:
+            key: Identifies identical calls (e.g. a cache key)
+            fn: Zero-argument callable that performs the call
+
+        Returns:
+            The result of fn, shared by every caller for key
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """
+        Get the number of keys with a call currently running.
+
+        Returns:
+            Number of in-flight calls
+        """
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Collapses concurrent coroutine calls with the same key into one.
+
+    Bound to the event loop it is used on; use get_global_async_single_flight()
+    to get the instance for the running loop.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Await fn(), unless a call for key is already running, in which case await it.
+
+        The shared call runs in its own task, which every caller (including
+        the one that started it) awaits through asyncio.shield(), so
+        cancelling one caller, e.g. with an asyncio.wait_for() timeout,
+        cancels only that caller and never the call the others are awaiting.
+
+        Args:
+            key: Identifies identical calls (e.g. a cache key)
+            fn: Zero-argument callable returning an awaitable
+
+        Returns:
+            The result of fn(), shared by every caller for key
+        """
+        task = self._calls.get(key)
+        if task is None:
+
+            async def call() -> _T:
+                return await fn()
+
+            task = asyncio.get_running_loop().create_task(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """Forget a finished call."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark retrieved so an exception nobody waited for isn't logged
+            task.exception()
+
+
+# Global single-flight group
+_global_single_flight: SingleFlight | None = None
+_single_flight_lock = threading.Lock()
+
+# One async group per event loop, since futures are bound to their loop
+_global_async_single_flights: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncSingleFlight]"
+) = weakref.WeakKeyDictionary()
+
+
+def get_global_single_flight() -> SingleFlight:
+    """
+    Get or create the global SingleFlight used by all requests.
+
+    Returns:
+        The global SingleFlight instance
+    """
+    global _global_single_flight
+    # Double-checked: only the first call takes the lock
+    flight = _global_single_flight
+    if flight is None:
+        with _single_flight_lock:
+            if _global_single_flight is None:
+                _global_single_flight = SingleFlight()
+            flight = _global_single_flight
+    return flight
+
+
+def get_global_async_single_flight() -> AsyncSingleFlight:
+    """
+    Get or create the AsyncSingleFlight for the running event loop.
+
+    Returns:
+        The AsyncSingleFlight bound to the current event loop
+    """
+    loop = asyncio.get_running_loop()
+    flight = _global_async_single_flights.get(loop)
+    if flight is None:
+        flight = _global_async_single_flights[loop] = AsyncSingleFlight()
+    return flight
+
+
+def reset_global_single_flight() -> None:
+    """
+    Reset the global SingleFlight instances.
+
+    Useful for testing to ensure a clean state between tests.
+    """
+    global _global_single_flight
+    with _single_flight_lock:
+        _global_single_flight = None
+    _global_async_single_flights.clear()
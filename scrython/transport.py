@@ -0,0 +1,494 @@
+"""Pooled HTTP transport for Scryfall API requests.
+
+Every call to ``urllib.request.urlopen`` opens a fresh TCP connection and
+performs a new TLS handshake, which frequently costs more than the request
+itself. This module provides a small connection pool built on
+``http.client`` that keeps keep-alive connections open per host and hands
+them out to one thread at a time.
+
+The module-level ``urlopen()`` function is a drop-in replacement for the
+subset of ``urllib.request.urlopen`` that Scrython uses: it accepts a
+``Request`` or URL string, follows redirects, raises ``HTTPError`` for
+non-2xx responses and returns a file-like response object.
+"""
+
+import http.client
+import io
+import os
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any
+from urllib.request import Request
+
+# Status codes that carry a Location header we should follow
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 10
+
+# Errors that indicate a pooled connection was closed by the server while idle
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+PoolKey = tuple[str, str, int]
+
+
+def create_ssl_context() -> ssl.SSLContext:
+    """
+    Create the SSL context shared by all pooled HTTPS connections.
+
+    Scryfall requires TLS 1.2 or newer, so older protocol versions are
+    disabled. Certificate verification uses the system trust store.
+
+    Returns:
+        A configured ssl.SSLContext
+    """
+    context = ssl.create_default_context()
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    return context
+
+
+class PooledResponse(io.RawIOBase):
+    """
+    File-like HTTP response that returns its connection to the pool on close.
+
+    Mirrors the parts of ``http.client.HTTPResponse`` / ``urllib`` responses
+    that Scrython relies on: ``read()``, ``info()``, ``headers``, ``status``
+    and context manager support. The underlying connection is only reused if
+    the body was read completely and the server did not ask to close it.
+    """
+
+    def __init__(
+        self,
+        response: http.client.HTTPResponse,
+        connection: http.client.HTTPConnection,
+        pool: "ConnectionPool",
+        key: PoolKey,
+        url: str,
+    ) -> None:
+        super().__init__()
+        self._response = response
+        self._connection: http.client.HTTPConnection | None = connection
+        self._pool = pool
+        self._key = key
+        self.url = url
+
+    @property
+    def status(self) -> int:
+        return self._response.status
+
+    @property
+    def reason(self) -> str:
+        return self._response.reason
+
+    @property
+    def headers(self) -> http.client.HTTPMessage:
+        return self._response.msg
+
+    def info(self) -> http.client.HTTPMessage:
+        return self._response.msg
+
+    def getcode(self) -> int:
+        return self._response.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            return self._response.read()
+        return self._response.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        return self._response.readinto(buffer)
+
+    def close(self) -> None:
+        """Close the response and release or discard its connection."""
+        if self._connection is not None:
+            connection = self._connection
+            self._connection = None
+
+            if self._response.isclosed() and not self._response.will_close:
+                # Body fully consumed and keep-alive allowed: reuse it
+                self._pool.release(self._key, connection)
+            else:
+                self._response.close()
+                connection.close()
+        super().close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent HTTP(S) connections keyed by host.
+
+    Connections are checked out by one thread at a time and returned to the
+    pool once their response has been fully read. Idle connections are kept
+    per (scheme, host, port) and discarded after ``idle_timeout`` seconds, as
+    servers typically close idle keep-alive connections on their side.
+
+    A forked child inherits the parent's sockets, so a pool used in a process
+    other than the one that filled it drops its idle connections (without
+    closing them, which would disturb the parent's streams) and starts over.
+
+    Example:
+        pool = ConnectionPool(max_connections_per_host=4, idle_timeout=30)
+        with pool.urlopen('https://api.scryfall.com/sets/lea') as response:
+            data = response.read()
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        idle_timeout: float = 30.0,
+        timeout: float | None = None,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        """
+        Initialize an empty connection pool.
+
+        Args:
+            max_connections_per_host: Maximum number of idle connections kept
+                                      per host. Extra connections are closed
+                                      when released. Default: 10.
+            idle_timeout: Seconds an idle connection may sit in the pool before
+                          it is discarded. Default: 30.0.
+            timeout: Socket timeout in seconds for new connections, or None to
+                     use the global socket default.
+            ssl_context: SSL context for HTTPS connections. Defaults to a
+                         shared context from create_ssl_context().
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.ssl_context = ssl_context or create_ssl_context()
+        self._idle: dict[PoolKey, list[tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _check_pid(self) -> None:
+        """Forget connections inherited from the parent process after a fork."""
+        if self._pid != os.getpid():
+            # The lock may have been held by a parent thread at fork time
+            self._lock = threading.Lock()
+            self._idle = {}
+            self._pid = os.getpid()
+
+    def urlopen(self, request: Request | str, timeout: float | None = None) -> PooledResponse:
+        """
+        Execute a request over a pooled connection.
+
+        Redirects are followed (up to 10). Non-2xx responses raise
+        ``urllib.error.HTTPError`` exactly like ``urllib.request.urlopen``, and
+        connection failures raise ``urllib.error.URLError``.
+
+        Args:
+            request: A urllib Request object or an absolute URL string
+            timeout: Optional socket timeout overriding the pool default
+
+        Returns:
+            PooledResponse for the final (non-redirect) response
+
+        Raises:
+            urllib.error.HTTPError: On non-2xx responses
+            urllib.error.URLError: On connection failures
+        """
+        if isinstance(request, str):
+            request = Request(request)
+
+        url = request.full_url
+        method = request.get_method()
+        body = request.data
+        headers = dict(request.header_items())
+
+        for _ in range(_MAX_REDIRECTS + 1):
+            response = self._open(method, url, body, headers, timeout)
+            status = response.status
+
+            location = response.headers.get("Location")
+            if status in _REDIRECT_CODES and location:
+                # Drain the redirect body so the connection can be reused
+                with response:
+                    response.read()
+
+                url = urllib.parse.urljoin(url, location)
+                if status == 303 or (status in (301, 302) and method not in ("GET", "HEAD")):
+                    method = "GET"
+                    body = None
+                    headers = {
+                        k: v
+                        for k, v in headers.items()
+                        if k.lower() not in ("content-type", "content-length")
+                    }
+                continue
+
+            if not 200 <= status < 300:
+                # Buffer the (small) error body so the connection goes back to
+                # the pool, instead of waiting for the response to be collected
+                with response:
+                    try:
+                        error_body = response.read()
+                    except OSError:
+                        error_body = b""
+                raise urllib.error.HTTPError(
+                    url, status, response.reason, response.headers, io.BytesIO(error_body)
+                )
+
+            return response
+
+        raise urllib.error.HTTPError(
+            url, status, "Too many redirects", response.headers, io.BytesIO()
+        )
+
+    def _open(
+        self,
+        method: str,
+        url: str,
+        body: Any,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> PooledResponse:
+        """Send a single request, retrying once if a reused connection went stale."""
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise urllib.error.URLError(f"unsupported URL scheme: {scheme!r}")
+
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        key: PoolKey = (scheme, host, port)
+
+        selector = parts.path or "/"
+        if parts.query:
+            selector = f"{selector}?{parts.query}"
+
+        proxy = self._proxy_for(scheme, host)
+        if proxy is not None and scheme == "http":
+            # Plain HTTP through a proxy uses the absolute URL as the selector
+            selector = url
+
+        connection, reused = self._acquire(key, proxy, timeout)
+        try:
+            try:
+                connection.request(method, selector, body=body, headers=headers)
+                response = connection.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if not reused:
+                    raise
+                # The server closed the idle connection; retry on a fresh one
+                connection = self._connect(key, proxy, timeout)
+                connection.request(method, selector, body=body, headers=headers)
+                response = connection.getresponse()
+        except OSError as exc:
+            connection.close()
+            raise urllib.error.URLError(exc) from exc
+
+        return PooledResponse(response, connection, self, key, url)
+
+    def _proxy_for(self, scheme: str, host: str) -> tuple[str, int] | None:
+        """Return the (host, port) of the proxy configured for this request, if any."""
+        proxy_url = urllib.request.getproxies().get(scheme)
+        if not proxy_url or urllib.request.proxy_bypass(host):
+            return None
+
+        proxy = urllib.parse.urlsplit(proxy_url if "://" in proxy_url else f"http://{proxy_url}")
+        return proxy.hostname or "", proxy.port or 80
+
+    def _acquire(
+        self, key: PoolKey, proxy: tuple[str, int] | None, timeout: float | None
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """
+        Check out an idle connection for key, or open a new one.
+
+        Returns:
+            Tuple of (connection, reused) where reused is True if the
+            connection came from the pool
+        """
+        self._check_pid()
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                connection, last_used = idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    if timeout is not None and connection.sock is not None:
+                        connection.sock.settimeout(timeout)
+                    return connection, True
+                connection.close()
+
+        return self._connect(key, proxy, timeout), False
+
+    def _connect(
+        self, key: PoolKey, proxy: tuple[str, int] | None, timeout: float | None
+    ) -> http.client.HTTPConnection:
+        """Create a new (not yet connected) connection for key."""
+        scheme, host, port = key
+        if timeout is None:
+            timeout = self.timeout
+
+        kwargs: dict[str, Any] = {}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        connection: http.client.HTTPConnection
+        if scheme == "https":
+            if proxy is not None:
+                connection = http.client.HTTPSConnection(
+                    proxy[0], proxy[1], context=self.ssl_context, **kwargs
+                )
+                connection.set_tunnel(host, port)
+            else:
+                connection = http.client.HTTPSConnection(
+                    host, port, context=self.ssl_context, **kwargs
+                )
+        elif proxy is not None:
+            connection = http.client.HTTPConnection(proxy[0], proxy[1], **kwargs)
+        else:
+            connection = http.client.HTTPConnection(host, port, **kwargs)
+
+        return connection
+
+    def release(self, key: PoolKey, connection: http.client.HTTPConnection) -> None:
+        """
+        Return a connection to the pool after its response was fully read.
+
+        If the pool already holds max_connections_per_host idle connections
+        for this host, the connection is closed instead.
+
+        Args:
+            key: The (scheme, host, port) the connection belongs to
+            connection: The connection to return
+        """
+        self._check_pid()
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_connections_per_host:
+                idle.append((connection, time.monotonic()))
+                return
+
+        connection.close()
+
+    def idle_count(self) -> int:
+        """
+        Get the number of idle connections currently held by the pool.
+
+        Returns:
+            Number of idle connections across all hosts
+        """
+        self._check_pid()
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        self._check_pid()
+        with self._lock:
+            idle_lists = list(self._idle.values())
+            self._idle.clear()
+
+        for idle in idle_lists:
+            for connection, _ in idle:
+                connection.close()
+
+
+# Global connection pool instance
+_global_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_global_pool() -> ConnectionPool:
+    """
+    Get or create the global connection pool.
+
+    Returns:
+        The global ConnectionPool instance
+    """
+    global _global_pool
+    # Double-checked: only the first call takes the lock
+    pool = _global_pool
+    if pool is None:
+        with _pool_lock:
+            if _global_pool is None:
+                _global_pool = ConnectionPool()
+            pool = _global_pool
+    return pool
+
+
+def set_global_pool(pool: ConnectionPool) -> None:
+    """
+    Replace the global connection pool, e.g. to change its size or timeouts.
+
+    Idle connections held by the previous pool are closed.
+
+    Args:
+        pool: The ConnectionPool to use for all subsequent requests
+
+    Example:
+        from scrython.transport import ConnectionPool, set_global_pool
+        set_global_pool(ConnectionPool(max_connections_per_host=4, idle_timeout=15))
+    """
+    global _global_pool
+    with _pool_lock:
+        previous = _global_pool
+        _global_pool = pool
+
+    if previous is not None and previous is not pool:
+        previous.clear()
+
+
+def reset_global_pool() -> None:
+    """
+    Close all pooled connections and reset the global pool.
+
+    Useful for testing. A forked child starts with a fresh global pool
+    automatically.
+    """
+    global _global_pool
+    with _pool_lock:
+        previous = _global_pool
+        _global_pool = None
+
+    if previous is not None:
+        previous.clear()
+
+
+def _reset_after_fork() -> None:
+    """Give a forked child its own global pool, leaving the parent's sockets alone."""
+    global _global_pool, _pool_lock
+    _pool_lock = threading.Lock()
+    _global_pool = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def urlopen(request: Request | str, timeout: float | None = None) -> PooledResponse:
+    """
+    Open a URL using the global connection pool.
+
+    Drop-in replacement for ``urllib.request.urlopen`` for Scrython's usage.
+
+    Args:
+        request: A urllib Request object or an absolute URL string
+        timeout: Optional socket timeout in seconds
+
+    Returns:
+        PooledResponse that should be used as a context manager
+
+    Example:
+        with urlopen('https://api.scryfall.com/cards/random') as response:
+            data = json.loads(response.read())
+    """
+    return get_global_pool().urlopen(request, timeout=timeout)
@@ -1,13 +1,22 @@
 """Pytest configuration and shared fixtures for Scrython tests."""
 
 import json
+import threading
+from email.message import Message
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
 from scrython.cache import reset_global_cache
-from scrython.rate_limiter import RateLimiter
+from scrython.cache_policy import TTLPolicy
+from scrython.cards.loader import reset_global_loader
+from scrython.entity_cache import reset_global_entity_cache
+from scrython.rate_limiter import EndpointRateLimiters, RateLimiter
+from scrython.retry import RetryPolicy
+from scrython.singleflight import reset_global_single_flight
+from scrython.transport import reset_global_pool
 
 # Path to fixture files
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -18,13 +27,24 @@ def reset_globals():
     """
     Reset global state before each test.
 
-    Resets rate limiter and cache to ensure tests don't interfere with each other.
+    Resets rate limiters, retry and TTL policies, caches, connection pool and card loader
+    to ensure tests don't interfere with each other.
     """
     RateLimiter.reset_global_limiter()
+    RetryPolicy.reset_global_policy()
+    TTLPolicy.reset_global_policy()
     reset_global_cache()
+    reset_global_entity_cache()
     yield
     RateLimiter.reset_global_limiter()
+    EndpointRateLimiters.reset_global_limiter()
+    RetryPolicy.reset_global_policy()
+    TTLPolicy.reset_global_policy()
+    reset_global_single_flight()
     reset_global_cache()
+    reset_global_entity_cache()
+    reset_global_pool()
+    reset_global_loader()
 
 
 @pytest.fixture
@@ -48,6 +68,41 @@ def load_fixture(fixture_path):
         return json.load(f)
 
 
+class MockURLResponse:
+    """Minimal stand-in for the response urlopen returns."""
+
+    def __init__(self, data, status=200):
+        self.data = data.encode("utf-8") if isinstance(data, str) else data
+        self.status = status
+        self.headers = Message()
+        self.headers["Content-Type"] = "application/json; charset=utf-8"
+
+    def read(self):
+        return self.data
+
+    def info(self):
+        return self.headers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+@pytest.fixture
+def json_response():
+    """
+    Factory for fake urlopen responses with a JSON body.
+
+    Usage in tests:
+        def test_something(json_response):
+            with patch("scrython.base.urlopen", return_value=json_response({"object": "card"})):
+                ...
+    """
+    return lambda body, status=200: MockURLResponse(json.dumps(body), status)
+
+
 @pytest.fixture
 def disable_rate_limiting():
     """
@@ -76,25 +131,6 @@ def mock_urlopen(disable_rate_limiting):  # noqa: ARG001
             assert card.name == 'Black Lotus'
     """
 
-    class MockURLResponse:
-        def __init__(self, data, status=200):
-            self.data = data.encode("utf-8") if isinstance(data, str) else data
-            self.status = status
-            self._info = Mock()
-            self._info.get_param = Mock(return_value="utf-8")
-
-        def read(self):
-            return self.data
-
-        def info(self):
-            return self._info
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            pass
-
     class MockURLOpen:
         def __init__(self):
             self.response_data = None
@@ -220,3 +256,72 @@ def sample_list_response():
 def sample_catalog_response():
     """Sample catalog response structure."""
     return {"object": "catalog", "total_values": 0, "data": []}
+
+
+class _LocalHTTPHandler(BaseHTTPRequestHandler):
+    """Small JSON API used to exercise the HTTP transports without network access."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _send(self, status, body, headers=None):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if getattr(self.server, "truncate_next", False):
+            # Drop the connection mid-response, once
+            self.server.truncate_next = False
+            self.send_response(200)
+            self.send_header("Content-Length", "100")
+            self.end_headers()
+            self.wfile.write(b"{")
+            self.close_connection = True
+        elif self.path == "/redirect":
+            self._send(302, {}, {"Location": "/target"})
+        elif self.path == "/missing":
+            self._send(404, {"object": "error", "status": 404})
+        elif self.path == "/chunked":
+            payload = json.dumps({"path": self.path}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for piece in (payload[:5], payload[5:]):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+            self.wfile.write(b"0\r\n\r\n")
+        elif self.path == "/close":
+            self._send(200, {"path": self.path}, {"Connection": "close"})
+            self.close_connection = True
+        else:
+            self._send(200, {"path": self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length))
+        self._send(200, {"received": body})
+
+
+@pytest.fixture
+def http_server():
+    """Run a local keep-alive HTTP server that counts TCP connections."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _LocalHTTPHandler)
+    httpd.connections = 0
+    httpd.url = lambda path: f"http://127.0.0.1:{httpd.server_address[1]}{path}"
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
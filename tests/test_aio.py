@@ -0,0 +1,454 @@
+"""Tests for the asyncio client (scrython.aio)."""
+
+import asyncio
+import json
+import time
+import urllib.error
+from email.message import Message
+from unittest.mock import patch
+
+import pytest
+
+from scrython.aio import AsyncRateLimiter, cards, catalogs, rulings, sets
+from scrython.aio import transport as aio_transport
+from scrython.aio.transport import AsyncConnectionPool, AsyncResponse, reset_global_async_pools
+from scrython.base import ScryfallError
+from scrython.cache import MemoryCache, generate_cache_key, get_global_cache, set_global_cache
+from scrython.rate_limiter import RateLimiter
+
+
+def run(awaitable):
+    """Await an awaitable (not necessarily a coroutine) on a fresh event loop."""
+
+    async def main():
+        return await awaitable
+
+    return asyncio.run(main())
+
+
+@pytest.fixture(autouse=True)
+def reset_async_globals():
+    """Reset async limiter and pools between tests."""
+    AsyncRateLimiter.reset_global_limiter()
+    reset_global_async_pools()
+    yield
+    AsyncRateLimiter.reset_global_limiter()
+    reset_global_async_pools()
+
+
+@pytest.fixture
+def mock_async_pool():
+    """
+    Patch the async connection pool with a fake that serves queued responses.
+
+    Usage:
+        mock_async_pool.responses.append(data)
+        card = run(cards.Named(fuzzy='bolt', rate_limit=False))
+    """
+
+    class FakePool:
+        def __init__(self):
+            self.responses = []
+            self.calls = []
+
+        async def request(self, method, url, body=None, headers=None):
+            self.calls.append({"method": method, "url": url, "body": body, "headers": headers})
+            data = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+            message = Message()
+            message["Content-Type"] = "application/json; charset=utf-8"
+            return AsyncResponse(url, 200, "OK", message, json.dumps(data).encode("utf-8"))
+
+    pool = FakePool()
+    with patch("scrython.aio.base.get_global_async_pool", return_value=pool):
+        yield pool
+
+
+class TestAsyncRequestHandler:
+    """Test awaiting async endpoint classes."""
+
+    def test_await_populates_object(self, mock_async_pool, sample_card):
+        """Test that awaiting returns the populated object with mixin properties."""
+        mock_async_pool.responses.append(sample_card)
+
+        card = run(cards.Named(exact="Black Lotus", rate_limit=False))
+
+        assert isinstance(card, cards.Named)
+        assert card.name == "Black Lotus"
+        assert card.mana_cost == "{0}"
+        assert "api.scryfall.com/cards/named" in mock_async_pool.calls[0]["url"]
+        assert "exact=Black+Lotus" in mock_async_pool.calls[0]["url"]
+
+    def test_no_request_until_awaited(self, mock_async_pool, sample_card):
+        """Test that constructing an async object does not send a request."""
+        mock_async_pool.responses.append(sample_card)
+
+        cards.Named(exact="Black Lotus")
+
+        assert mock_async_pool.calls == []
+
+    def test_path_parameters(self, mock_async_pool, sample_set):
+        """Test that endpoint templates are resolved like the sync classes."""
+        mock_async_pool.responses.append(sample_set)
+
+        set_obj = run(sets.ByCode(code="lea", rate_limit=False))
+
+        assert set_obj.code == "lea"
+        assert "api.scryfall.com/sets/lea" in mock_async_pool.calls[0]["url"]
+
+    def test_error_raises_scryfall_error(self, mock_async_pool):
+        """Test that Scryfall error objects raise ScryfallError."""
+        mock_async_pool.responses.append(
+            {
+                "object": "error",
+                "status": 404,
+                "code": "not_found",
+                "details": "Not found",
+                "type": None,
+                "warnings": None,
+            }
+        )
+
+        with pytest.raises(ScryfallError):
+            run(cards.ById(id="missing", rate_limit=False))
+
+    def test_concurrent_lookups(self, mock_async_pool, sample_card):
+        """Test that many lookups can be gathered on one event loop."""
+        mock_async_pool.responses.append(sample_card)
+
+        async def main():
+            return await asyncio.gather(
+                *(cards.ById(id=str(i), rate_limit=False) for i in range(20))
+            )
+
+        results = asyncio.run(main())
+
+        assert len(results) == 20
+        assert len(mock_async_pool.calls) == 20
+
+    def test_collection_posts_data(self, mock_async_pool, sample_list_response, sample_card):
+        """Test that POST data is sent as a JSON body."""
+        sample_list_response["data"] = [sample_card]
+        mock_async_pool.responses.append(sample_list_response)
+
+        identifiers = [{"id": sample_card["id"]}]
+        collection = run(cards.Collection(data={"identifiers": identifiers}, rate_limit=False))
+
+        assert collection.data[0].name == "Black Lotus"
+        assert mock_async_pool.calls[0]["method"] == "POST"
+        assert json.loads(mock_async_pool.calls[0]["body"]) == {"identifiers": identifiers}
+
+    def test_shares_cache_with_sync_classes(self, mock_async_pool, sample_card):
+        """Test that cached responses skip the network."""
+        mock_async_pool.responses.append(sample_card)
+
+        run(cards.Named(exact="Black Lotus", cache=True, rate_limit=False))
+        run(cards.Named(exact="Black Lotus", cache=True, rate_limit=False))
+
+        assert len(mock_async_pool.calls) == 1
+        assert get_global_cache().size() == 1
+
+    def test_catalog(self, mock_async_pool):
+        """Test that catalog mixin properties work on async classes."""
+        mock_async_pool.responses.append(
+            {"object": "catalog", "uri": "", "total_values": 2, "data": ["Elf", "Goblin"]}
+        )
+
+        catalog = run(catalogs.CreatureTypes(rate_limit=False))
+
+        assert catalog.data == ["Elf", "Goblin"]
+
+
+class TestAsyncIterAll:
+    """Test async pagination."""
+
+    def test_iter_all_paginates(self, mock_async_pool):
+        """Test that async iter_all fetches every page."""
+        mock_async_pool.responses.extend(
+            [
+                {
+                    "object": "list",
+                    "has_more": True,
+                    "next_page": "https://api.scryfall.com/cards/search?page=2",
+                    "data": [{"object": "ruling", "comment": "one"}],
+                },
+                {
+                    "object": "list",
+                    "has_more": False,
+                    "data": [{"object": "ruling", "comment": "two"}],
+                },
+            ]
+        )
+
+        async def main():
+            results = await rulings.ById(id="abc", rate_limit=False)
+            return [ruling.comment async for ruling in results.iter_all(rate_limit=False)]
+
+        assert asyncio.run(main()) == ["one", "two"]
+        assert mock_async_pool.calls[1]["url"].endswith("page=2")
+
+
+class TestAsyncRateLimiter:
+    """Test the AsyncRateLimiter class."""
+
+    def test_spaces_calls(self):
+        """Test that consecutive waits are spaced by the minimum interval."""
+        limiter = AsyncRateLimiter(calls_per_second=20.0)
+
+        async def main():
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.wait() for _ in range(5)))
+            return time.monotonic() - start
+
+        # First slot is immediate, then 4 intervals of 0.05s
+        assert 0.15 < asyncio.run(main()) < 0.3
+
+    def test_does_not_block_event_loop(self):
+        """Test that waiting coroutines let other tasks run."""
+        limiter = AsyncRateLimiter(calls_per_second=5.0)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await limiter.wait()
+            await asyncio.gather(limiter.wait(), ticker())
+
+        asyncio.run(main())
+
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.15
+
+    def test_get_global_limiter_creates_singleton(self):
+        """Test that get_global_limiter returns a singleton."""
+        assert AsyncRateLimiter.get_global_limiter() is AsyncRateLimiter.get_global_limiter()
+
+    def test_burst(self):
+        """Test that the shared token bucket honours burst capacity."""
+        limiter = AsyncRateLimiter(calls_per_second=10.0, burst=3)
+
+        async def main():
+            start = time.monotonic()
+            await asyncio.gather(*(limiter.wait() for _ in range(3)))
+            return time.monotonic() - start
+
+        assert asyncio.run(main()) < 0.02
+
+    def test_global_shared_with_sync_limiter(self):
+        """Test that sync and async requests share one global limiter."""
+        assert AsyncRateLimiter.get_global_limiter() is RateLimiter.get_global_limiter()
+
+        limiter = RateLimiter(calls_per_second=5.0)
+        AsyncRateLimiter.set_global_limiter(limiter)
+
+        assert RateLimiter.get_global_limiter() is limiter
+
+    def test_requests_use_installed_global_limiter(self, mock_async_pool):
+        """Test that async requests reserve slots from any installed global limiter."""
+
+        class CountingLimiter(RateLimiter):
+            reservations = 0
+
+            def reserve(self):
+                CountingLimiter.reservations += 1
+                return super().reserve()
+
+            def wait(self):
+                raise AssertionError("async requests must not block on wait()")
+
+        RateLimiter.set_global_limiter(CountingLimiter(calls_per_second=1000.0))
+        mock_async_pool.responses.append({"object": "card", "name": "Bolt"})
+
+        run(cards.Named(fuzzy="bolt"))
+
+        assert CountingLimiter.reservations == 1
+
+
+class TestAsyncConnectionPool:
+    """Test the asyncio HTTP transport against a local server."""
+
+    def test_reuses_connection(self, http_server):
+        """Test that sequential requests share one keep-alive connection."""
+        pool = AsyncConnectionPool()
+
+        async def main():
+            return [
+                json.loads((await pool.request("GET", http_server.url(f"/{i}"))).read())
+                for i in range(3)
+            ]
+
+        assert asyncio.run(main()) == [{"path": "/0"}, {"path": "/1"}, {"path": "/2"}]
+        assert http_server.connections == 1
+
+    def test_chunked_response(self, http_server):
+        """Test that chunked transfer encoding is decoded."""
+        pool = AsyncConnectionPool()
+
+        response = asyncio.run(pool.request("GET", http_server.url("/chunked")))
+
+        assert json.loads(response.read()) == {"path": "/chunked"}
+
+    def test_follows_redirects(self, http_server):
+        """Test that redirects are followed."""
+        pool = AsyncConnectionPool()
+
+        response = asyncio.run(pool.request("GET", http_server.url("/redirect")))
+
+        assert json.loads(response.read()) == {"path": "/target"}
+
+    def test_http_error(self, http_server):
+        """Test that non-2xx responses raise HTTPError."""
+        pool = AsyncConnectionPool()
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            asyncio.run(pool.request("GET", http_server.url("/missing")))
+
+        assert exc_info.value.code == 404
+
+    def test_post(self, http_server):
+        """Test that request bodies are sent."""
+        pool = AsyncConnectionPool()
+        body = json.dumps({"identifiers": []}).encode("utf-8")
+
+        response = asyncio.run(
+            pool.request("POST", http_server.url("/cards/collection"), body, {"Content-Type": "x"})
+        )
+
+        assert json.loads(response.read()) == {"received": {"identifiers": []}}
+
+    def test_reused_connection_dropped_mid_response(self, http_server):
+        """Test that a pooled connection closed mid-response is retried on a fresh one."""
+        pool = AsyncConnectionPool()
+
+        async def main():
+            await pool.request("GET", http_server.url("/a"))
+            http_server.truncate_next = True
+            return json.loads((await pool.request("GET", http_server.url("/b"))).read())
+
+        assert asyncio.run(main()) == {"path": "/b"}
+        assert http_server.connections == 2
+
+    def test_drops_inherited_connections_after_fork(self, http_server, monkeypatch):
+        """Test that a pool used in a forked child doesn't reuse the parent's sockets."""
+        pool = AsyncConnectionPool()
+
+        async def main():
+            await pool.request("GET", http_server.url("/a"))
+            monkeypatch.setattr(aio_transport.os, "getpid", lambda: pool._pid + 1)
+            assert pool.idle_count() == 0
+            return json.loads((await pool.request("GET", http_server.url("/b"))).read())
+
+        assert asyncio.run(main()) == {"path": "/b"}
+        assert http_server.connections == 2
+
+    def test_forked_child_drops_loop_pools(self):
+        """Test that the at-fork hook forgets the per-loop pools."""
+
+        async def main():
+            return aio_transport.get_global_async_pool()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(main())
+            assert len(aio_transport._global_pools) == 1
+
+            aio_transport._reset_after_fork()
+
+            assert len(aio_transport._global_pools) == 0
+        finally:
+            loop.close()
+
+
+class TestAsyncRetries:
+    """Test retries in the async fetch path."""
+
+    def test_retries_throttled_request(self, sample_card):
+        """Test that a 429 is retried after its Retry-After."""
+        headers = Message()
+        headers["Retry-After"] = "0"
+        calls = []
+
+        class FlakyPool:
+            async def request(self, method, url, body=None, headers_=None):  # noqa: ARG002
+                calls.append(url)
+                if len(calls) == 1:
+                    raise urllib.error.HTTPError(url, 429, "Too Many Requests", headers, None)
+                message = Message()
+                message["Content-Type"] = "application/json; charset=utf-8"
+                return AsyncResponse(url, 200, "OK", message, json.dumps(sample_card).encode())
+
+        with patch("scrython.aio.base.get_global_async_pool", return_value=FlakyPool()):
+            card = run(cards.Named(exact="Black Lotus", rate_limit=False))
+
+        assert card.name == "Black Lotus"
+        assert len(calls) == 2
+
+
+class TestAsyncStaleCache:
+    """Test serving stale cache entries in the async fetch path."""
+
+    def test_stale_while_revalidate(self, mock_async_pool, sample_card):
+        """Test that a stale entry is returned while a background task refreshes it."""
+        set_global_cache(MemoryCache(keep_stale=60))
+        options = {"cache": True, "cache_ttl": 0.05, "stale_while_revalidate": 60}
+        mock_async_pool.responses.append(sample_card)
+        run(cards.Named(exact="Black Lotus", rate_limit=False, **options))
+        time.sleep(0.1)
+        mock_async_pool.responses[0] = {**sample_card, "name": "Refreshed"}
+
+        async def main():
+            card = await cards.Named(exact="Black Lotus", rate_limit=False, **options)
+            await asyncio.sleep(0.05)
+            return card
+
+        card = run(main())
+
+        assert card.name == "Black Lotus"
+        assert len(mock_async_pool.calls) == 2
+        assert (
+            get_global_cache()
+            .get_entry(generate_cache_key(card.endpoint, card._query_params))
+            .data["name"]
+            == "Refreshed"
+        )
+
+    def test_stale_if_error(self, sample_card):
+        """Test that a server error falls back to the stale entry."""
+        set_global_cache(MemoryCache(keep_stale=60))
+        options = {"cache": True, "cache_ttl": -1, "stale_if_error": 60, "retry": False}
+        card = cards.Named(exact="Black Lotus", rate_limit=False, **options)
+        get_global_cache().set(
+            generate_cache_key(card.endpoint, card._query_params), sample_card, ttl=-1
+        )
+
+        class DownPool:
+            async def request(self, method, url, body=None, headers=None):  # noqa: ARG002
+                raise urllib.error.HTTPError(url, 503, "Service Unavailable", Message(), None)
+
+        with patch("scrython.aio.base.get_global_async_pool", return_value=DownPool()):
+            card = run(card)
+
+        assert card.name == "Black Lotus"
+
+    def test_not_modified_refreshes_entry(self, sample_card):
+        """Test that expired entries are revalidated with their ETag."""
+        set_global_cache(MemoryCache(keep_stale=60))
+        options = {"cache": True, "cache_ttl": 60}
+        card = cards.Named(exact="Black Lotus", rate_limit=False, **options)
+        key = generate_cache_key(card.endpoint, card._query_params)
+        get_global_cache().set_entry(key, sample_card, -1, {"ETag": '"v1"'})
+        sent = []
+
+        class NotModifiedPool:
+            async def request(self, method, url, body=None, headers=None):  # noqa: ARG002
+                sent.append(headers)
+                raise urllib.error.HTTPError(url, 304, "Not Modified", Message(), None)
+
+        with patch("scrython.aio.base.get_global_async_pool", return_value=NotModifiedPool()):
+            card = run(card)
+
+        assert card.name == "Black Lotus"
+        assert sent[0]["If-none-match"] == '"v1"'
+        assert get_global_cache().get_entry(key).stale_for() < 0
@@ -0,0 +1,122 @@
+"""Tests for concurrent batch fetching."""
+
+import functools
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from scrython import fetch_many
+from scrython.base import ScryfallError
+from scrython.cache import get_global_cache
+from scrython.cards import ById
+from scrython.sets import ByCode
+
+
+@pytest.fixture
+def echo_urlopen(disable_rate_limiting, json_response):  # noqa: ARG001
+    """Mock urlopen returning a card whose id is the last path segment."""
+    state = {"calls": 0, "in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    def fake_urlopen(request):
+        path = request.get_full_url().split("?")[0]
+        card_id = path.rsplit("/", 1)[-1]
+
+        with lock:
+            state["calls"] += 1
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(0.02)
+        with lock:
+            state["in_flight"] -= 1
+
+        if card_id.startswith("missing"):
+            body = {
+                "object": "error",
+                "status": 404,
+                "code": "not_found",
+                "details": f"No card with id {card_id}",
+                "type": None,
+                "warnings": None,
+            }
+        else:
+            body = {"object": "card", "id": card_id, "name": f"Card {card_id}", "set": "tst"}
+        return json_response(body)
+
+    with patch("scrython.base.urlopen", side_effect=fake_urlopen):
+        yield state
+
+
+class TestFetchMany:
+    """Test fetch_many."""
+
+    def test_results_in_request_order(self, echo_urlopen):
+        """Test that results line up with the requests."""
+        ids = [str(i) for i in range(20)]
+
+        results = fetch_many([(ById, {"id": card_id}) for card_id in ids])
+
+        assert [card.card_id for card in results] == ids
+        assert echo_urlopen["calls"] == 20
+
+    def test_runs_concurrently(self, echo_urlopen):
+        """Test that several requests are in flight at once."""
+        fetch_many([(ById, {"id": str(i)}) for i in range(16)], max_workers=8)
+
+        assert echo_urlopen["max_in_flight"] > 1
+
+    def test_accepts_callables(self, echo_urlopen):  # noqa: ARG002
+        """Test that zero-argument callables are supported."""
+        results = fetch_many([functools.partial(ById, id="a"), functools.partial(ByCode, code="b")])
+
+        assert results[0].card_id == "a"
+        assert isinstance(results[1], ByCode)
+
+    def test_per_item_errors(self, echo_urlopen):  # noqa: ARG002
+        """Test that a failure is returned in place without affecting other items."""
+        results = fetch_many([(ById, {"id": "1"}), (ById, {"id": "missing"}), (ById, {"id": "3"})])
+
+        assert results[0].card_id == "1"
+        assert isinstance(results[1], ScryfallError)
+        assert results[1].status == 404
+        assert results[2].card_id == "3"
+
+    def test_raise_on_error(self, echo_urlopen):
+        """Test that return_exceptions=False raises the first failure after all complete."""
+        with pytest.raises(ScryfallError):
+            fetch_many(
+                [(ById, {"id": "missing-1"}), (ById, {"id": "2"})],
+                return_exceptions=False,
+            )
+
+        assert echo_urlopen["calls"] == 2
+
+    def test_respects_cache(self, echo_urlopen):
+        """Test that cached lookups skip the network."""
+        requests = [(ById, {"id": "1", "cache": True})] * 3
+
+        fetch_many(requests, max_workers=1)
+
+        assert echo_urlopen["calls"] == 1
+        assert get_global_cache().size() == 1
+
+    def test_empty(self):
+        """Test that no requests means no results."""
+        assert fetch_many([]) == []
+
+
+class TestFetchManyRateLimiting:
+    """Test that fetch_many goes through the global rate limiter."""
+
+    def test_rate_limit_enforced(self, echo_urlopen):  # noqa: ARG002
+        """Test that concurrent requests still share the global limiter."""
+        waits = []
+
+        with patch("scrython.base.RateLimiter") as limiter_class:
+            # Record waits with list.append, which (unlike Mock.call_count) is thread-safe
+            limiter_class.get_global_limiter.return_value.wait.side_effect = lambda: waits.append(1)
+            fetch_many([(ById, {"id": str(i)}) for i in range(5)])
+
+        assert len(waits) == 5
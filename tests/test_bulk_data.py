@@ -1,7 +1,10 @@
 """Tests for scrython.bulk_data module."""
 
 import gzip
+import hashlib
 import json
+import multiprocessing
+import sys
 import tempfile
 from io import BytesIO
 from pathlib import Path
@@ -9,7 +12,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from scrython.bulk_data import All, ById, ByType
+from scrython.bulk_data import All, BulkStore, ById, ByType
+from scrython.bulk_data.bulk_data_mixins import _iter_body
+from scrython.bulk_data.json_stream import iter_array
+from scrython.cards.cards import Object as CardObject
+from scrython.rulings.rulings import Object as RulingObject
 
 
 class TestAll:
@@ -270,7 +277,7 @@ class TestBulkDataDownload:
         with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
             # Create mock with NO Content-Encoding header (empty string)
             mock_response = MagicMock()
-            mock_response.read.return_value = plain_json
+            mock_response.read.side_effect = BytesIO(plain_json).read
             mock_response.info.return_value.get.return_value = ""  # No encoding header
             mock_response.__enter__.return_value = mock_response
             mock_response.__exit__.return_value = None
@@ -312,3 +319,580 @@ class TestBulkDataDownload:
             assert result == test_data
             assert len(result) == 1
             assert result[0]["name"] == "Test Card"
+
+
+class _RecordingBody(BytesIO):
+    """Response body recording the size of each read."""
+
+    def __init__(self, body):
+        super().__init__(body)
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return super().read(size)
+
+
+def _bulk_response(body, encoding="gzip"):
+    """File-like bulk download response serving body with a Content-Encoding."""
+    response = _RecordingBody(body)
+    response.info = MagicMock(return_value={"Content-Encoding": encoding})
+    response.headers = {"Content-Length": str(len(body))}
+    return response
+
+
+class TestBulkDataDownloadTo:
+    """Test streaming bulk data downloads to disk."""
+
+    RAW = json.dumps([{"id": f"card{i}", "name": f"Card {i}"} for i in range(200)]).encode()
+
+    @pytest.fixture
+    def bulk(self, mock_urlopen):
+        mock_urlopen.set_response("bulk_data/by_id.json")
+        return ByType(type="oracle_cards")
+
+    def _download(self, bulk, path, body, encoding="gzip", **kwargs):
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.return_value = _bulk_response(body, encoding)
+            return bulk.download_to(str(path), **kwargs)
+
+    def test_gzip_streamed_verbatim(self, bulk, tmp_path):
+        """Test that the decompressed bytes are written exactly as served."""
+        path = tmp_path / "cards.json"
+
+        written = self._download(bulk, path, gzip.compress(self.RAW), chunk_size=64)
+
+        assert written == len(self.RAW)
+        assert path.read_bytes() == self.RAW
+
+    def test_small_chunks_bound_output(self):
+        """Test that highly compressible data is decompressed in bounded pieces."""
+        raw = b"[" + b" " * 100_000 + b"]"
+        chunks = list(_iter_body(_bulk_response(gzip.compress(raw)), chunk_size=1024))
+
+        assert b"".join(chunks) == raw
+        assert max(len(chunk) for chunk in chunks) <= 1024
+
+    def test_uncompressed(self, bulk, tmp_path):
+        """Test that plain responses are copied through."""
+        path = tmp_path / "cards.json"
+
+        self._download(bulk, path, self.RAW, encoding="", chunk_size=100)
+
+        assert path.read_bytes() == self.RAW
+
+    def test_truncated_gzip_keeps_previous_file(self, bulk, tmp_path):
+        """Test that a failed download neither replaces the file nor leaves a temp file."""
+        path = tmp_path / "cards.json"
+        path.write_bytes(b"[]")
+
+        with pytest.raises(EOFError):
+            self._download(bulk, path, gzip.compress(self.RAW)[:-20])
+
+        assert path.read_bytes() == b"[]"
+        assert [p.name for p in tmp_path.iterdir()] == ["cards.json"]
+
+    def test_invalid_gzip(self, bulk, tmp_path):
+        """Test that data falsely claiming to be gzip raises."""
+        with pytest.raises(Exception):  # noqa: B017
+            self._download(bulk, tmp_path / "cards.json", b"not gzipped data")
+
+    def test_download_with_filepath_streams(self, bulk, tmp_path):
+        """Test that download(filepath=...) saves the original bytes and parses the file."""
+        path = tmp_path / "cards.json"
+
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.return_value = _bulk_response(
+                gzip.compress(self.RAW)
+            )
+            result = bulk.download(filepath=str(path))
+
+        assert path.read_bytes() == self.RAW
+        assert result == json.loads(self.RAW)
+
+    def test_download_in_memory_streams(self, bulk):
+        """Test that download() without a filepath never buffers the whole body."""
+        response = _bulk_response(gzip.compress(self.RAW))
+
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.return_value = response
+            result = bulk.download(chunk_size=64)
+
+        assert result == json.loads(self.RAW)
+        assert all(size == 64 for size in response.reads)
+
+
+def _chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestIterArray:
+    """Test incremental JSON array parsing."""
+
+    VALUES = [
+        {"name": "Jötun Grunt", "mana_cost": "{1}{W}", "faces": [{"a": [1, 2]}]},
+        -4.5e3,
+        12,
+        True,
+        None,
+        "a, string] with delimiters",
+        [],
+        {},
+    ]
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+    def test_any_chunk_size(self, size):
+        """Test that elements split across chunks, even mid-character, parse correctly."""
+        data = json.dumps(self.VALUES, ensure_ascii=False, indent=1).encode()
+
+        assert list(iter_array(_chunked(data, size))) == self.VALUES
+
+    def test_empty_array(self):
+        """Test that an empty array yields nothing."""
+        assert list(iter_array([b" [ ", b"] \n"])) == []
+
+    @pytest.mark.parametrize(
+        "data",
+        [b'{"a": 1}', b"[1 2]", b"[1, 2", b"[1,]", b"[1] 2", b"", b"[1.5e]"],
+    )
+    def test_invalid(self, data):
+        """Test that malformed arrays raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_array(_chunked(data, 2)))
+
+
+class TestBulkDataIterObjects:
+    """Test streaming iteration over bulk data files."""
+
+    RECORDS = [
+        {"object": "card", "id": "c1", "name": "Lightning Bolt"},
+        {"object": "ruling", "oracle_id": "o1", "comment": "Deals 3 damage."},
+        {"object": "card", "id": "c2", "name": "Counterspell"},
+    ]
+
+    @pytest.fixture
+    def bulk(self, mock_urlopen):
+        mock_urlopen.set_response("bulk_data/by_id.json")
+        return ByType(type="oracle_cards")
+
+    def test_from_download(self, bulk):
+        """Test that a gzip download is parsed as it streams."""
+        body = gzip.compress(json.dumps(self.RECORDS).encode())
+
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.return_value = _bulk_response(body)
+            objects = list(bulk.iter_objects(chunk_size=16))
+
+        assert objects == self.RECORDS
+        mock_download.assert_called_once_with(bulk.download_uri)
+
+    def test_from_file(self, bulk, tmp_path):
+        """Test that a local copy is read without downloading."""
+        path = tmp_path / "cards.json"
+        path.write_text(json.dumps(self.RECORDS))
+
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            objects = list(bulk.iter_objects(str(path), chunk_size=10))
+
+        assert objects == self.RECORDS
+        mock_download.assert_not_called()
+
+    def test_is_lazy(self, bulk, tmp_path):
+        """Test that objects are yielded before the rest of the file is read."""
+        path = tmp_path / "cards.json"
+        path.write_bytes(json.dumps(self.RECORDS).encode() + b"garbage")
+
+        objects = bulk.iter_objects(str(path), chunk_size=10)
+
+        assert next(objects) == self.RECORDS[0]
+        with pytest.raises(json.JSONDecodeError):
+            list(objects)
+
+    def test_wrap(self, bulk, tmp_path):
+        """Test that wrap=True wraps cards and rulings."""
+        path = tmp_path / "cards.json"
+        path.write_text(json.dumps(self.RECORDS))
+
+        card, ruling, _ = bulk.iter_objects(str(path), wrap=True)
+
+        assert isinstance(card, CardObject)
+        assert card.name == "Lightning Bolt"
+        assert isinstance(ruling, RulingObject)
+
+    def test_iter_cards(self, bulk, tmp_path):
+        """Test that iter_cards() yields only cards."""
+        path = tmp_path / "cards.json"
+        path.write_text(json.dumps(self.RECORDS))
+
+        names = [card.name for card in bulk.iter_cards(str(path))]
+
+        assert names == ["Lightning Bolt", "Counterspell"]
+
+
+class TestBulkDataFields:
+    """Test field projection when loading bulk data."""
+
+    RECORDS = [
+        {
+            "object": "card",
+            "id": "c1",
+            "name": "Lightning Bolt",
+            "prices": {"usd": "1.50"},
+            "image_uris": {"small": "https://example.com/bolt.jpg"},
+        },
+        {"object": "card", "id": "c2", "name": "Counterspell", "all_parts": [{"id": "t1"}]},
+    ]
+
+    @pytest.fixture
+    def bulk(self, mock_urlopen):
+        mock_urlopen.set_response("bulk_data/by_id.json")
+        return ByType(type="oracle_cards")
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = tmp_path / "cards.json"
+        path.write_text(json.dumps(self.RECORDS))
+        return str(path)
+
+    def test_iter_objects(self, bulk, path):
+        """Test that only the requested fields are kept, in the requested order."""
+        objects = list(bulk.iter_objects(path, fields=["prices", "id", "prices"]))
+
+        assert objects == [{"prices": {"usd": "1.50"}, "id": "c1"}, {"id": "c2"}]
+        assert list(objects[0]) == ["prices", "id"]
+
+    def test_wrap_without_object_field(self, bulk, path):
+        """Test that records are still wrapped when "object" isn't a kept field."""
+        cards = list(bulk.iter_cards(path, fields=["id", "name"]))
+
+        assert [card.name for card in cards] == ["Lightning Bolt", "Counterspell"]
+        assert cards[0].to_dict() == {"id": "c1", "name": "Lightning Bolt"}
+
+    def test_download_in_memory(self, bulk):
+        """Test that download(fields=...) trims objects from a gzip response."""
+        body = gzip.compress(json.dumps(self.RECORDS).encode())
+
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.return_value = _bulk_response(body)
+            result = bulk.download(fields=["id"])
+
+        assert result == [{"id": "c1"}, {"id": "c2"}]
+
+    def test_download_in_memory_streams(self, bulk):
+        """Test that download(fields=...) parses the response in chunks instead of buffering it."""
+        records = [
+            {"object": "card", "id": f"c{i}", "image_uris": {"x": "y" * 50}} for i in range(50)
+        ]
+        response = _bulk_response(gzip.compress(json.dumps(records).encode()))
+
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.return_value = response
+            result = bulk.download(fields=["id"], chunk_size=256)
+
+        assert result == [{"id": f"c{i}"} for i in range(50)]
+        assert all(size == 256 for size in response.reads)
+        assert len(response.reads) > 1
+
+    def test_download_to_file_keeps_full_file(self, bulk, tmp_path):
+        """Test that the saved file is complete while the returned data is trimmed."""
+        path = tmp_path / "cards.json"
+        body = gzip.compress(json.dumps(self.RECORDS).encode())
+
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.return_value = _bulk_response(body)
+            result = bulk.download(filepath=str(path), fields=["name"])
+
+        assert result == [{"name": "Lightning Bolt"}, {"name": "Counterspell"}]
+        assert json.loads(path.read_text()) == self.RECORDS
+
+    def test_string_fields_rejected(self, bulk, path):
+        """Test that a single string isn't mistaken for a list of one-letter fields."""
+        with pytest.raises(TypeError):
+            list(bulk.iter_objects(path, fields="name"))
+
+
+class TestBulkDataWhere:
+    """Test filtering bulk data while streaming."""
+
+    RECORDS = [
+        {
+            "object": "card",
+            "id": "c1",
+            "lang": "en",
+            "set": "neo",
+            "games": ["paper", "mtgo"],
+            "legalities": {"modern": "legal"},
+        },
+        {
+            "object": "card",
+            "id": "c2",
+            "lang": "ja",
+            "set": "neo",
+            "games": ["paper"],
+            "legalities": {"modern": "legal"},
+        },
+        {
+            "object": "card",
+            "id": "c3",
+            "lang": "en",
+            "set": "snc",
+            "games": ["arena"],
+            "legalities": {"modern": "not_legal"},
+        },
+        {"object": "card", "id": "c4", "lang": "en", "set": "dmu", "games": ["paper"]},
+    ]
+
+    @pytest.fixture
+    def bulk(self, mock_urlopen):
+        mock_urlopen.set_response("bulk_data/by_id.json")
+        return ByType(type="default_cards")
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        path = tmp_path / "cards.json"
+        path.write_text(json.dumps(self.RECORDS))
+        return str(path)
+
+    def _ids(self, bulk, path, where, **kwargs):
+        return [card["id"] for card in bulk.iter_objects(path, where=where, **kwargs)]
+
+    def test_equality(self, bulk, path):
+        """Test that scalar fields must equal the spec value."""
+        assert self._ids(bulk, path, {"lang": "en"}) == ["c1", "c3", "c4"]
+
+    def test_list_field_contains(self, bulk, path):
+        """Test that list fields match if they contain the value."""
+        assert self._ids(bulk, path, {"games": "paper"}) == ["c1", "c2", "c4"]
+
+    def test_any_of(self, bulk, path):
+        """Test that a list of values matches any of them, for scalar and list fields."""
+        assert self._ids(bulk, path, {"set": ["snc", "dmu"]}) == ["c3", "c4"]
+        assert self._ids(bulk, path, {"games": {"arena", "mtgo"}}) == ["c1", "c3"]
+
+    def test_dotted_paths_and_missing_fields(self, bulk, path):
+        """Test that nested fields are reached by dotted paths and missing ones don't match."""
+        where = {"lang": "en", "legalities.modern": "legal"}
+
+        assert self._ids(bulk, path, where) == ["c1"]
+
+    def test_callable(self, bulk, path):
+        """Test that a callable sees the full object, even fields that are projected away."""
+        objects = list(
+            bulk.iter_objects(path, where=lambda card: card["set"] == "neo", fields=["id"])
+        )
+
+        assert objects == [{"id": "c1"}, {"id": "c2"}]
+
+    def test_iter_cards(self, bulk, path):
+        """Test that only matching cards are wrapped."""
+        cards = list(bulk.iter_cards(path, where={"lang": "ja"}))
+
+        assert [card.card_id for card in cards] == ["c2"]
+
+    def test_download(self, bulk):
+        """Test that download(where=...) keeps only matching objects."""
+        body = gzip.compress(json.dumps(self.RECORDS).encode())
+
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.return_value = _bulk_response(body)
+            result = bulk.download(where={"lang": "en", "games": "paper"}, fields=["id"])
+
+        assert result == [{"id": "c1"}, {"id": "c4"}]
+
+    def test_download_streams(self, bulk):
+        """Test that download(where=...) filters the response in chunks instead of buffering it."""
+        records = [
+            {"object": "card", "id": f"c{i}", "lang": "en" if i % 10 else "ja"} for i in range(100)
+        ]
+        response = _bulk_response(json.dumps(records).encode(), encoding="")
+
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.return_value = response
+            result = bulk.download(where={"lang": "ja"}, chunk_size=512)
+
+        assert [card["id"] for card in result] == [f"c{i}" for i in range(0, 100, 10)]
+        assert all(size == 512 for size in response.reads)
+        assert len(response.reads) > 1
+
+    def test_invalid_where(self, bulk, path):
+        """Test that a where that is neither callable nor a mapping is rejected."""
+        with pytest.raises(TypeError):
+            list(bulk.iter_objects(path, where="lang=en"))
+
+
+def _record_types(directory, prefix, count):
+    """Record count manifest entries from a separate process."""
+    store = BulkStore(directory)
+    for i in range(count):
+        bulk_type = f"{prefix}{i}"
+        store._record({"id": bulk_type, "type": bulk_type, "updated_at": "", "size": 0})
+
+
+def _listing(**updated_at):
+    """Bulk-data listing with the given updated_at per type."""
+    return {
+        "object": "list",
+        "has_more": False,
+        "data": [
+            {
+                "object": "bulk_data",
+                "id": f"{bulk_type}-id",
+                "type": bulk_type,
+                "download_uri": f"https://data.scryfall.io/{bulk_type}.json",
+                "updated_at": timestamp,
+            }
+            for bulk_type, timestamp in updated_at.items()
+        ],
+    }
+
+
+class TestBulkStore:
+    """Test the local bulk data store."""
+
+    OLD = "2025-01-01T10:00:00.000+00:00"
+    NEW = "2025-01-01T22:00:00.000+00:00"
+    BODY = json.dumps([{"object": "card", "id": "c1"}]).encode()
+
+    @pytest.fixture
+    def download(self):
+        with patch("scrython.bulk_data.bulk_data_mixins.urlopen") as mock_download:
+            mock_download.return_value.__enter__.side_effect = lambda: _bulk_response(
+                gzip.compress(self.BODY)
+            )
+            yield mock_download
+
+    def test_first_sync_records_manifest(self, mock_urlopen, download, tmp_path):
+        """Test that a first sync downloads the file and records its metadata."""
+        mock_urlopen.set_response(data=_listing(default_cards=self.OLD, rulings=self.OLD))
+        store = BulkStore(str(tmp_path / "bulk"))
+
+        assert store.sync("default_cards") == ["default_cards"]
+
+        assert Path(store.path("default_cards")).read_bytes() == self.BODY
+        assert store.get("default_cards") == {
+            "id": "default_cards-id",
+            "type": "default_cards",
+            "updated_at": self.OLD,
+            "size": len(self.BODY),
+            "sha256": hashlib.sha256(self.BODY).hexdigest(),
+        }
+        assert store.get("rulings") is None
+        download.assert_called_once_with("https://data.scryfall.io/default_cards.json")
+        assert store.verify("default_cards")
+
+    def test_unchanged_skips_download(self, mock_urlopen, download, tmp_path):
+        """Test that a sync with the same updated_at downloads nothing."""
+        mock_urlopen.set_response(data=_listing(default_cards=self.OLD))
+        store = BulkStore(str(tmp_path))
+        store.sync("default_cards")
+
+        assert store.sync() == []
+        assert download.call_count == 1
+        assert len(mock_urlopen.calls) == 2
+
+    def test_newer_file_downloaded(self, mock_urlopen, download, tmp_path):
+        """Test that a newer updated_at downloads the file again."""
+        mock_urlopen.set_response(data=_listing(default_cards=self.OLD, rulings=self.OLD))
+        store = BulkStore(str(tmp_path))
+        store.sync(["default_cards", "rulings"])
+
+        mock_urlopen.set_response(data=_listing(default_cards=self.NEW, rulings=self.OLD))
+
+        assert store.sync() == ["default_cards"]
+        assert store.get("default_cards")["updated_at"] == self.NEW
+        assert download.call_count == 3
+
+    def test_missing_file_downloaded(self, mock_urlopen, download, tmp_path):
+        """Test that a deleted file is downloaded even if the manifest is current."""
+        mock_urlopen.set_response(data=_listing(default_cards=self.OLD))
+        store = BulkStore(str(tmp_path))
+        store.sync("default_cards")
+        Path(store.path("default_cards")).unlink()
+
+        assert store.sync() == ["default_cards"]
+        assert download.call_count == 2
+
+    def test_force(self, mock_urlopen, download, tmp_path):
+        """Test that force=True downloads current files."""
+        mock_urlopen.set_response(data=_listing(default_cards=self.OLD))
+        store = BulkStore(str(tmp_path))
+        store.sync("default_cards")
+
+        assert store.sync(force=True) == ["default_cards"]
+        assert download.call_count == 2
+
+    def test_failed_download_keeps_previous(self, mock_urlopen, download, tmp_path):
+        """Test that a failed download leaves the file and manifest untouched."""
+        mock_urlopen.set_response(data=_listing(default_cards=self.OLD))
+        store = BulkStore(str(tmp_path))
+        store.sync("default_cards")
+        entry = store.get("default_cards")
+
+        mock_urlopen.set_response(data=_listing(default_cards=self.NEW))
+        download.return_value.__enter__.side_effect = lambda: _bulk_response(
+            gzip.compress(self.BODY)[:-10]
+        )
+        with pytest.raises(EOFError):
+            store.sync()
+
+        assert store.get("default_cards") == entry
+        assert store.verify("default_cards")
+        expected = ["default_cards.json", "manifest.json"]
+        if sys.platform != "win32":
+            expected.append(BulkStore.LOCK)
+        assert sorted(p.name for p in tmp_path.iterdir()) == expected
+
+    @pytest.mark.usefixtures("download")
+    def test_verify_detects_changes(self, mock_urlopen, tmp_path):
+        """Test that verify() compares contents, not just size."""
+        mock_urlopen.set_response(data=_listing(default_cards=self.OLD))
+        store = BulkStore(str(tmp_path))
+        store.sync("default_cards")
+
+        Path(store.path("default_cards")).write_bytes(self.BODY.replace(b"c1", b"c2"))
+
+        assert not store.verify("default_cards")
+        assert not store.verify("rulings")
+
+    @pytest.mark.usefixtures("download")
+    def test_iter_objects(self, mock_urlopen, tmp_path):
+        """Test streaming a stored file without any request."""
+        mock_urlopen.set_response(data=_listing(default_cards=self.OLD))
+        store = BulkStore(str(tmp_path))
+        store.sync("default_cards")
+
+        cards = list(store.iter_objects("default_cards", wrap=True))
+
+        assert [card.card_id for card in cards] == ["c1"]
+        assert len(mock_urlopen.calls) == 1
+        with pytest.raises(KeyError):
+            list(store.iter_objects("rulings"))
+
+    def test_unknown_type(self, mock_urlopen, tmp_path):
+        """Test that syncing a type Scryfall doesn't list raises KeyError."""
+        mock_urlopen.set_response(data=_listing(default_cards=self.OLD))
+
+        with pytest.raises(KeyError):
+            BulkStore(str(tmp_path)).sync("nonexistent_cards")
+
+    def test_empty_store_syncs_nothing(self, mock_urlopen, tmp_path):
+        """Test that syncing an empty store without types makes no request."""
+        assert BulkStore(str(tmp_path)).sync() == []
+        assert mock_urlopen.calls == []
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="requires fcntl")
+    def test_concurrent_processes_keep_each_others_entries(self, tmp_path):
+        """Test that manifest updates from several processes are all kept."""
+        directory = str(tmp_path / "bulk")
+        BulkStore(directory)
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_record_types, args=(directory, prefix, 25))
+            for prefix in ("a", "b", "c")
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+
+        assert len(BulkStore(directory).manifest()) == 75
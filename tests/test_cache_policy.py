@@ -0,0 +1,176 @@
+"""Tests for per-endpoint cache TTL policies."""
+
+import datetime
+import time
+
+import pytest
+
+from scrython import bulk_data, sets
+from scrython.cache import get_global_cache
+from scrython.cache_policy import UNTIL_BULK_UPDATE, TTLPolicy
+from scrython.cards import ById, Random, Search
+from scrython.catalogs import CardNames
+
+API = "https://api.scryfall.com"
+
+LIST = {"object": "list", "has_more": False, "data": [{"object": "card", "id": "1"}]}
+
+
+def _bulk_data(updated_at):
+    return {
+        "object": "list",
+        "has_more": False,
+        "data": [
+            {"object": "bulk_data", "type": "oracle_cards", "updated_at": updated_at},
+            {"object": "bulk_data", "type": "all_cards", "updated_at": "2020-01-01T00:00:00+00:00"},
+        ],
+    }
+
+
+class TestTTLPolicy:
+    """Test TTL decisions."""
+
+    def test_defaults(self):
+        """Test the default rules for slow-changing and uncacheable endpoints."""
+        policy = TTLPolicy()
+
+        assert policy.ttl_for(None, f"{API}/catalog/card-names?format=json") == 86400
+        assert policy.ttl_for(None, f"{API}/sets/neo") == 86400
+        assert policy.ttl_for(None, f"{API}/symbology") == 86400
+        assert policy.ttl_for(None, f"{API}/cards/random", cache=True) is None
+        assert policy.ttl_for(None, f"{API}/cards/named") is None
+        assert policy.ttl_for(None, f"{API}/cards/named", cache=True) == 3600
+
+    def test_explicit_options(self):
+        """Test that cache=False and cache_ttl override the rules."""
+        policy = TTLPolicy()
+
+        assert policy.ttl_for(None, f"{API}/sets", cache=False) is None
+        assert policy.ttl_for(None, f"{API}/sets", cache_ttl=60) == 60
+        assert policy.ttl_for(None, f"{API}/cards/named", cache=True, cache_ttl=60) == 60
+
+    def test_shareable(self):
+        """Test that only NEVER endpoints opt out of sharing in-flight requests."""
+        policy = TTLPolicy()
+
+        assert not policy.shareable(None, f"{API}/cards/random?q=t:dragon")
+        assert policy.shareable(None, f"{API}/cards/named?exact=Opt")
+        assert policy.shareable(None, f"{API}/sets/neo")
+
+    def test_class_rules_and_priority(self):
+        """Test that class rules match subclasses and later rules win."""
+        policy = TTLPolicy(rules=None)
+        policy.register("cards/*", 100)
+        policy.register(Search, 10)
+
+        search = Search.__new__(Search)
+        assert policy.ttl_for(search, f"{API}/cards/search") == 10
+        assert policy.ttl_for(None, f"{API}/cards/search") == 100
+
+    def test_patterns_ignore_leading_slash(self):
+        """Test that '/sets/*' and 'sets/*' are the same pattern."""
+        policy = TTLPolicy(rules=None)
+        policy.register("/sets/*", 5)
+
+        assert policy.match(None, f"{API}/sets/neo") == 5
+
+    def test_invalid_ttl(self):
+        """Test that bad TTLs are rejected."""
+        policy = TTLPolicy()
+
+        for ttl in (-1, "sometimes"):
+            with pytest.raises(ValueError):
+                policy.register("cards/*", ttl)
+
+    def test_until_bulk_update(self):
+        """Test that UNTIL_BULK_UPDATE expires at the next expected update."""
+        policy = TTLPolicy(rules=None, bulk_update_interval=3600)
+        policy.register("cards/*", UNTIL_BULK_UPDATE)
+
+        assert policy.ttl_for(None, f"{API}/cards/abc") == 3600
+
+        updated = datetime.datetime.fromtimestamp(time.time() - 600, datetime.timezone.utc)
+        policy.record_bulk_update(_bulk_data(updated.isoformat()))
+
+        assert policy.ttl_for(None, f"{API}/cards/abc") == pytest.approx(3000, abs=5)
+
+    def test_until_bulk_update_skips_missed_updates(self):
+        """Test that an old update time rolls forward to the next scheduled update."""
+        policy = TTLPolicy(bulk_update_interval=3600)
+        updated = datetime.datetime.fromtimestamp(
+            time.time() - 3 * 3600 - 600, datetime.timezone.utc
+        )
+        policy.record_bulk_update({"object": "bulk_data", "updated_at": updated.isoformat()})
+
+        assert policy.bulk_update_ttl() == pytest.approx(3000, abs=5)
+
+    def test_record_ignores_other_responses(self):
+        """Test that non-bulk-data responses don't change the update time."""
+        policy = TTLPolicy(bulk_update_interval=3600)
+        policy.record_bulk_update(LIST)
+        policy.record_bulk_update({"object": "card", "updated_at": "2020-01-01T00:00:00+00:00"})
+
+        assert policy.bulk_update_ttl() == 3600
+
+
+class TestRequestTTLPolicy:
+    """Test that requests apply the global TTL policy."""
+
+    def test_catalogs_cached_automatically(self, mock_urlopen):
+        """Test that default rules cache without cache=True."""
+        mock_urlopen.set_response(data={"object": "catalog", "data": ["Bolt"]})
+
+        CardNames()
+        CardNames()
+
+        assert len(mock_urlopen.calls) == 1
+
+    def test_random_never_cached(self, mock_urlopen):
+        """Test that a NEVER rule wins over cache=True."""
+        mock_urlopen.set_response(data={"object": "card", "id": "1"})
+
+        Random(cache=True)
+        Random(cache=True)
+
+        assert len(mock_urlopen.calls) == 2
+        assert get_global_cache().size() == 0
+
+    def test_registered_rule(self, mock_urlopen):
+        """Test that a registered rule enables caching for matching requests."""
+        TTLPolicy.get_global_policy().register(Search, 60)
+        mock_urlopen.set_response(data=LIST)
+
+        Search(q="bolt")
+        Search(q="bolt")
+
+        assert len(mock_urlopen.calls) == 1
+
+    def test_rule_enables_entity_lookups(self, mock_urlopen):
+        """Test that policy-cached cards answer identifier lookups."""
+        TTLPolicy.get_global_policy().register("cards/*", UNTIL_BULK_UPDATE)
+        mock_urlopen.set_response(data=LIST)
+
+        Search(q="bolt")
+        card = ById(id="1")
+
+        assert card.card_id == "1"
+        assert len(mock_urlopen.calls) == 1
+
+    def test_bulk_data_responses_recorded(self, mock_urlopen):
+        """Test that bulk-data responses update the policy's update time."""
+        TTLPolicy.set_global_policy(TTLPolicy(bulk_update_interval=3600))
+        updated = datetime.datetime.fromtimestamp(time.time() - 600, datetime.timezone.utc)
+        mock_urlopen.set_response(data=_bulk_data(updated.isoformat()))
+
+        bulk_data.All()
+
+        assert TTLPolicy.get_global_policy().bulk_update_ttl() == pytest.approx(3000, abs=5)
+
+    def test_cache_false_disables(self, mock_urlopen):
+        """Test that cache=False skips even rule-matched caching."""
+        mock_urlopen.set_response(data={"object": "list", "has_more": False, "data": []})
+
+        sets.All(cache=False)
+        sets.All(cache=False)
+
+        assert len(mock_urlopen.calls) == 2
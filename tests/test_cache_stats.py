@@ -0,0 +1,251 @@
+"""Tests for cache statistics."""
+
+import threading
+import time
+
+from scrython.base import ScrythonRequestHandler
+from scrython.cache import (
+    CacheBackend,
+    FileCache,
+    MemoryCache,
+    SQLiteCache,
+    TieredCache,
+    get_global_cache,
+    set_global_cache,
+)
+from scrython.cache_stats import CacheStats
+from scrython.cards import ById, Named
+
+
+class TestCacheStats:
+    """Test the CacheStats counters."""
+
+    def test_snapshot_and_reset(self):
+        """Test that snapshots copy the counters and reset zeroes them."""
+        stats = CacheStats()
+        stats.record("hits", 3)
+        stats.record("misses")
+        stats.record_lookup("cards/named", "hits")
+
+        snapshot = stats.snapshot(entries=5, nbytes=100)
+        stats.reset()
+
+        assert snapshot.hits == 3
+        assert snapshot.lookups == 4
+        assert snapshot.hit_rate == 0.75
+        assert snapshot.entries == 5
+        assert snapshot.bytes == 100
+        assert snapshot.endpoints == {"cards/named": {"hits": 1, "misses": 0, "stale_hits": 0}}
+        assert stats.snapshot().hits == 0
+        assert stats.snapshot().endpoints == {}
+
+    def test_lookups_merged_across_threads(self):
+        """Test that per-thread endpoint counts are merged, including exited threads."""
+        stats = CacheStats()
+
+        def lookups():
+            for _ in range(10):
+                stats.record_lookup("cards/named", "misses")
+
+        for _ in range(20):
+            thread = threading.Thread(target=lookups)
+            thread.start()
+            thread.join()
+        stats.record_lookup("cards/named", "hits")
+
+        assert stats.snapshot().endpoints == {
+            "cards/named": {"hits": 1, "misses": 200, "stale_hits": 0}
+        }
+        # Exited threads' counts are folded into one total
+        assert len(stats._live) == 1
+
+        stats.reset()
+        stats.record_lookup("sets", "hits")
+        assert stats.snapshot().endpoints == {"sets": {"hits": 1, "misses": 0, "stale_hits": 0}}
+
+    def test_hit_rate_without_lookups(self):
+        """Test that an unused cache reports a zero hit rate."""
+        assert CacheStats().snapshot().hit_rate == 0.0
+
+
+class TestBackendStats:
+    """Test that backends count their events."""
+
+    def test_memory_cache(self):
+        """Test hits, misses, sets and usage in MemoryCache."""
+        cache = MemoryCache(max_bytes=10_000)
+        cache.set("key", {"v": 1}, ttl=60)
+        cache.get("key")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+
+        assert (stats.hits, stats.misses, stats.sets) == (1, 1, 1)
+        assert stats.entries == 1
+        assert stats.bytes == len('{"v": 1}')
+
+    def test_memory_cache_bytes_untracked(self):
+        """Test that bytes is None unless max_bytes is set."""
+        cache = MemoryCache()
+        cache.set("key", {"v": 1}, ttl=60)
+
+        assert cache.get_stats().bytes is None
+
+    def test_memory_cache_expirations_and_evictions(self):
+        """Test that LRU evictions and expired removals are told apart."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("old", {"v": 1}, ttl=-1)
+        cache.set("a", {"v": 2}, ttl=60)
+        cache.set("b", {"v": 3}, ttl=60)
+        cache.set("c", {"v": 4}, ttl=60)
+        cache.set("gone", {"v": 5}, ttl=-1)
+        cache.get("gone")
+
+        stats = cache.get_stats()
+
+        # "old" makes room for "b" and "gone" is dropped on read, both
+        # expired; "a" and "b" are evicted unexpired
+        assert stats.evictions == 2
+        assert stats.expirations == 2
+
+    def test_stale_hits(self):
+        """Test that expired entries returned by get_entry count as stale hits."""
+        cache = MemoryCache(keep_stale=60)
+        cache.set("key", {"v": 1}, ttl=-1)
+
+        cache.get_entry("key")
+        cache.get("key")
+
+        stats = cache.get_stats()
+        assert (stats.stale_hits, stats.misses) == (1, 1)
+
+    def test_sqlite_cache(self, tmp_path):
+        """Test counting and usage in SQLiteCache."""
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("key", {"v": 1}, ttl=60)
+        cache.set("old", {"v": 2}, ttl=-1)
+        cache.get("key")
+        cache.get_entry("old")
+        cache.purge_expired()
+
+        stats = cache.get_stats()
+
+        assert (stats.hits, stats.misses, stats.sets, stats.expirations) == (1, 1, 2, 1)
+        assert stats.entries == 1
+        assert stats.bytes > 0
+
+    def test_file_cache(self, tmp_path):
+        """Test counting, evictions and usage in FileCache."""
+        cache = FileCache(str(tmp_path), compression="none")
+        cache.set("old", {"v": 0}, ttl=-1)
+        for i in range(3):
+            cache.set(str(i), {"v": i}, ttl=60)
+            time.sleep(0.01)
+        cache.get("2")
+        cache.get("missing")
+
+        entry_size = cache.get_stats().bytes // 4
+        cache.prune(max_bytes=2 * entry_size)
+        stats = cache.get_stats()
+
+        assert (stats.hits, stats.misses, stats.sets) == (1, 1, 4)
+        assert (stats.expirations, stats.evictions) == (1, 1)
+        assert stats.entries == 2
+
+    def test_tiered_cache(self):
+        """Test that TieredCache counts across tiers and each tier counts its own."""
+        cache = TieredCache(MemoryCache())
+        cache.set("key", {"v": 1}, ttl=60)
+        cache.l1.clear()
+
+        cache.get("key")
+        cache.get("key")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.sets) == (2, 1, 1)
+        assert stats.entries == 1
+        assert cache.l1.get_stats().hits == 1
+        assert cache.l2.get_stats().hits == 1
+
+    def test_custom_backend(self):
+        """Test that backends implementing only get/set are counted through get_entry."""
+
+        class DictCache(CacheBackend):
+            def __init__(self):
+                self.data = {}
+
+            def get(self, key):
+                return self.data.get(key)
+
+            def set(self, key, data, ttl):  # noqa: ARG002
+                self.data[key] = data
+
+            def clear(self):
+                self.data.clear()
+
+        cache = DictCache()
+        cache.set_entry("key", {"v": 1}, 60)
+        cache.get_entry("key")
+        cache.get_entry("missing")
+
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.sets) == (1, 1, 1)
+        assert stats.entries is None
+
+    def test_reset_stats(self):
+        """Test that reset_stats() zeroes the counters but keeps the entries."""
+        cache = MemoryCache()
+        cache.set("key", {"v": 1}, ttl=60)
+        cache.get("key")
+
+        cache.reset_stats()
+
+        stats = cache.get_stats()
+        assert (stats.hits, stats.sets) == (0, 0)
+        assert stats.entries == 1
+
+
+class TestRequestStats:
+    """Test per-endpoint statistics recorded by requests."""
+
+    def test_endpoint_breakdown(self, mock_urlopen):
+        """Test that lookups are counted under the endpoint's path template."""
+        mock_urlopen.set_response(data={"object": "card", "id": "abc", "name": "Bolt"})
+
+        Named(fuzzy="bolt", cache=True)
+        Named(fuzzy="bolt", cache=True)
+        ById(id="abc", cache=True, entity_cache=False)
+        ById(id="def", cache=True, entity_cache=False)
+
+        stats = get_global_cache().get_stats()
+
+        assert stats.endpoints["cards/named"] == {"hits": 1, "misses": 1, "stale_hits": 0}
+        assert stats.endpoints["cards/:id"]["misses"] == 2
+        assert (stats.hits, stats.misses, stats.sets) == (1, 3, 3)
+
+    def test_stale_lookups(self, mock_urlopen):
+        """Test that served-stale lookups are counted as stale hits."""
+
+        class Handler(ScrythonRequestHandler):
+            _endpoint = "cards/named"
+
+        set_global_cache(MemoryCache(keep_stale=60))
+        mock_urlopen.set_response(data={"object": "card", "name": "Bolt"})
+        options = {"cache": True, "cache_ttl": 0.05, "stale_if_error": 60}
+        Handler(fuzzy="bolt", **options)
+        time.sleep(0.1)
+
+        Handler(fuzzy="bolt", **options)
+
+        assert get_global_cache().get_stats().endpoints["cards/named"]["stale_hits"] == 1
+
+    def test_uncached_requests_not_counted(self, mock_urlopen):
+        """Test that requests without caching record nothing."""
+        mock_urlopen.set_response(data={"object": "card", "id": "abc", "name": "Bolt"})
+
+        ById(id="abc")
+
+        stats = get_global_cache().get_stats()
+        assert stats.lookups == 0
+        assert stats.endpoints == {}
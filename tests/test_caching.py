@@ -1,10 +1,36 @@
 """Tests for caching functionality."""
 
 import contextlib
+import io
+import json
+import os
+import sqlite3
+import threading
 import time
+import urllib.error
+import zlib
+from email.message import Message
+from unittest.mock import patch
 
+import pytest
+
+from scrython import base as base_module
+from scrython import cache as cache_module
 from scrython.base import ScrythonRequestHandler
-from scrython.cache import MemoryCache, generate_cache_key, get_global_cache, reset_global_cache
+from scrython.cache import (
+    CacheBackend,
+    FileCache,
+    MemoryCache,
+    SQLiteCache,
+    StripedMemoryCache,
+    TieredCache,
+    generate_cache_key,
+    get_global_cache,
+    reset_global_cache,
+    set_global_cache,
+)
+from scrython.cache_policy import TTLPolicy
+from scrython.retry import RetryPolicy
 
 
 class TestMemoryCache:
@@ -90,6 +116,684 @@ class TestMemoryCache:
         assert retrieved["name"] == "Original"
 
 
+class TestMemoryCacheBounds:
+    """Test MemoryCache size limits and LRU eviction."""
+
+    def test_default_is_bounded(self):
+        """Test that the cache is bounded unless told otherwise."""
+        assert MemoryCache().max_entries == 10_000
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest entry is evicted once max_entries is reached."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", {"v": 1}, ttl=3600)
+        cache.set("b", {"v": 2}, ttl=3600)
+        cache.set("c", {"v": 3}, ttl=3600)
+
+        assert cache.size() == 2
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+
+    def test_get_marks_entry_recently_used(self):
+        """Test that reading an entry protects it from eviction."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", {"v": 1}, ttl=3600)
+        cache.set("b", {"v": 2}, ttl=3600)
+
+        cache.get("a")
+        cache.set("c", {"v": 3}, ttl=3600)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+
+    def test_max_bytes(self):
+        """Test that entries are evicted to stay under max_bytes."""
+        payload = {"text": "x" * 90}  # About 100 bytes as JSON
+        cache = MemoryCache(max_entries=None, max_bytes=250)
+
+        for key in ("a", "b", "c"):
+            cache.set(key, payload, ttl=3600)
+
+        assert cache.size() == 2
+        assert cache.size_bytes() <= 250
+        assert cache.get("a") is None
+
+    def test_oversized_entry_not_stored(self):
+        """Test that an entry larger than max_bytes is skipped."""
+        cache = MemoryCache(max_bytes=10)
+
+        cache.set("big", {"text": "x" * 100}, ttl=3600)
+
+        assert cache.size() == 0
+        assert cache.size_bytes() == 0
+
+    def test_overwrite_updates_size(self):
+        """Test that replacing an entry doesn't double count its size."""
+        cache = MemoryCache(max_bytes=1000)
+        cache.set("a", {"text": "x" * 100}, ttl=3600)
+        cache.set("a", {"text": "x"}, ttl=3600)
+
+        assert cache.size() == 1
+        assert cache.size_bytes() == len('{"text": "x"}')
+
+    def test_purge_expired(self):
+        """Test that purge_expired removes only expired entries."""
+        cache = MemoryCache()
+        cache.set("old", {"v": 1}, ttl=0.05)
+        cache.set("new", {"v": 2}, ttl=3600)
+        time.sleep(0.1)
+
+        assert cache.purge_expired() == 1
+        assert cache.size() == 1
+        assert cache.get("new") is not None
+
+
+class TestStripedMemoryCache:
+    """Test the lock-striped in-memory cache."""
+
+    def test_set_and_get(self):
+        """Test storing and retrieving entries across stripes."""
+        cache = StripedMemoryCache(stripes=4)
+        for i in range(100):
+            cache.set(f"key{i}", {"v": i}, ttl=60)
+
+        assert all(cache.get(f"key{i}") == {"v": i} for i in range(100))
+        assert cache.size() == 100
+        assert cache.get("missing") is None
+
+    def test_entries_spread_over_stripes(self):
+        """Test that keys are distributed between the stripes."""
+        cache = StripedMemoryCache(stripes=4)
+        for i in range(100):
+            cache.set(f"key{i}", {"v": i}, ttl=60)
+
+        assert all(stripe.size() > 0 for stripe in cache._stripes)
+
+    def test_limits_divided_between_stripes(self):
+        """Test that max_entries bounds the whole cache."""
+        cache = StripedMemoryCache(stripes=4, max_entries=40)
+        for i in range(200):
+            cache.set(f"key{i}", {"v": i}, ttl=60)
+
+        assert cache.size() <= 40
+        assert all(stripe.max_entries == 10 for stripe in cache._stripes)
+
+    def test_expiry_validators_and_stale(self):
+        """Test TTLs, validators and keep_stale pass through to the stripes."""
+        cache = StripedMemoryCache(keep_stale=60)
+        cache.set_entry("key", {"v": 1}, -1, {"ETag": '"a"'})
+
+        assert cache.get("key") is None
+        assert cache.get_entry("key").validators == {"ETag": '"a"'}
+        assert cache.purge_expired() == 0
+
+    def test_clear(self):
+        """Test that clear empties every stripe."""
+        cache = StripedMemoryCache()
+        cache.set("key", {"v": 1}, ttl=60)
+
+        cache.clear()
+
+        assert cache.size() == 0
+
+    def test_stats_summed_over_stripes(self):
+        """Test that statistics combine all stripes."""
+        cache = StripedMemoryCache(stripes=4)
+        for i in range(10):
+            cache.set(f"key{i}", {"v": i}, ttl=60)
+            cache.get(f"key{i}")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+
+        assert (stats.hits, stats.misses, stats.sets, stats.entries) == (10, 1, 10, 10)
+
+        cache.reset_stats()
+        assert cache.get_stats().hits == 0
+
+    def test_concurrent_access(self):
+        """Test that many threads can read and write at once."""
+        cache = StripedMemoryCache(stripes=8)
+
+        def worker(n):
+            for i in range(200):
+                cache.set(f"{n}-{i}", {"v": i}, ttl=60)
+                assert cache.get(f"{n}-{i}") == {"v": i}
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.size() == 1600
+
+    def test_invalid_stripes(self):
+        """Test that the stripe count must be positive."""
+        with pytest.raises(ValueError):
+            StripedMemoryCache(stripes=0)
+
+
+class TestSQLiteCache:
+    """Test the SQLite-backed persistent cache."""
+
+    def test_set_and_get(self, tmp_path):
+        """Test basic set and get operations."""
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("key", {"name": "Black Lotus", "prices": {"usd": None}}, ttl=3600)
+
+        assert cache.get("key") == {"name": "Black Lotus", "prices": {"usd": None}}
+        assert cache.get("missing") is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that entries survive reopening the database."""
+        path = str(tmp_path / "cache.db")
+        first = SQLiteCache(path)
+        first.set("key", {"name": "Card"}, ttl=3600)
+        first.close()
+
+        assert SQLiteCache(path).get("key") == {"name": "Card"}
+
+    def test_expiry(self, tmp_path):
+        """Test that expired entries are not returned."""
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("key", {"name": "Card"}, ttl=0.05)
+        time.sleep(0.1)
+
+        assert cache.get("key") is None
+
+    def test_purge_expired(self, tmp_path):
+        """Test that expired entries are deleted in bulk."""
+        cache = SQLiteCache(str(tmp_path / "cache.db"), purge_interval=None)
+        for i in range(5):
+            cache.set(f"old{i}", {"v": i}, ttl=0.05)
+        cache.set("new", {"v": 1}, ttl=3600)
+        time.sleep(0.1)
+
+        assert cache.size() == 6
+        assert cache.purge_expired() == 5
+        assert cache.size() == 1
+
+    def test_automatic_purge(self, tmp_path):
+        """Test that set() purges expired entries once the interval has passed."""
+        cache = SQLiteCache(str(tmp_path / "cache.db"), purge_interval=0.05)
+        cache.set("old", {"v": 1}, ttl=0.01)
+        time.sleep(0.1)
+
+        cache.set("new", {"v": 2}, ttl=3600)
+
+        assert cache.size() == 1
+
+    def test_stores_compressed_json_with_indexed_expiry(self, tmp_path):
+        """Test the on-disk layout: WAL mode, compressed values, expiry index."""
+        path = str(tmp_path / "cache.db")
+        cache = SQLiteCache(path)
+        cache.set("key", {"text": "x" * 1000}, ttl=3600)
+
+        conn = sqlite3.connect(path)
+        value = conn.execute("SELECT value FROM cache").fetchone()[0]
+        indexes = [row[1] for row in conn.execute("PRAGMA index_list(cache)")]
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert len(value) < 100
+        assert "cache_expires_at" in indexes
+
+    def test_concurrent_threads(self, tmp_path):
+        """Test that threads can write and read concurrently."""
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+
+        def worker(n):
+            for i in range(20):
+                cache.set(f"{n}-{i}", {"v": i}, ttl=3600)
+                assert cache.get(f"{n}-{i}") == {"v": i}
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.size() == 80
+        cache.close()
+
+    def test_closes_connections_of_finished_threads(self, tmp_path):
+        """Test that short-lived threads don't leak their connections."""
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("key", {"v": 1}, ttl=3600)
+
+        for _ in range(50):
+            thread = threading.Thread(target=cache.get, args=("key",))
+            thread.start()
+            thread.join()
+
+        # Only the main thread's connection stays open
+        assert len(cache._connections) == 1
+        assert cache.get("key") == {"v": 1}
+        cache.close()
+
+    def test_clear(self, tmp_path):
+        """Test that clear removes everything."""
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        cache.set("key", {"v": 1}, ttl=3600)
+
+        cache.clear()
+
+        assert cache.size() == 0
+
+    def test_as_global_cache(self, tmp_path, mock_urlopen, sample_card):
+        """Test that requests with cache=True use an installed SQLite cache."""
+        mock_urlopen.set_response(data=sample_card)
+        set_global_cache(SQLiteCache(str(tmp_path / "cache.db")))
+
+        class TestHandler(ScrythonRequestHandler):
+            _endpoint = "cards/named"
+
+        TestHandler(fuzzy="Black Lotus", cache=True)
+        TestHandler(fuzzy="Black Lotus", cache=True)
+
+        assert len(mock_urlopen.calls) == 1
+
+
+class TestFileCache:
+    """Test the sharded file-system cache."""
+
+    KEY = generate_cache_key("cards/named", {"fuzzy": "Black Lotus"})
+
+    def test_set_and_get(self, tmp_path):
+        """Test basic set and get operations."""
+        cache = FileCache(str(tmp_path))
+        cache.set(self.KEY, {"name": "Black Lotus"}, ttl=3600)
+
+        assert cache.get(self.KEY) == {"name": "Black Lotus"}
+        assert cache.get(generate_cache_key("cards/named", {})) is None
+
+    def test_sharded_layout(self, tmp_path):
+        """Test that entries are stored two directory levels deep by key."""
+        cache = FileCache(str(tmp_path))
+        cache.set(self.KEY, {"name": "Black Lotus"}, ttl=3600)
+
+        assert (tmp_path / self.KEY[:2] / self.KEY[2:4] / self.KEY).is_file()
+
+    def test_non_hex_keys_are_hashed(self, tmp_path):
+        """Test that arbitrary keys can't escape the cache directory."""
+        cache = FileCache(str(tmp_path / "cache"))
+        cache.set("../../evil", {"v": 1}, ttl=3600)
+
+        assert cache.get("../../evil") == {"v": 1}
+        assert not (tmp_path / "evil").exists()
+        assert cache.size() == 1
+
+    def test_expiry_readable_from_header(self, tmp_path):
+        """Test that expiry is stored uncompressed ahead of the payload."""
+        cache = FileCache(str(tmp_path))
+        before = time.time()
+        cache.set(self.KEY, {"text": "x" * 1000}, ttl=60)
+
+        path = tmp_path / self.KEY[:2] / self.KEY[2:4] / self.KEY
+        magic, _, _, expires_at = FileCache._HEADER.unpack(
+            path.read_bytes()[: FileCache._HEADER.size]
+        )
+
+        assert magic == b"SCRY"
+        assert before + 60 <= expires_at <= time.time() + 60
+        assert path.stat().st_size < 100
+
+    def test_expired_entries_not_returned(self, tmp_path):
+        """Test that expired entries are misses."""
+        cache = FileCache(str(tmp_path))
+        cache.set(self.KEY, {"v": 1}, ttl=0.05)
+        time.sleep(0.1)
+
+        assert cache.get(self.KEY) is None
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that another instance (or process) sees the same entries."""
+        FileCache(str(tmp_path)).set(self.KEY, {"v": 1}, ttl=3600)
+
+        assert FileCache(str(tmp_path)).get(self.KEY) == {"v": 1}
+
+    def test_atomic_overwrite_leaves_no_temp_files(self, tmp_path):
+        """Test that writes replace entries without leaving temporary files behind."""
+        cache = FileCache(str(tmp_path))
+        for i in range(3):
+            cache.set(self.KEY, {"v": i}, ttl=3600)
+
+        files = [name for _, _, names in os.walk(tmp_path) for name in names]
+        assert files == [self.KEY]
+        assert cache.get(self.KEY) == {"v": 2}
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test that unreadable files are treated as missing."""
+        cache = FileCache(str(tmp_path))
+        cache.set(self.KEY, {"v": 1}, ttl=3600)
+        path = tmp_path / self.KEY[:2] / self.KEY[2:4] / self.KEY
+        path.write_bytes(path.read_bytes()[:20])
+
+        assert cache.get(self.KEY) is None
+
+    def test_prune_removes_expired(self, tmp_path):
+        """Test that prune deletes expired entries."""
+        cache = FileCache(str(tmp_path), prune_interval=None)
+        cache.set("old", {"v": 1}, ttl=0.05)
+        cache.set("new", {"v": 2}, ttl=3600)
+        time.sleep(0.1)
+
+        assert cache.prune() == 1
+        assert cache.size() == 1
+
+    def test_prune_enforces_size_cap(self, tmp_path):
+        """Test that prune removes the oldest entries beyond max_bytes."""
+        cache = FileCache(str(tmp_path), compression="none", prune_interval=None)
+        for i in range(5):
+            cache.set(f"key{i}", {"text": "x" * 100}, ttl=3600)
+            path = cache._path(f"key{i}")
+            os.utime(path, (1000 + i, 1000 + i))
+        entry_size = os.path.getsize(cache._path("key0"))
+
+        removed = cache.prune(max_bytes=entry_size * 2)
+
+        assert removed == 3
+        assert cache.get("key0") is None
+        assert cache.get("key4") == {"text": "x" * 100}
+
+    def test_uncompressed(self, tmp_path):
+        """Test that compression can be turned off."""
+        cache = FileCache(str(tmp_path), compression="none")
+        cache.set(self.KEY, {"v": 1}, ttl=3600)
+
+        assert cache.get(self.KEY) == {"v": 1}
+
+    @pytest.mark.skipif(cache_module.zstd is None, reason="no zstd module available")
+    def test_zstd(self, tmp_path):
+        """Test zstd-compressed entries."""
+        cache = FileCache(str(tmp_path), compression="zstd")
+        cache.set(self.KEY, {"text": "x" * 1000}, ttl=3600)
+
+        assert cache.get(self.KEY) == {"text": "x" * 1000}
+
+    def test_unknown_compression(self, tmp_path):
+        """Test that unknown codecs are rejected."""
+        with pytest.raises(ValueError):
+            FileCache(str(tmp_path), compression="lz4")
+
+    def test_clear(self, tmp_path):
+        """Test that clear removes every entry."""
+        cache = FileCache(str(tmp_path))
+        cache.set("a", {"v": 1}, ttl=3600)
+        cache.set("b", {"v": 2}, ttl=3600)
+
+        cache.clear()
+
+        assert cache.size() == 0
+
+
+class TestTieredCache:
+    """Test the two-tier cache."""
+
+    def test_writes_go_to_both_tiers(self):
+        """Test that set stores in L1 and L2."""
+        l1, l2 = MemoryCache(), MemoryCache()
+        cache = TieredCache(l2, l1=l1)
+
+        cache.set("key", {"v": 1}, ttl=3600)
+
+        assert l1.get("key") == {"v": 1}
+        assert l2.get("key") == {"v": 1}
+
+    def test_l1_served_first(self):
+        """Test that L1 hits don't touch L2."""
+        l2 = MemoryCache()
+        cache = TieredCache(l2)
+        cache.set("key", {"v": 1}, ttl=3600)
+        l2.clear()
+
+        assert cache.get("key") == {"v": 1}
+
+    def test_l2_hits_promoted(self, tmp_path):
+        """Test that an L2 hit (e.g. after a restart) is copied into L1."""
+        path = str(tmp_path / "cache.db")
+        TieredCache(SQLiteCache(path)).set("key", {"v": 1}, ttl=3600)
+
+        l1 = MemoryCache()
+        restarted = TieredCache(SQLiteCache(path), l1=l1)
+
+        assert l1.get("key") is None
+        assert restarted.get("key") == {"v": 1}
+        assert l1.get("key") == {"v": 1}
+
+    def test_separate_ttls(self):
+        """Test that L1 keeps entries for at most l1_ttl."""
+        l1, l2 = MemoryCache(), MemoryCache()
+        cache = TieredCache(l2, l1=l1, l1_ttl=0.05)
+        cache.set("key", {"v": 1}, ttl=3600)
+        time.sleep(0.1)
+
+        assert l1.get("key") is None
+        assert cache.get("key") == {"v": 1}
+
+    def test_miss(self):
+        """Test that a miss in both tiers returns None."""
+        assert TieredCache(MemoryCache()).get("key") is None
+
+    def test_clear(self):
+        """Test that clear empties both tiers."""
+        l1, l2 = MemoryCache(), MemoryCache()
+        cache = TieredCache(l2, l1=l1)
+        cache.set("key", {"v": 1}, ttl=3600)
+
+        cache.clear()
+
+        assert l1.size() == 0
+        assert l2.size() == 0
+
+
+class TestStaleEntries:
+    """Test get_entry() and keeping expired entries for serving stale."""
+
+    def test_memory_keeps_stale_entries(self):
+        """Test that expired entries stay readable through get_entry for keep_stale."""
+        cache = MemoryCache(keep_stale=60)
+        cache.set("key", {"v": 1}, ttl=-1)
+
+        entry = cache.get_entry("key")
+
+        assert cache.get("key") is None
+        assert entry.data == {"v": 1}
+        assert 1 <= entry.stale_for() < 2
+        assert cache.purge_expired() == 0
+
+    def test_memory_drops_entries_past_keep_stale(self):
+        """Test that entries expired longer than keep_stale are gone."""
+        cache = MemoryCache()
+        cache.set("key", {"v": 1}, ttl=-1)
+
+        assert cache.get_entry("key") is None
+        assert cache.size() == 0
+
+    def test_fresh_entry(self):
+        """Test that fresh entries report a negative staleness."""
+        cache = MemoryCache()
+        cache.set("key", {"v": 1}, ttl=60)
+
+        assert cache.get_entry("key").stale_for() < 0
+
+    def test_sqlite_keeps_stale_entries(self, tmp_path):
+        """Test get_entry and purging with keep_stale in SQLiteCache."""
+        cache = SQLiteCache(str(tmp_path / "cache.db"), keep_stale=60)
+        cache.set("key", {"v": 1}, ttl=-1)
+        cache.set("old", {"v": 2}, ttl=-120)
+
+        assert cache.get("key") is None
+        assert cache.get_entry("key").data == {"v": 1}
+        assert cache.get_entry("old") is None
+        assert cache.purge_expired() == 1
+
+    def test_file_cache_keeps_stale_entries(self, tmp_path):
+        """Test get_entry and pruning with keep_stale in FileCache."""
+        cache = FileCache(str(tmp_path), keep_stale=60)
+        cache.set("key", {"v": 1}, ttl=-1)
+        cache.set("old", {"v": 2}, ttl=-120)
+
+        assert cache.get("key") is None
+        assert cache.get_entry("key").data == {"v": 1}
+        assert cache.get_entry("old") is None
+        assert cache.prune() == 1
+
+    def test_tiered_prefers_fresh_l2_over_stale_l1(self):
+        """Test that an expired L1 entry doesn't hide a fresh L2 one."""
+        l1, l2 = MemoryCache(keep_stale=60), MemoryCache(keep_stale=60)
+        cache = TieredCache(l2, l1=l1)
+        l1.set("key", {"v": 1}, ttl=-1)
+        l2.set("key", {"v": 2}, ttl=60)
+
+        assert cache.get_entry("key").data == {"v": 2}
+        assert l1.get("key") == {"v": 2}
+
+    def test_tiered_returns_newest_stale_entry(self):
+        """Test that with no fresh entry, the later-expiring one is returned."""
+        l1, l2 = MemoryCache(keep_stale=60), MemoryCache(keep_stale=60)
+        cache = TieredCache(l2, l1=l1)
+        l1.set("key", {"v": 1}, ttl=-5)
+        l2.set("key", {"v": 2}, ttl=-1)
+
+        assert cache.get_entry("key").data == {"v": 2}
+
+    def test_default_get_entry(self):
+        """Test that backends without get_entry only report fresh entries."""
+
+        class DictCache(CacheBackend):
+            def __init__(self):
+                self.data = {}
+
+            def get(self, key):
+                return self.data.get(key)
+
+            def set(self, key, data, ttl):  # noqa: ARG002
+                self.data[key] = data
+
+            def clear(self):
+                self.data.clear()
+
+        cache = DictCache()
+        cache.set("key", {"v": 1}, ttl=60)
+
+        assert cache.get_entry("key").data == {"v": 1}
+        assert cache.get_entry("key").stale_for() < 0
+        assert cache.get_entry("missing") is None
+
+
+class TestValidators:
+    """Test storing HTTP validators (ETag, Last-Modified) with cache entries."""
+
+    VALIDATORS = {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+
+    def test_memory_round_trip(self):
+        """Test that MemoryCache returns the validators stored with an entry."""
+        cache = MemoryCache()
+        cache.set_entry("key", {"v": 1}, 60, self.VALIDATORS)
+
+        assert cache.get_entry("key").validators == self.VALIDATORS
+        assert cache.get("key") == {"v": 1}
+
+    def test_set_clears_validators(self):
+        """Test that set() replaces an entry's validators."""
+        cache = MemoryCache()
+        cache.set_entry("key", {"v": 1}, 60, self.VALIDATORS)
+        cache.set("key", {"v": 2}, 60)
+
+        assert cache.get_entry("key").validators is None
+
+    def test_expired_validated_entries_kept(self):
+        """Test that expired entries are kept for revalidation only if they have validators."""
+        cache = MemoryCache()
+        cache.set_entry("validated", {"v": 1}, -1, self.VALIDATORS)
+        cache.set_entry("plain", {"v": 2}, -1)
+
+        assert cache.get("validated") is None
+        assert cache.get_entry("validated").validators == self.VALIDATORS
+        assert cache.get_entry("plain") is None
+        assert cache.purge_expired() == 0
+
+    def test_keep_validated_window(self):
+        """Test that validated entries are dropped after keep_validated."""
+        cache = MemoryCache(keep_validated=0.05)
+        cache.set_entry("key", {"v": 1}, 0, self.VALIDATORS)
+        time.sleep(0.1)
+
+        assert cache.get_entry("key") is None
+
+    def test_persistent_backends_keep_validated(self, tmp_path):
+        """Test that SQLite and file caches keep expired validated entries too."""
+        for cache in (
+            SQLiteCache(str(tmp_path / "cache.db")),
+            FileCache(str(tmp_path / "files"), compression="none"),
+        ):
+            cache.set_entry("validated", {"v": 1}, -1, self.VALIDATORS)
+            cache.set_entry("plain", {"v": 2}, -1)
+
+            assert cache.get("validated") is None
+            assert cache.get_entry("validated").validators == self.VALIDATORS
+            assert cache.get_entry("plain") is None
+
+        assert SQLiteCache(str(tmp_path / "cache.db")).purge_expired() == 1
+        assert FileCache(str(tmp_path / "files")).prune() == 1
+
+    def test_sqlite_round_trip(self, tmp_path):
+        """Test that SQLiteCache persists validators."""
+        path = str(tmp_path / "cache.db")
+        SQLiteCache(path).set_entry("key", {"v": 1}, 60, self.VALIDATORS)
+
+        entry = SQLiteCache(path).get_entry("key")
+
+        assert entry.data == {"v": 1}
+        assert entry.validators == self.VALIDATORS
+
+    def test_sqlite_migrates_old_database(self, tmp_path):
+        """Test that databases without the validators column still work."""
+        path = str(tmp_path / "cache.db")
+        with contextlib.closing(sqlite3.connect(path)) as conn:
+            conn.execute(
+                "CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO cache VALUES (?, ?, ?)",
+                ("old", zlib.compress(b'{"v": 1}'), time.time() + 60),
+            )
+            conn.commit()
+
+        cache = SQLiteCache(path)
+        cache.set_entry("new", {"v": 2}, 60, self.VALIDATORS)
+
+        assert cache.get_entry("old").validators is None
+        assert cache.get("old") == {"v": 1}
+        assert cache.get_entry("new").validators == self.VALIDATORS
+
+    def test_file_cache_round_trip(self, tmp_path):
+        """Test that FileCache persists validators, and entries without them."""
+        cache = FileCache(str(tmp_path))
+        cache.set_entry("key", {"v": 1}, 60, self.VALIDATORS)
+        cache.set("plain", {"v": 2}, 60)
+
+        reopened = FileCache(str(tmp_path))
+
+        assert reopened.get_entry("key").validators == self.VALIDATORS
+        assert reopened.get("key") == {"v": 1}
+        assert reopened.get_entry("plain").validators is None
+        assert reopened.get("plain") == {"v": 2}
+
+    def test_tiered_round_trip(self):
+        """Test that TieredCache stores validators in both tiers and promotes them."""
+        l1, l2 = MemoryCache(), MemoryCache()
+        cache = TieredCache(l2, l1=l1)
+        cache.set_entry("key", {"v": 1}, 60, self.VALIDATORS)
+        l1.clear()
+
+        assert cache.get_entry("key").validators == self.VALIDATORS
+        assert l1.get_entry("key").validators == self.VALIDATORS
+
+
 class TestCacheKeyGeneration:
     """Test cache key generation."""
 
@@ -151,6 +855,32 @@ class TestGlobalCache:
         cache2 = get_global_cache()
         assert cache2.get("key") is None
 
+    def test_set_global_cache(self):
+        """Test that the global cache can be replaced with a configured one."""
+        cache = MemoryCache(max_entries=5)
+
+        set_global_cache(cache)
+
+        assert get_global_cache() is cache
+
+    def test_concurrent_first_access(self):
+        """Test that threads racing to create the global cache all get the same one."""
+        reset_global_cache()
+        barrier = threading.Barrier(16)
+
+        def get():
+            barrier.wait()
+            return get_global_cache()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get())) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(cache) for cache in results}) == 1
+
 
 class TestRequestHandlerCaching:
     """Test caching integration with ScrythonRequestHandler."""
@@ -183,6 +913,25 @@ class TestRequestHandlerCaching:
         cache = get_global_cache()
         assert cache.size() == 1
 
+    def test_client_options_not_in_key_or_url(self, mock_urlopen, sample_card):
+        """Test that options like retry_policy don't reach Scryfall or split the cache key."""
+        mock_urlopen.set_response(data=sample_card)
+
+        class TestHandler(ScrythonRequestHandler):
+            _endpoint = "cards/named"
+
+        first = TestHandler(fuzzy="bolt", cache=True, retry_policy=RetryPolicy(max_retries=1))
+        second = TestHandler(
+            fuzzy="bolt", cache=True, cache_ttl=60, retry_policy=RetryPolicy(), single_flight=False
+        )
+
+        assert first._query_params == second._query_params
+        assert len(mock_urlopen.calls) == 1
+        url = mock_urlopen.calls[0]["url"]
+        assert "retry_policy" not in url
+        assert "cache" not in url
+        assert "fuzzy=bolt" in url
+
     def test_cache_hit_skips_api_call(self, mock_urlopen, sample_card):
         """Test that cache hits don't make API calls."""
         reset_global_cache()
@@ -249,7 +998,7 @@ class TestRequestHandlerCaching:
             _endpoint = "cards/named"
 
         class Handler2(ScrythonRequestHandler):
-            _endpoint = "cards/random"
+            _endpoint = "cards/autocomplete"
 
         _h1 = Handler1(fuzzy="bolt", cache=True)
         _h2 = Handler2(cache=True)
@@ -324,3 +1073,207 @@ class TestRequestHandlerCaching:
         # Different order of same params - should still use cache
         _h3 = TestHandler(order="name", q="bolt", cache=True)
         assert len(mock_urlopen.calls) == 1
+
+
+class TestStaleRequests:
+    """Test stale_while_revalidate and stale_if_error on requests."""
+
+    class Handler(ScrythonRequestHandler):
+        _endpoint = "cards/named"
+
+    def _prime(self, mock_urlopen, **kwargs):
+        """Cache a response and let it expire."""
+        set_global_cache(MemoryCache(keep_stale=60))
+        mock_urlopen.set_response(data={"object": "card", "name": "Old"})
+        self.Handler(fuzzy="bolt", cache=True, cache_ttl=0.05, **kwargs)
+        time.sleep(0.1)
+
+    def test_stale_while_revalidate(self, mock_urlopen):
+        """Test that a stale entry is returned at once and refreshed in the background."""
+        self._prime(mock_urlopen, stale_while_revalidate=60)
+        mock_urlopen.set_response(data={"object": "card", "name": "New"})
+
+        handler = self.Handler(fuzzy="bolt", cache=True, cache_ttl=0.05, stale_while_revalidate=60)
+
+        assert handler._scryfall_data["name"] == "Old"
+        for _ in range(100):
+            if len(mock_urlopen.calls) == 2 and not base_module._revalidating:
+                break
+            time.sleep(0.01)
+        assert len(mock_urlopen.calls) == 2
+        entry = get_global_cache().get_entry(
+            generate_cache_key(handler.endpoint, handler._query_params)
+        )
+        assert entry.data["name"] == "New"
+
+    def test_stale_while_revalidate_limit(self, mock_urlopen):
+        """Test that entries staler than the limit are fetched in the foreground."""
+        self._prime(mock_urlopen, stale_while_revalidate=0.01)
+        mock_urlopen.set_response(data={"object": "card", "name": "New"})
+
+        handler = self.Handler(
+            fuzzy="bolt", cache=True, cache_ttl=0.05, stale_while_revalidate=0.01
+        )
+
+        assert handler._scryfall_data["name"] == "New"
+
+    def test_stale_if_error(self, mock_urlopen):
+        """Test that a server error falls back to the stale entry."""
+        self._prime(mock_urlopen, stale_if_error=60, retry=False)
+
+        with patch("scrython.base.urlopen", side_effect=_http_error(503)):
+            handler = self.Handler(
+                fuzzy="bolt", cache=True, cache_ttl=0.05, stale_if_error=60, retry=False
+            )
+
+        assert handler._scryfall_data["name"] == "Old"
+
+    def test_stale_if_error_connection_failure(self, mock_urlopen):
+        """Test that a connection failure falls back to the stale entry."""
+        self._prime(mock_urlopen, stale_if_error=60, retry=False)
+
+        with patch("scrython.base.urlopen", side_effect=urllib.error.URLError("reset")):
+            handler = self.Handler(
+                fuzzy="bolt", cache=True, cache_ttl=0.05, stale_if_error=60, retry=False
+            )
+
+        assert handler._scryfall_data["name"] == "Old"
+
+    def test_stale_if_error_not_for_client_errors(self, mock_urlopen):
+        """Test that a 404 is raised rather than hidden by stale data."""
+        self._prime(mock_urlopen, stale_if_error=60, retry=False)
+
+        with (
+            patch("scrython.base.urlopen", side_effect=_http_error(404)),
+            pytest.raises(Exception, match="404"),
+        ):
+            self.Handler(fuzzy="bolt", cache=True, cache_ttl=0.05, stale_if_error=60, retry=False)
+
+    def test_stale_if_error_limit(self, mock_urlopen):
+        """Test that entries staler than the limit aren't served."""
+        self._prime(mock_urlopen, stale_if_error=0.01, retry=False)
+
+        with (
+            patch("scrython.base.urlopen", side_effect=_http_error(503)),
+            pytest.raises(Exception, match="503"),
+        ):
+            self.Handler(fuzzy="bolt", cache=True, cache_ttl=0.05, stale_if_error=0.01, retry=False)
+
+
+class TestConditionalRequests:
+    """Test revalidating expired entries with conditional requests."""
+
+    class Handler(ScrythonRequestHandler):
+        _endpoint = "cards/named"
+
+    @pytest.fixture
+    def server(self, disable_rate_limiting):  # noqa: ARG002
+        """Fake Scryfall answering with validators, or 304 when they match."""
+        state = {"requests": [], "etag": '"v1"', "name": "Old"}
+
+        def fake_urlopen(request):
+            state["requests"].append(dict(request.header_items()))
+            headers = Message()
+            headers["ETag"] = state["etag"]
+            if request.get_header("If-none-match") == state["etag"]:
+                raise urllib.error.HTTPError(
+                    request.get_full_url(), 304, "Not Modified", headers, io.BytesIO(b"")
+                )
+            return _Response({"object": "card", "name": state["name"]}, headers)
+
+        set_global_cache(MemoryCache(keep_stale=60))
+        with patch("scrython.base.urlopen", side_effect=fake_urlopen):
+            yield state
+
+    def _entry(self, handler):
+        return get_global_cache().get_entry(
+            generate_cache_key(handler.endpoint, handler._query_params)
+        )
+
+    def test_stores_validators(self, server):
+        """Test that a response's ETag is stored with its entry."""
+        handler = self.Handler(fuzzy="bolt", cache=True)
+
+        assert self._entry(handler).validators == {"ETag": '"v1"'}
+        assert "If-none-match" not in server["requests"][0]
+
+    def test_not_modified_refreshes_entry(self, server):
+        """Test that a 304 returns the stored body and extends its TTL."""
+        self.Handler(fuzzy="bolt", cache=True, cache_ttl=0.05)
+        time.sleep(0.1)
+
+        handler = self.Handler(fuzzy="bolt", cache=True, cache_ttl=0.05)
+
+        assert handler._scryfall_data["name"] == "Old"
+        assert server["requests"][1]["If-none-match"] == '"v1"'
+        assert self._entry(handler).stale_for() < 0
+
+        # The refreshed entry is fresh again
+        self.Handler(fuzzy="bolt", cache=True, cache_ttl=0.05)
+        assert len(server["requests"]) == 2
+
+    def test_modified_replaces_entry(self, server):
+        """Test that a changed resource is downloaded with its new validators."""
+        self.Handler(fuzzy="bolt", cache=True, cache_ttl=0.05)
+        time.sleep(0.1)
+        server["etag"], server["name"] = '"v2"', "New"
+
+        handler = self.Handler(fuzzy="bolt", cache=True, cache_ttl=0.05)
+
+        assert handler._scryfall_data["name"] == "New"
+        assert self._entry(handler).validators == {"ETag": '"v2"'}
+
+    def test_default_cache_revalidates(self, server):
+        """Test that the default global cache keeps expired entries for revalidation."""
+        reset_global_cache()
+        TTLPolicy.get_global_policy().register(self.Handler, 0.05)
+        self.Handler(fuzzy="bolt")
+        time.sleep(0.1)
+
+        handler = self.Handler(fuzzy="bolt")
+
+        assert handler._scryfall_data["name"] == "Old"
+        assert server["requests"][1]["If-none-match"] == '"v1"'
+        assert self._entry(handler).stale_for() < 0
+
+    def test_stale_while_revalidate_uses_validators(self, server):
+        """Test that background refreshes are conditional too."""
+        options = {"cache": True, "cache_ttl": 0.05, "stale_while_revalidate": 60}
+        self.Handler(fuzzy="bolt", **options)
+        time.sleep(0.1)
+
+        handler = self.Handler(fuzzy="bolt", **options)
+        for _ in range(100):
+            if len(server["requests"]) == 2 and not base_module._revalidating:
+                break
+            time.sleep(0.01)
+
+        assert handler._scryfall_data["name"] == "Old"
+        assert server["requests"][1]["If-none-match"] == '"v1"'
+        assert self._entry(handler).stale_for() < 0
+
+
+class _Response:
+    """HTTP response with a JSON body and headers."""
+
+    def __init__(self, body, headers):
+        self._body = json.dumps(body).encode("utf-8")
+        self._headers = headers
+
+    def read(self):
+        return self._body
+
+    def info(self):
+        return self._headers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def _http_error(code):
+    return urllib.error.HTTPError(
+        "https://api.scryfall.com/cards/named", code, "error", Message(), io.BytesIO(b"")
+    )
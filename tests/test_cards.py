@@ -1,5 +1,9 @@
 """Tests for scrython.cards module."""
 
+import json
+import threading
+from unittest.mock import Mock, patch
+
 import pytest
 
 from scrython.cards import (
@@ -150,6 +154,56 @@ class TestCollection:
 
         assert "api.scryfall.com/cards/collection" in mock_urlopen.calls[0]["url"]
 
+    @pytest.fixture
+    def chunk_urlopen(self, disable_rate_limiting):  # noqa: ARG002
+        """Mock urlopen answering each collection chunk, recording the identifiers sent."""
+        batches = []
+        lock = threading.Lock()
+
+        def fake_urlopen(request):
+            identifiers = json.loads(request.data)["identifiers"]
+            with lock:
+                batches.append(identifiers)
+
+            body = {"object": "list", "not_found": [], "data": [], "has_more": False}
+            for identifier in identifiers:
+                if identifier["id"].startswith("missing"):
+                    body["not_found"].append(identifier)
+                else:
+                    body["data"].append({"object": "card", "id": identifier["id"], "name": "Card"})
+
+            response = Mock()
+            response.read.return_value = json.dumps(body).encode("utf-8")
+            response.info.return_value.get_param.return_value = "utf-8"
+            response.__enter__ = Mock(return_value=response)
+            response.__exit__ = Mock(return_value=False)
+            return response
+
+        with patch("scrython.base.urlopen", side_effect=fake_urlopen):
+            yield batches
+
+    def test_chunks_large_collections(self, chunk_urlopen):
+        """Test that more than 75 identifiers are split into chunks and merged in order."""
+        identifiers = [{"id": str(i)} for i in range(200)]
+        collection = Collection(data={"identifiers": identifiers})
+
+        assert sorted(len(batch) for batch in chunk_urlopen) == [50, 75, 75]
+        assert [card.card_id for card in collection.data] == [str(i) for i in range(200)]
+        assert collection.not_found == []
+
+    def test_chunks_deduplicated_with_combined_not_found(self, chunk_urlopen):
+        """Test that duplicates are sent once and not_found is merged across chunks."""
+        identifiers = [{"id": str(i)} for i in range(100)] * 2
+        identifiers[10] = {"id": "missing-a"}
+        identifiers[90] = {"id": "missing-b"}
+
+        collection = Collection(data={"identifiers": identifiers})
+
+        assert sum(len(batch) for batch in chunk_urlopen) == 102
+        assert collection.not_found == [{"id": "missing-a"}, {"id": "missing-b"}]
+        assert len(collection.data) == 100
+        assert collection.data[10].card_id == "11"
+
 
 class TestByCodeNumber:
     """Test ByCodeNumber endpoint."""
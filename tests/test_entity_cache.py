@@ -0,0 +1,261 @@
+"""Tests for the cross-endpoint entity cache."""
+
+import asyncio
+import time
+
+import pytest
+
+from scrython.cache import get_global_cache
+from scrython.cards import (
+    ByArenaId,
+    ByCodeNumber,
+    ById,
+    ByMTGOId,
+    ByMultiverseId,
+    ByTCGPlayerId,
+    Named,
+    Search,
+)
+from scrython.entity_cache import EntityCache, get_global_entity_cache
+
+CARD = {
+    "object": "card",
+    "id": "abc-123",
+    "name": "Fire // Ice",
+    "lang": "en",
+    "set": "MH2",
+    "collector_number": "290",
+    "arena_id": 7001,
+    "mtgo_id": 9001,
+    "mtgo_foil_id": 9002,
+    "multiverse_ids": [522299, 522300],
+    "tcgplayer_id": 4001,
+    "cardmarket_id": 5001,
+    "card_faces": [{"name": "Fire"}, {"name": "Ice"}],
+}
+
+LIST = {
+    "object": "list",
+    "has_more": False,
+    "data": [
+        CARD,
+        {
+            "object": "card",
+            "id": "def-456",
+            "set": "mh2",
+            "collector_number": "291",
+            "arena_id": 7002,
+        },
+    ],
+}
+
+
+class TestEntityCache:
+    """Test the EntityCache index."""
+
+    def test_lookup_by_every_identifier(self):
+        """Test that one card answers lookups by all of its identifiers."""
+        cache = EntityCache()
+        cache.add(CARD, ttl=60, by_name=True)
+
+        lookups = [
+            {"id": "abc-123"},
+            {"arena_id": 7001},
+            {"mtgo_id": "9001"},
+            {"mtgo_id": 9002},
+            {"multiverse_id": 522300},
+            {"tcgplayer_id": 4001},
+            {"cardmarket_id": 5001},
+            {"set": "mh2", "collector_number": "290"},
+            {"set": "mh2", "collector_number": "290", "lang": "en"},
+            {"name": "fire // ice", "set": "MH2"},
+            {"name": "Ice", "set": "mh2"},
+        ]
+        for identifier in lookups:
+            assert cache.get(**identifier) is CARD, identifier
+
+    def test_misses(self):
+        """Test that other printings and languages aren't matched."""
+        cache = EntityCache()
+        cache.add(CARD, ttl=60)
+
+        assert cache.get(id="other") is None
+        assert cache.get(set="mh2", collector_number="290", lang="ja") is None
+        assert cache.get(name="Fire // Ice", set="2xm") is None
+
+    def test_non_english_printing_not_indexed_by_name(self):
+        """Test that name + set only finds English printings, like /cards/named."""
+        cache = EntityCache()
+        cache.add({**CARD, "id": "ja", "lang": "ja"}, ttl=60)
+
+        assert cache.get(set="mh2", collector_number="290", lang="ja")["id"] == "ja"
+        assert cache.get(name="Fire // Ice", set="mh2") is None
+
+    def test_name_and_set_only_from_named(self):
+        """Test that name + set keys need by_name, as a set can hold several printings."""
+        cache = EntityCache()
+        cache.add(CARD, ttl=60)
+
+        assert cache.get(name="Fire // Ice", set="mh2") is None
+
+        cache.add(CARD, ttl=60, by_name=True)
+        cache.add(CARD, ttl=60)
+
+        # Seeing the card again elsewhere keeps the key /cards/named gave it
+        assert cache.get(name="Fire // Ice", set="mh2") is CARD
+
+    def test_add_response_indexes_list_items(self):
+        """Test that the cards inside a list page are indexed."""
+        cache = EntityCache()
+        cache.add_response(LIST, ttl=60)
+
+        assert cache.size() == 2
+        assert cache.get(arena_id=7002)["id"] == "def-456"
+
+    def test_ignores_non_card_objects(self):
+        """Test that errors and other objects aren't indexed."""
+        cache = EntityCache()
+        cache.add_response({"object": "error", "status": 404}, ttl=60)
+        cache.add_response({"object": "set", "id": "xyz"}, ttl=60)
+
+        assert cache.size() == 0
+
+    def test_expiry(self):
+        """Test that cards expire after their TTL."""
+        cache = EntityCache()
+        cache.add(CARD, ttl=0.05)
+        time.sleep(0.1)
+
+        assert cache.get(id="abc-123") is None
+        assert cache.size() == 0
+
+    def test_lru_eviction_removes_index_entries(self):
+        """Test that evicted cards can't be found by any identifier."""
+        cache = EntityCache(max_entries=1)
+        cache.add(CARD, ttl=60)
+        cache.add({"object": "card", "id": "other"}, ttl=60)
+
+        assert cache.size() == 1
+        assert cache.get(arena_id=7001) is None
+        assert cache.get(id="other") is not None
+
+    def test_invalid_max_entries(self):
+        """Test that max_entries must be positive."""
+        with pytest.raises(ValueError):
+            EntityCache(max_entries=0)
+
+
+class TestRequestEntityCache:
+    """Test entity lookups across endpoints."""
+
+    def test_search_page_answers_single_card_lookups(self, mock_urlopen):
+        """Test that cards seen on a search page need no further requests."""
+        mock_urlopen.set_response(data=LIST)
+        Search(q="fire", cache=True)
+
+        assert ByArenaId(id=7002, cache=True).card_id == "def-456"
+        assert ByCodeNumber(code="mh2", number="290", cache=True).card_id == "abc-123"
+        assert ByMultiverseId(id=522299, cache=True).card_id == "abc-123"
+        assert ByMTGOId(id=9002, cache=True).card_id == "abc-123"
+        assert ByTCGPlayerId(id=4001, cache=True).card_id == "abc-123"
+        assert len(mock_urlopen.calls) == 1
+
+    def test_two_printings_in_a_set(self, mock_urlopen):
+        """Test that a search page with two printings of a name doesn't answer Named."""
+        showcase = {**CARD, "id": "showcase", "collector_number": "400", "arena_id": 7003}
+        mock_urlopen.set_response(
+            data={"object": "list", "has_more": False, "data": [CARD, showcase]}
+        )
+        Search(q="!'Fire // Ice' set:mh2 unique:prints", cache=True)
+
+        mock_urlopen.set_response(data=CARD)
+        card = Named(exact="Fire // Ice", set="mh2", cache=True)
+
+        assert card.card_id == "abc-123"
+        assert len(mock_urlopen.calls) == 2
+
+        # Scryfall's answer for the pair is now known
+        assert Named(exact="fire // ice", set="MH2", cache=True).card_id == "abc-123"
+        assert Named(exact="Ice", set="mh2", cache=True).card_id == "abc-123"
+        assert len(mock_urlopen.calls) == 2
+
+    def test_named_then_by_id(self, mock_urlopen):
+        """Test that a card fetched by name is found by id."""
+        mock_urlopen.set_response(data=CARD)
+        Named(exact="Fire // Ice", cache=True)
+
+        card = ById(id="abc-123", cache=True)
+
+        assert card.name == "Fire // Ice"
+        assert len(mock_urlopen.calls) == 1
+
+    def test_named_without_set_not_answered(self, mock_urlopen):
+        """Test that a bare name lookup still asks Scryfall for its default printing."""
+        mock_urlopen.set_response(data=CARD)
+        ById(id="abc-123", cache=True)
+
+        Named(exact="Fire // Ice", cache=True)
+
+        assert len(mock_urlopen.calls) == 2
+
+    def test_requires_cache(self, mock_urlopen):
+        """Test that uncached requests neither populate nor use the index."""
+        mock_urlopen.set_response(data=CARD)
+        ById(id="abc-123")
+
+        assert get_global_entity_cache().size() == 0
+
+        ById(id="abc-123", cache=True)
+        ByArenaId(id=7001)
+
+        assert len(mock_urlopen.calls) == 3
+
+    def test_can_be_disabled(self, mock_urlopen):
+        """Test that entity_cache=False skips the index."""
+        mock_urlopen.set_response(data=CARD)
+        ById(id="abc-123", cache=True, entity_cache=False)
+
+        assert get_global_entity_cache().size() == 0
+
+        # entity_cache isn't part of the response cache key, so clear it to fetch again
+        get_global_cache().clear()
+        ById(id="abc-123", cache=True)
+        assert get_global_entity_cache().size() > 0
+        ByArenaId(id=7001, cache=True, entity_cache=False)
+
+        assert len(mock_urlopen.calls) == 3
+
+    def test_non_json_formats_not_answered(self, mock_urlopen):
+        """Test that image and text formats still go to Scryfall."""
+        mock_urlopen.set_response(data=CARD)
+        ById(id="abc-123", cache=True)
+
+        ById(id="abc-123", cache=True, format="text")
+
+        assert len(mock_urlopen.calls) == 2
+
+    def test_coalesced_lookup_answered_first(self, mock_urlopen):
+        """Test that held cards don't join a Collection batch."""
+        mock_urlopen.set_response(data=CARD)
+        ById(id="abc-123", cache=True)
+
+        card = ById(id="abc-123", cache=True, coalesce=True)
+
+        assert card.card_id == "abc-123"
+        assert len(mock_urlopen.calls) == 1
+
+    def test_async_lookup(self, mock_urlopen):
+        """Test that async lookups use the same index."""
+        from scrython.aio.cards import ByArenaId as AsyncByArenaId
+
+        mock_urlopen.set_response(data=LIST)
+        Search(q="fire", cache=True)
+
+        card = asyncio.run(_await(AsyncByArenaId(id=7001, cache=True)))
+
+        assert card.card_id == "abc-123"
+        assert len(mock_urlopen.calls) == 1
+
+
+async def _await(awaitable):
+    return await awaitable
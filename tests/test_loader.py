@@ -0,0 +1,309 @@
+"""Tests for coalescing single-card lookups into collection requests."""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from scrython import aio
+from scrython.base import ScryfallError
+from scrython.cards import ByCodeNumber, ById, CardLoader, Named
+from scrython.cards.loader import identifier_key, identifier_matches, set_global_loader
+from scrython.entity_cache import get_global_entity_cache
+
+
+def _card(card_id, name=None, set_code="tst", number="1"):
+    return {
+        "object": "card",
+        "id": card_id,
+        "name": name or f"Card {card_id}",
+        "set": set_code,
+        "collector_number": number,
+    }
+
+
+@pytest.fixture
+def collection_urlopen(disable_rate_limiting, json_response):  # noqa: ARG001
+    """Mock urlopen answering /cards/collection POSTs, recording each batch."""
+    state = {"batches": [], "other": 0}
+    lock = threading.Lock()
+
+    def fake_urlopen(request):
+        if "/cards/collection" not in request.get_full_url():
+            with lock:
+                state["other"] += 1
+            return json_response(_card("direct"))
+
+        identifiers = json.loads(request.data)["identifiers"]
+        with lock:
+            state["batches"].append(identifiers)
+
+        data, not_found = [], []
+        for identifier in identifiers:
+            if str(identifier.get("id", "")).startswith("missing"):
+                not_found.append(identifier)
+            elif "id" in identifier:
+                data.append(_card(identifier["id"]))
+            elif "name" in identifier:
+                data.append(_card("named", identifier["name"], identifier.get("set", "tst")))
+            else:
+                data.append(
+                    _card(
+                        "numbered",
+                        set_code=identifier["set"],
+                        number=identifier["collector_number"],
+                    )
+                )
+
+        return json_response(
+            {"object": "list", "not_found": not_found, "data": data, "has_more": False}
+        )
+
+    with patch("scrython.base.urlopen", side_effect=fake_urlopen):
+        yield state
+
+
+class TestCardLoader:
+    """Test CardLoader batching."""
+
+    def test_concurrent_lookups_share_one_request(self, collection_urlopen):
+        """Test that lookups within the window are sent as one collection request."""
+        loader = CardLoader(window=0.05)
+
+        futures = [loader.load(id=str(i)) for i in range(10)]
+        cards = [future.result(timeout=5) for future in futures]
+
+        assert [card.card_id for card in cards] == [str(i) for i in range(10)]
+        assert len(collection_urlopen["batches"]) == 1
+
+    def test_not_found(self, collection_urlopen):  # noqa: ARG002
+        """Test that a missing card fails only its own lookup."""
+        loader = CardLoader(window=0.01)
+
+        found = loader.load(id="1")
+        missing = loader.load(id="missing")
+        other = loader.load(id="2")
+
+        assert found.result(timeout=5).card_id == "1"
+        assert other.result(timeout=5).card_id == "2"
+        with pytest.raises(ScryfallError) as exc_info:
+            missing.result(timeout=5)
+        assert exc_info.value.code == "not_found"
+        assert exc_info.value.status == 404
+
+    def test_duplicate_lookups_deduplicated(self, collection_urlopen):
+        """Test that identical lookups send a single identifier."""
+        loader = CardLoader(window=0.01)
+
+        futures = [loader.load(name="Lightning Bolt"), loader.load(name="lightning bolt")]
+        cards = [future.result(timeout=5) for future in futures]
+
+        assert collection_urlopen["batches"] == [[{"name": "Lightning Bolt"}]]
+        assert all(card.name == "Lightning Bolt" for card in cards)
+
+    def test_full_batch_dispatched_immediately(self, collection_urlopen):
+        """Test that reaching 75 lookups sends a batch without waiting for the window."""
+        loader = CardLoader(window=60)
+
+        futures = [loader.load(id=str(i)) for i in range(CardLoader.max_batch_size)]
+
+        assert futures[-1].result(timeout=5).card_id == "74"
+        assert len(collection_urlopen["batches"][0]) == 75
+
+    def test_flush(self, collection_urlopen):
+        """Test that flush() sends pending lookups right away."""
+        loader = CardLoader(window=60)
+
+        future = loader.load(set="lea", collector_number="161")
+        loader.flush()
+
+        assert future.done()
+        assert future.result().collector_number == "161"
+        assert len(collection_urlopen["batches"]) == 1
+
+    def test_invalid_identifier(self):
+        """Test that identifiers Scryfall doesn't accept are rejected."""
+        loader = CardLoader()
+
+        with pytest.raises(ValueError, match="Invalid collection identifier"):
+            loader.load(collector_number="161")
+
+    def test_request_failure_propagates(self, disable_rate_limiting):  # noqa: ARG002
+        """Test that a failed collection request fails every lookup in the batch."""
+        loader = CardLoader(window=60)
+
+        with patch("scrython.base.urlopen", side_effect=OSError("boom")):
+            futures = [loader.load(id="1"), loader.load(id="2")]
+            loader.flush()
+
+        for future in futures:
+            with pytest.raises(Exception, match="boom"):
+                future.result()
+
+    def test_unmatched_identifier_is_not_found(
+        self, disable_rate_limiting, json_response  # noqa: ARG002
+    ):
+        """Test that a reordered response with a card missing never hands out the wrong card."""
+        loader = CardLoader(window=60)
+        body = {"object": "list", "not_found": [], "data": [_card("c"), _card("a")]}
+
+        with patch("scrython.base.urlopen", return_value=json_response(body)):
+            futures = [loader.load(id=card_id) for card_id in ("a", "b", "c")]
+            loader.flush()
+
+        assert futures[0].result().card_id == "a"
+        with pytest.raises(ScryfallError):
+            futures[1].result()
+        assert futures[2].result().card_id == "c"
+
+    def test_options_batched_separately(self, collection_urlopen):
+        """Test that lookups with different request options don't share a batch."""
+        loader = CardLoader(window=60)
+
+        plain = loader.load(id="1")
+        cached = loader.load({"cache": True}, id="2")
+        also_cached = loader.load({"cache": True}, id="3")
+        loader.flush()
+
+        assert [plain.result().card_id, cached.result().card_id] == ["1", "2"]
+        assert also_cached.result().card_id == "3"
+        batches = sorted(collection_urlopen["batches"], key=len)
+        assert batches == [[{"id": "1"}], [{"id": "2"}, {"id": "3"}]]
+
+
+class TestIdentifierHelpers:
+    """Test identifier normalization and matching."""
+
+    def test_identifier_key_normalizes(self):
+        """Test that names, set codes and numeric ids are normalized."""
+        assert identifier_key({"name": "Bolt", "set": "LEA"}) == identifier_key(
+            {"set": "lea", "name": "bolt"}
+        )
+        assert identifier_key({"multiverse_id": 123}) == identifier_key({"multiverse_id": "123"})
+
+    def test_identifier_matches_card_faces(self):
+        """Test that a face name matches a multi-faced card."""
+        card = {"name": "Fire // Ice", "card_faces": [{"name": "Fire"}, {"name": "Ice"}]}
+
+        assert identifier_matches({"name": "ice"}, card)
+        assert not identifier_matches({"name": "Bolt"}, card)
+
+
+class TestCoalescedEndpoints:
+    """Test coalesce=True on single-card endpoints."""
+
+    def test_concurrent_by_id(self, collection_urlopen):
+        """Test that concurrent ById lookups become one collection request."""
+        set_global_loader(CardLoader(window=0.1))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            cards = list(executor.map(lambda i: ById(id=str(i), coalesce=True), range(8)))
+
+        assert [card.card_id for card in cards] == [str(i) for i in range(8)]
+        assert len(collection_urlopen["batches"]) == 1
+        assert collection_urlopen["other"] == 0
+
+    def test_by_code_number(self, collection_urlopen):
+        """Test that set code and collector number map to a collection identifier."""
+        set_global_loader(CardLoader(window=0.01))
+
+        card = ByCodeNumber(code="lea", number="161", coalesce=True)
+
+        assert card.collector_number == "161"
+        assert collection_urlopen["batches"] == [[{"set": "lea", "collector_number": "161"}]]
+
+    def test_named_with_set(self, collection_urlopen):
+        """Test that an exact name with a set code includes the set."""
+        set_global_loader(CardLoader(window=0.01))
+
+        card = Named(exact="Lightning Bolt", set="lea", coalesce=True)
+
+        assert card.name == "Lightning Bolt"
+        assert collection_urlopen["batches"] == [[{"name": "Lightning Bolt", "set": "lea"}]]
+
+    def test_not_found_raises(self, collection_urlopen):  # noqa: ARG002
+        """Test that a coalesced lookup raises ScryfallError for a missing card."""
+        set_global_loader(CardLoader(window=0.01))
+
+        with pytest.raises(ScryfallError):
+            ById(id="missing", coalesce=True)
+
+    def test_falls_back_when_not_expressible(self, collection_urlopen):
+        """Test that lookups collections can't express use the regular endpoint."""
+        Named(fuzzy="bolt", coalesce=True)
+        ByCodeNumber(code="lea", number="161", lang="ja", coalesce=True)
+
+        assert collection_urlopen["batches"] == []
+        assert collection_urlopen["other"] == 2
+
+    def test_request_options_forwarded(self, collection_urlopen):  # noqa: ARG002
+        """Test that a coalesced lookup's cache options apply to its Collection request."""
+        set_global_loader(CardLoader(window=0.01))
+
+        ById(id="1", coalesce=True, cache=True)
+
+        # Only cached responses feed the entity cache
+        assert get_global_entity_cache().get(id="1") is not None
+
+    def test_non_json_format_not_coalesced(self, collection_urlopen):
+        """Test that lookups for other formats use the regular endpoint."""
+        Named(exact="Lightning Bolt", set="lea", format="text", coalesce=True)
+
+        assert collection_urlopen["batches"] == []
+
+    def test_without_coalesce(self, collection_urlopen):
+        """Test that lookups are unchanged by default."""
+        ById(id="abc")
+
+        assert collection_urlopen["batches"] == []
+        assert collection_urlopen["other"] == 1
+
+
+class TestAsyncCoalescedEndpoints:
+    """Test coalesce=True on the scrython.aio single-card endpoints."""
+
+    def test_gathered_by_id(self, collection_urlopen):
+        """Test that concurrent awaited lookups become one collection request."""
+        set_global_loader(CardLoader(window=0.05))
+
+        async def main():
+            return await asyncio.gather(
+                *(aio.cards.ById(id=str(i), coalesce=True) for i in range(8))
+            )
+
+        cards = asyncio.run(main())
+
+        assert [card.card_id for card in cards] == [str(i) for i in range(8)]
+        assert len(collection_urlopen["batches"]) == 1
+        assert collection_urlopen["other"] == 0
+
+    def test_shares_batch_with_threads(self, collection_urlopen):
+        """Test that async and threaded lookups join the same batch."""
+        set_global_loader(CardLoader(window=0.1))
+
+        async def main():
+            return await asyncio.gather(
+                aio.cards.Named(exact="Lightning Bolt", set="lea", coalesce=True),
+                aio.cards.ByCodeNumber(code="lea", number="161", coalesce=True),
+                asyncio.to_thread(ById, id="threaded", coalesce=True),
+            )
+
+        named, numbered, threaded = asyncio.run(main())
+
+        assert named.name == "Lightning Bolt"
+        assert numbered.collector_number == "161"
+        assert threaded.card_id == "threaded"
+        assert len(collection_urlopen["batches"]) == 1
+
+    def test_not_found_raises(self, collection_urlopen):  # noqa: ARG002
+        """Test that a coalesced async lookup raises ScryfallError for a missing card."""
+        set_global_loader(CardLoader(window=0.01))
+
+        async def main():
+            return await aio.cards.ById(id="missing", coalesce=True)
+
+        with pytest.raises(ScryfallError):
+            asyncio.run(main())
@@ -1,12 +1,23 @@
 """Tests for rate limiting functionality."""
 
 import contextlib
+import multiprocessing
+import os
+import sys
+import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
+from scrython import rate_limiter
 from scrython.base import ScrythonRequestHandler
-from scrython.rate_limiter import RateLimiter
+from scrython.rate_limiter import (
+    DEFAULT_ENDPOINT_LIMITS,
+    EndpointRateLimiters,
+    RateLimiter,
+    SharedRateLimiter,
+)
 
 
 class TestRateLimiter:
@@ -77,6 +88,83 @@ class TestRateLimiter:
         # First call is immediate, then 4 waits of 0.05s each
         assert 0.15 < elapsed < 0.3
 
+    def test_burst_allows_back_to_back_calls(self):
+        """Test that burst capacity lets calls through without spacing."""
+        limiter = RateLimiter(calls_per_second=10.0, burst=3)
+
+        start = time.time()
+        for _ in range(3):
+            limiter.wait()
+        burst_elapsed = time.time() - start
+
+        # The fourth call has to wait for a token to refill
+        start = time.time()
+        limiter.wait()
+        refill_elapsed = time.time() - start
+
+        assert burst_elapsed < 0.02
+        assert 0.08 < refill_elapsed < 0.15
+
+    def test_burst_refills_while_idle(self):
+        """Test that idle time builds the burst allowance back up."""
+        limiter = RateLimiter(calls_per_second=20.0, burst=2)
+        limiter.wait()
+        limiter.wait()
+
+        time.sleep(0.12)
+
+        start = time.time()
+        limiter.wait()
+        limiter.wait()
+        assert time.time() - start < 0.02
+
+    def test_reserve_returns_increasing_slots(self):
+        """Test that reservations are handed out in order, one interval apart."""
+        limiter = RateLimiter(calls_per_second=10.0)
+
+        delays = [limiter.reserve() for _ in range(3)]
+
+        assert delays[0] == 0.0
+        assert delays[1] == pytest.approx(0.1, abs=0.01)
+        assert delays[2] == pytest.approx(0.2, abs=0.01)
+
+    def test_threads_sleep_outside_lock(self):
+        """Test that waiting threads don't serialize behind one sleeper."""
+        limiter = RateLimiter(calls_per_second=20.0)
+        finished = []
+        lock = threading.Lock()
+
+        def worker():
+            limiter.wait()
+            with lock:
+                finished.append(time.time())
+
+        start = time.time()
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Slots at 0, 0.05, ..., 0.2s; the lock is never held while sleeping
+        assert 0.15 < max(finished) - start < 0.3
+        assert not limiter.lock.locked()
+
+    def test_unaffected_by_wall_clock_jumps(self):
+        """Test that spacing uses the monotonic clock, not time.time()."""
+        limiter = RateLimiter(calls_per_second=10.0)
+        limiter.wait()
+
+        with patch("time.time", return_value=0.0):
+            assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+
+    def test_invalid_arguments(self):
+        """Test that non-positive rates and bursts are rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(calls_per_second=0)
+        with pytest.raises(ValueError):
+            RateLimiter(burst=0)
+
     def test_get_global_limiter_creates_singleton(self):
         """Test that get_global_limiter returns a singleton."""
         # Reset first
@@ -102,6 +190,201 @@ class TestRateLimiter:
         assert limiter1 is not limiter2
 
 
+def _reserve_many(path, count, queue):
+    """Reserve count slots from a shared limiter in a child process, as monotonic times."""
+    limiter = SharedRateLimiter(calls_per_second=10.0, path=path)
+    queue.put([time.monotonic() + limiter.reserve() for _ in range(count)])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires fcntl")
+class TestSharedRateLimiter:
+    """Test the cross-process SharedRateLimiter."""
+
+    def test_instances_share_budget(self, tmp_path):
+        """Test that limiters using the same file hand out distinct slots."""
+        path = str(tmp_path / "limit")
+        first = SharedRateLimiter(calls_per_second=10.0, path=path)
+        second = SharedRateLimiter(calls_per_second=10.0, path=path)
+
+        delays = [first.reserve(), second.reserve(), first.reserve()]
+
+        assert delays[0] == 0.0
+        assert delays[1] == pytest.approx(0.1, abs=0.01)
+        assert delays[2] == pytest.approx(0.2, abs=0.01)
+
+    def test_separate_files_independent(self, tmp_path):
+        """Test that limiters on different files don't affect each other."""
+        first = SharedRateLimiter(calls_per_second=10.0, path=str(tmp_path / "a"))
+        second = SharedRateLimiter(calls_per_second=10.0, path=str(tmp_path / "b"))
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+
+    def test_processes_share_budget(self, tmp_path):
+        """Test that separate processes draw from one bucket."""
+        path = str(tmp_path / "limit")
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        processes = [context.Process(target=_reserve_many, args=(path, 5, queue)) for _ in range(2)]
+        for process in processes:
+            process.start()
+        slots = sorted(queue.get(timeout=30) + queue.get(timeout=30))
+        for process in processes:
+            process.join()
+
+        # Ten distinct slots, one interval apart, however the processes interleaved
+        gaps = [later - earlier for earlier, later in zip(slots, slots[1:])]
+        assert len(slots) == 10
+        assert min(gaps) > 0.09
+
+    def test_wait_enforces_spacing(self, tmp_path):
+        """Test that wait() sleeps for the shared slot."""
+        limiter = SharedRateLimiter(calls_per_second=20.0, path=str(tmp_path / "limit"))
+
+        start = time.time()
+        for _ in range(3):
+            limiter.wait()
+
+        assert 0.08 < time.time() - start < 0.2
+
+    def test_discards_state_from_previous_boot(self, tmp_path):
+        """Test that a stored time from another monotonic epoch is ignored."""
+        path = tmp_path / "limit"
+        path.write_bytes(SharedRateLimiter._STATE.pack(1e12, 1e12, time.time()))
+
+        limiter = SharedRateLimiter(calls_per_second=10.0, path=str(path))
+
+        assert limiter.reserve() == 0.0
+
+    def test_set_global_limiter(self, tmp_path):
+        """Test that a shared limiter can be installed as the global limiter."""
+        limiter = SharedRateLimiter(path=str(tmp_path / "limit"))
+
+        RateLimiter.set_global_limiter(limiter)
+
+        assert RateLimiter.get_global_limiter() is limiter
+        limiter.close()
+
+    def test_default_file_is_private(self, tmp_path, monkeypatch):
+        """Test that the default state file is per user and only readable by its owner."""
+        monkeypatch.setattr(rate_limiter.tempfile, "gettempdir", lambda: str(tmp_path))
+        limiter = SharedRateLimiter()
+
+        assert limiter.reserve() == 0.0
+        assert limiter.path == str(tmp_path / f"scrython-ratelimit-{os.getuid()}")
+        assert os.stat(limiter.path).st_mode & 0o777 == 0o600
+        limiter.close()
+
+    def test_refuses_symlink(self, tmp_path):
+        """Test that a symlink planted at the state file path isn't followed."""
+        target = tmp_path / "target"
+        target.write_bytes(b"")
+        (tmp_path / "limit").symlink_to(target)
+
+        limiter = SharedRateLimiter(path=str(tmp_path / "limit"))
+
+        with pytest.raises(OSError):
+            limiter.reserve()
+        assert target.read_bytes() == b""
+
+    def test_refuses_default_file_owned_by_another_user(self, tmp_path, monkeypatch):
+        """Test that a default state file created by someone else is rejected."""
+        monkeypatch.setattr(rate_limiter.tempfile, "gettempdir", lambda: str(tmp_path))
+        limiter = SharedRateLimiter()
+        uid = os.getuid()
+        monkeypatch.setattr(rate_limiter.os, "getuid", lambda: uid + 1)
+
+        with pytest.raises(PermissionError):
+            limiter.reserve()
+        assert limiter._fd is None
+
+    def test_requires_fcntl(self, monkeypatch):
+        """Test that platforms without fcntl get a RuntimeError."""
+        monkeypatch.setattr(rate_limiter, "fcntl", None)
+
+        with pytest.raises(RuntimeError, match="fcntl"):
+            SharedRateLimiter()
+
+
+class TestEndpointRateLimiters:
+    """Test per-endpoint-family rate limiting."""
+
+    def test_defaults(self):
+        """Test that Scryfall's stricter endpoints get their own buckets."""
+        limiters = EndpointRateLimiters()
+
+        assert set(limiters.limiters) == set(DEFAULT_ENDPOINT_LIMITS)
+        assert limiters.limiters["cards/search"].calls_per_second == 2.0
+
+    def test_family_matching(self):
+        """Test that paths are matched to families by prefix."""
+        limiters = EndpointRateLimiters({"cards": 5.0, "cards/search": 2.0})
+
+        assert limiters.family("/cards/search") == "cards/search"
+        assert limiters.family("cards/search/extra") == "cards/search"
+        assert limiters.family("/cards/lea/161") == "cards"
+        assert limiters.family("/cards/searchable") == "cards"
+        assert limiters.family("/sets/lea") is None
+
+    def test_families_have_separate_buckets(self):
+        """Test that one family's calls don't delay another's."""
+        limiters = EndpointRateLimiters({"cards/search": 10.0, "cards/named": 10.0})
+
+        assert limiters.reserve("/cards/search") == 0.0
+        assert limiters.reserve("/cards/named") == 0.0
+        assert limiters.reserve("/cards/search") == pytest.approx(0.1, abs=0.01)
+        assert limiters.reserve("/sets") == 0.0
+
+    def test_accepts_limiter_instances(self):
+        """Test that a family can use a caller-provided limiter."""
+        limiter = RateLimiter(calls_per_second=1.0, burst=2)
+        limiters = EndpointRateLimiters({"cards/search": limiter})
+
+        assert limiters.limiter_for("/cards/search") is limiter
+
+    def test_disabled_by_default(self):
+        """Test that per-endpoint limiting is opt-in."""
+        assert EndpointRateLimiters.get_global_limiter() is None
+
+    def test_applied_to_requests(self, mock_urlopen, sample_card):
+        """Test that requests wait on their family bucket but not on others."""
+        mock_urlopen.set_response(data=sample_card)
+        EndpointRateLimiters.set_global_limiter(EndpointRateLimiters({"cards/named": 10.0}))
+
+        class Named(ScrythonRequestHandler):
+            _endpoint = "cards/named"
+
+        class Sets(ScrythonRequestHandler):
+            _endpoint = "sets/lea"
+
+        start = time.time()
+        Sets()
+        Sets()
+        unlimited = time.time() - start
+
+        start = time.time()
+        Named(fuzzy="Card 1")
+        Named(fuzzy="Card 2")
+        limited = time.time() - start
+
+        assert unlimited < 0.05
+        assert limited > 0.08
+
+    def test_skipped_when_rate_limit_disabled(self, mock_urlopen, sample_card):
+        """Test that rate_limit=False bypasses the family buckets too."""
+        mock_urlopen.set_response(data=sample_card)
+        EndpointRateLimiters.set_global_limiter(EndpointRateLimiters({"cards/named": 1.0}))
+
+        class Named(ScrythonRequestHandler):
+            _endpoint = "cards/named"
+
+        start = time.time()
+        Named(fuzzy="Card 1", rate_limit=False)
+        Named(fuzzy="Card 2", rate_limit=False)
+
+        assert time.time() - start < 0.05
+
+
 class TestRequestHandlerRateLimiting:
     """Test rate limiting integration with ScrythonRequestHandler."""
 
@@ -0,0 +1,259 @@
+"""Tests for retries, retry budgets and adaptive rate limiting."""
+
+import email.utils
+import io
+import time
+import urllib.error
+from email.message import Message
+from unittest.mock import patch
+
+import pytest
+
+from scrython.cards import Search
+from scrython.rate_limiter import RateLimiter
+from scrython.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def _http_error(code, retry_after=None):
+    headers = Message()
+    if retry_after is not None:
+        headers["Retry-After"] = retry_after
+    return urllib.error.HTTPError(
+        "https://api.scryfall.com/cards/search", code, "error", headers, io.BytesIO(b"")
+    )
+
+
+@pytest.fixture
+def no_sleep():
+    """Record retry sleeps instead of sleeping."""
+    with patch("scrython.base.time.sleep") as sleep:
+        yield sleep
+
+
+@pytest.fixture
+def scripted_urlopen(disable_rate_limiting, json_response):  # noqa: ARG001
+    """Mock urlopen that raises or returns the queued outcomes in order."""
+    outcomes = []
+
+    def fake_urlopen(_request):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return json_response(outcome)
+
+    with patch("scrython.base.urlopen", side_effect=fake_urlopen) as mock:
+        mock.outcomes = outcomes
+        yield mock
+
+
+LIST = {"object": "list", "has_more": False, "data": [{"id": "1", "name": "Card"}]}
+
+
+class TestParseRetryAfter:
+    """Test Retry-After parsing."""
+
+    def test_seconds(self):
+        """Test delay-seconds values."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(" 0.5 ") == 0.5
+
+    def test_http_date(self):
+        """Test HTTP-date values."""
+        value = email.utils.formatdate(time.time() + 10, usegmt=True)
+        assert 8 < parse_retry_after(value) <= 10
+
+    def test_past_date_and_invalid(self):
+        """Test that past dates clamp to zero and garbage is ignored."""
+        assert parse_retry_after(email.utils.formatdate(0, usegmt=True)) == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestRetryBudget:
+    """Test the retry budget."""
+
+    def test_exhausts(self):
+        """Test that retries stop once the saved-up budget is spent."""
+        budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=2)
+
+        assert budget.try_spend()
+        assert budget.try_spend()
+        assert not budget.try_spend()
+
+    def test_requests_earn_retries(self):
+        """Test that requests deposit their ratio of retries."""
+        budget = RetryBudget(ratio=0.5, min_per_second=0.0, max_tokens=2)
+        budget.try_spend()
+        budget.try_spend()
+
+        budget.record_request()
+        assert not budget.try_spend()
+        budget.record_request()
+        assert budget.try_spend()
+
+
+class TestRetryPolicy:
+    """Test retry decisions and backoff."""
+
+    def test_retryable_errors(self):
+        """Test which errors are retried."""
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(_http_error(429))
+        assert policy.is_retryable(_http_error(503))
+        assert policy.is_retryable(urllib.error.URLError("reset"))
+        assert not policy.is_retryable(_http_error(404))
+        assert not RetryPolicy(retry_connection_errors=False).is_retryable(
+            urllib.error.URLError("reset")
+        )
+
+    def test_max_retries(self):
+        """Test that retries stop after max_retries."""
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.should_retry(_http_error(503), 1)
+        assert not policy.should_retry(_http_error(503), 2)
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test that backoff stays within the exponential ceiling."""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+
+        delays = [policy.delay(3) for _ in range(50)]
+
+        assert all(0 <= delay <= 5.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_wins(self):
+        """Test that Retry-After replaces the backoff, capped at backoff_max."""
+        policy = RetryPolicy(backoff_max=10.0)
+
+        assert policy.delay(0, retry_after=4.0) == 4.0
+        assert policy.delay(0, retry_after=60.0) == 10.0
+
+
+class TestAdaptiveRateLimiter:
+    """Test AIMD adjustments on the rate limiter."""
+
+    def test_penalize_halves_rate(self):
+        """Test multiplicative decrease with a floor."""
+        limiter = RateLimiter(calls_per_second=10.0)
+
+        limiter.penalize()
+        assert limiter.current_rate == 5.0
+        assert limiter.min_interval == 0.2
+
+        for _ in range(10):
+            limiter.penalize()
+        assert limiter.current_rate == 1.0
+
+    def test_recover_adds_back_gradually(self):
+        """Test additive increase up to the configured rate."""
+        limiter = RateLimiter(calls_per_second=10.0)
+        limiter.penalize()
+
+        limiter.recover()
+        assert limiter.current_rate == pytest.approx(5.5)
+
+        for _ in range(20):
+            limiter.recover()
+        assert limiter.current_rate == 10.0
+        assert limiter.min_interval == 0.1
+
+    def test_penalize_honors_retry_after(self):
+        """Test that Retry-After holds back the next slot."""
+        limiter = RateLimiter(calls_per_second=10.0)
+
+        limiter.penalize(retry_after=2.0)
+
+        assert limiter.reserve() == pytest.approx(2.0, abs=0.05)
+
+
+class TestFetchRetries:
+    """Test retries in ScrythonRequestHandler._fetch_raw()."""
+
+    def test_retries_throttled_request(self, scripted_urlopen, no_sleep):
+        """Test that a 429 is retried after its Retry-After."""
+        scripted_urlopen.outcomes.extend([_http_error(429, "2"), LIST])
+
+        results = Search(q="bolt")
+
+        assert results.data[0].name == "Card"
+        assert scripted_urlopen.call_count == 2
+        no_sleep.assert_called_once_with(2.0)
+
+    def test_retries_connection_errors(self, scripted_urlopen, no_sleep):  # noqa: ARG002
+        """Test that connection failures are retried."""
+        scripted_urlopen.outcomes.extend([urllib.error.URLError("reset"), LIST])
+
+        Search(q="bolt")
+
+        assert scripted_urlopen.call_count == 2
+
+    def test_gives_up_after_max_retries(self, scripted_urlopen, no_sleep):
+        """Test that the last error is raised once retries run out."""
+        RetryPolicy.set_global_policy(RetryPolicy(max_retries=2))
+        scripted_urlopen.outcomes.extend([_http_error(503)] * 3)
+
+        with pytest.raises(Exception, match="503"):
+            Search(q="bolt")
+
+        assert scripted_urlopen.call_count == 3
+        assert no_sleep.call_count == 2
+
+    def test_client_errors_not_retried(self, scripted_urlopen, no_sleep):
+        """Test that a 404 fails immediately."""
+        scripted_urlopen.outcomes.append(_http_error(404))
+
+        with pytest.raises(Exception, match="404"):
+            Search(q="bolt")
+
+        assert scripted_urlopen.call_count == 1
+        no_sleep.assert_not_called()
+
+    def test_retry_disabled(self, scripted_urlopen, no_sleep):  # noqa: ARG002
+        """Test that retry=False fails on the first error."""
+        scripted_urlopen.outcomes.append(_http_error(503))
+
+        with pytest.raises(Exception, match="503"):
+            Search(q="bolt", retry=False)
+
+        assert scripted_urlopen.call_count == 1
+
+    def test_budget_stops_retry_storm(self, scripted_urlopen, no_sleep):  # noqa: ARG002
+        """Test that an exhausted budget stops retries across requests."""
+        budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1)
+        RetryPolicy.set_global_policy(RetryPolicy(budget=budget))
+        scripted_urlopen.outcomes.extend([_http_error(503)] * 3)
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="503"):
+                Search(q="bolt")
+
+        # One retry for the first request, none left for the second
+        assert scripted_urlopen.call_count == 3
+
+    def test_throttling_penalizes_limiter(self, scripted_urlopen, no_sleep):  # noqa: ARG002
+        """Test that 429 slows the global limiter and success recovers it."""
+        scripted_urlopen.outcomes.extend([_http_error(429, "1"), LIST])
+
+        with patch("scrython.base.RateLimiter") as limiter_class:
+            Search(q="bolt")
+
+        limiter = limiter_class.get_global_limiter.return_value
+        limiter.penalize.assert_called_once_with(1.0)
+        limiter.recover.assert_called_once()
+
+    def test_iter_all_survives_transient_error(self, scripted_urlopen, no_sleep):  # noqa: ARG002
+        """Test that pagination resumes its page after a 503 instead of failing."""
+        first_page = {
+            "object": "list",
+            "has_more": True,
+            "next_page": "https://api.scryfall.com/cards/search?page=2",
+            "data": [{"id": "1", "name": "Card 1"}],
+        }
+        second_page = {"object": "list", "has_more": False, "data": [{"id": "2", "name": "Card 2"}]}
+        scripted_urlopen.outcomes.extend([first_page, _http_error(503), second_page])
+
+        names = [card.name for card in Search(q="bolt").iter_all()]
+
+        assert names == ["Card 1", "Card 2"]
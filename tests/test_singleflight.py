@@ -0,0 +1,223 @@
+"""Tests for single-flight request deduplication."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from scrython import fetch_many
+from scrython.cards import ById, Random
+from scrython.singleflight import AsyncSingleFlight, SingleFlight, get_global_single_flight
+
+
+@pytest.fixture
+def slow_urlopen(disable_rate_limiting, json_response):  # noqa: ARG001
+    """Mock urlopen that takes a moment to answer, counting requests."""
+    state = {"calls": 0, "fail": False}
+    lock = threading.Lock()
+
+    def fake_urlopen(request):
+        with lock:
+            state["calls"] += 1
+        # Long enough for every thread to join, even across a GC pause
+        time.sleep(0.2)
+        if state["fail"]:
+            raise OSError("connection reset")
+        card_id = request.get_full_url().split("?")[0].rsplit("/", 1)[-1]
+        return json_response({"object": "card", "id": card_id, "name": "Card"})
+
+    with patch("scrython.base.urlopen", side_effect=fake_urlopen):
+        yield state
+
+
+class TestSingleFlight:
+    """Test the SingleFlight group."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent calls for one key run fn once."""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+
+        def fn():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return {"value": 1}
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            leader = executor.submit(flight.do, "key", fn)
+            started.wait()
+            followers = [executor.submit(flight.do, "key", fn) for _ in range(9)]
+            results = [leader.result()] + [future.result() for future in followers]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.in_flight() == 0
+
+    def test_errors_propagate_to_all_callers(self):
+        """Test that every waiting caller sees the leader's exception."""
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fn():
+            started.set()
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            leader = executor.submit(flight.do, "key", fn)
+            started.wait()
+            follower = executor.submit(flight.do, "key", fn)
+
+            for future in (leader, follower):
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+    def test_sequential_calls_not_shared(self):
+        """Test that a finished call doesn't answer later ones."""
+        flight = SingleFlight()
+        counter = iter(range(10))
+
+        assert flight.do("key", lambda: next(counter)) == 0
+        assert flight.do("key", lambda: next(counter)) == 1
+
+    def test_different_keys_independent(self):
+        """Test that different keys run separately."""
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+
+
+class TestAsyncSingleFlight:
+    """Test the AsyncSingleFlight group."""
+
+    def test_concurrent_coroutines_share_one_execution(self):
+        """Test that concurrent awaits for one key run fn once."""
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        async def main():
+            flight = AsyncSingleFlight()
+            return await asyncio.gather(*(flight.do("key", fn) for _ in range(5)))
+
+        results = asyncio.run(main())
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_errors_propagate(self):
+        """Test that waiting coroutines see the leader's exception."""
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def main():
+            flight = AsyncSingleFlight()
+            return await asyncio.gather(
+                *(flight.do("key", fn) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that a caller timing out leaves the shared call running for the others."""
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        async def main():
+            flight = AsyncSingleFlight()
+            leader = asyncio.create_task(asyncio.wait_for(flight.do("key", fn), 0.01))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flight.do("key", fn))
+            with pytest.raises(asyncio.TimeoutError):
+                await leader
+            result = await follower
+            return result, follower.cancelled(), flight._calls
+
+        result, cancelled, remaining = asyncio.run(main())
+
+        assert result == "done"
+        assert not cancelled
+        assert len(calls) == 1
+        assert remaining == {}
+
+    def test_key_released_after_call(self):
+        """Test that a finished call is not shared with later callers."""
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            return len(calls)
+
+        async def main():
+            flight = AsyncSingleFlight()
+            return [await flight.do("key", fn), await flight.do("key", fn)]
+
+        assert asyncio.run(main()) == [1, 2]
+
+
+class TestRequestSingleFlight:
+    """Test single-flight in ScrythonRequestHandler._fetch_raw()."""
+
+    def test_identical_requests_sent_once(self, slow_urlopen):
+        """Test that concurrent identical lookups send one HTTP request."""
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            cards = list(executor.map(lambda _: ById(id="abc"), range(20)))
+
+        assert slow_urlopen["calls"] == 1
+        assert all(card.card_id == "abc" for card in cards)
+
+    def test_different_requests_not_shared(self, slow_urlopen):
+        """Test that different lookups still each send their own request."""
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(lambda i: ById(id=str(i)), range(5)))
+
+        assert slow_urlopen["calls"] == 5
+
+    def test_errors_shared(self, slow_urlopen):
+        """Test that a failed request fails every caller waiting on it."""
+        slow_urlopen["fail"] = True
+
+        def lookup(_):
+            try:
+                ById(id="abc", retry=False)
+            except OSError as exc:
+                return exc
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            errors = list(executor.map(lookup, range(5)))
+
+        assert all(isinstance(error, OSError) for error in errors)
+        assert slow_urlopen["calls"] < 5
+
+    def test_can_be_disabled(self, slow_urlopen):
+        """Test that single_flight=False sends every request."""
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            list(executor.map(lambda _: ById(id="abc", single_flight=False), range(5)))
+
+        assert slow_urlopen["calls"] == 5
+        assert get_global_single_flight().in_flight() == 0
+
+    def test_never_cached_endpoints_not_shared(self, slow_urlopen):
+        """Test that concurrent Random calls each send a request and get their own card."""
+        results = fetch_many([(Random, {}) for _ in range(8)], max_workers=8)
+
+        assert slow_urlopen["calls"] == 8
+        assert not any(isinstance(result, Exception) for result in results)
+        assert len({id(result._scryfall_data) for result in results}) == 8
@@ -0,0 +1,196 @@
+"""Tests for the pooled HTTP transport."""
+
+import http.client
+import json
+import socket
+import urllib.error
+from urllib.request import Request
+
+import pytest
+
+from scrython import transport
+from scrython.transport import (
+    ConnectionPool,
+    get_global_pool,
+    reset_global_pool,
+    set_global_pool,
+)
+
+
+def _get_json(pool, url):
+    with pool.urlopen(url) as response:
+        return json.loads(response.read())
+
+
+class TestConnectionPool:
+    """Test the ConnectionPool class."""
+
+    def test_reuses_connection(self, http_server):
+        """Test that sequential requests share one keep-alive connection."""
+        pool = ConnectionPool()
+
+        for i in range(5):
+            assert _get_json(pool, http_server.url(f"/cards/{i}")) == {"path": f"/cards/{i}"}
+
+        assert http_server.connections == 1
+        assert pool.idle_count() == 1
+
+    def test_idle_timeout_evicts_connection(self, http_server):
+        """Test that connections idle longer than idle_timeout are not reused."""
+        pool = ConnectionPool(idle_timeout=-1)
+
+        _get_json(pool, http_server.url("/a"))
+        _get_json(pool, http_server.url("/b"))
+
+        assert http_server.connections == 2
+
+    def test_max_connections_per_host(self, http_server):
+        """Test that the pool keeps at most max_connections_per_host idle connections."""
+        pool = ConnectionPool(max_connections_per_host=1)
+
+        first = pool.urlopen(http_server.url("/a"))
+        second = pool.urlopen(http_server.url("/b"))
+        first.read()
+        second.read()
+        first.close()
+        second.close()
+
+        assert http_server.connections == 2
+        assert pool.idle_count() == 1
+
+    def test_unread_response_is_not_reused(self, http_server):
+        """Test that a partially read response closes its connection."""
+        pool = ConnectionPool()
+
+        with pool.urlopen(http_server.url("/a")) as response:
+            response.read(1)
+
+        assert pool.idle_count() == 0
+
+    def test_connection_close_header(self, http_server):
+        """Test that a server-requested close is honoured."""
+        pool = ConnectionPool()
+
+        _get_json(pool, http_server.url("/close"))
+        assert pool.idle_count() == 0
+
+        _get_json(pool, http_server.url("/a"))
+        assert http_server.connections == 2
+
+    def test_follows_redirects(self, http_server):
+        """Test that redirects are followed to the final response."""
+        pool = ConnectionPool()
+
+        with pool.urlopen(http_server.url("/redirect")) as response:
+            assert json.loads(response.read()) == {"path": "/target"}
+            assert response.geturl().endswith("/target")
+
+        assert http_server.connections == 1
+
+    def test_http_error(self, http_server):
+        """Test that non-2xx responses raise HTTPError like urllib does."""
+        pool = ConnectionPool()
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            pool.urlopen(http_server.url("/missing"))
+
+        assert exc_info.value.code == 404
+        assert json.loads(exc_info.value.read())["status"] == 404
+
+    def test_http_error_releases_connection(self, http_server):
+        """Test that an error response's connection is reused by the next request."""
+        pool = ConnectionPool()
+
+        for _ in range(3):
+            with pytest.raises(urllib.error.HTTPError):
+                pool.urlopen(http_server.url("/missing"))
+
+        assert _get_json(pool, http_server.url("/a")) == {"path": "/a"}
+        assert http_server.connections == 1
+
+    def test_post_request(self, http_server):
+        """Test that Request objects with a body are sent as POST."""
+        pool = ConnectionPool()
+        request = Request(
+            http_server.url("/cards/collection"),
+            data=json.dumps({"identifiers": [{"id": "1"}]}).encode("utf-8"),
+        )
+        request.add_header("Content-Type", "application/json")
+
+        with pool.urlopen(request) as response:
+            assert json.loads(response.read()) == {"received": {"identifiers": [{"id": "1"}]}}
+
+    def test_info_exposes_headers(self, http_server):
+        """Test that info() returns a message usable by _fetch_raw."""
+        pool = ConnectionPool()
+
+        with pool.urlopen(http_server.url("/a")) as response:
+            assert response.status == 200
+            assert response.info().get_param("charset") == "utf-8"
+            response.read()
+
+    def test_stale_connection_is_replaced(self, http_server):
+        """Test that a pooled connection closed by the server is transparently replaced."""
+        pool = ConnectionPool()
+        _get_json(pool, http_server.url("/a"))
+
+        # Simulate the server dropping the idle connection
+        for idle in pool._idle.values():
+            for connection, _ in idle:
+                connection.sock.shutdown(socket.SHUT_RDWR)
+
+        assert _get_json(pool, http_server.url("/b")) == {"path": "/b"}
+
+    def test_clear_closes_idle_connections(self, http_server):
+        """Test that clear() empties the pool."""
+        pool = ConnectionPool()
+        _get_json(pool, http_server.url("/a"))
+
+        pool.clear()
+
+        assert pool.idle_count() == 0
+
+    def test_drops_inherited_connections_after_fork(self, http_server, monkeypatch):
+        """Test that a pool used in a forked child doesn't reuse the parent's sockets."""
+        pool = ConnectionPool()
+        _get_json(pool, http_server.url("/a"))
+        inherited = next(iter(pool._idle.values()))[0][0]
+
+        monkeypatch.setattr(transport.os, "getpid", lambda: pool._pid + 1)
+
+        assert pool.idle_count() == 0
+        assert _get_json(pool, http_server.url("/b")) == {"path": "/b"}
+        assert http_server.connections == 2
+        # The parent's connection is left open for the parent to keep using
+        assert inherited.sock is not None
+
+
+class TestGlobalPool:
+    """Test the global pool accessors."""
+
+    def test_get_global_pool_creates_singleton(self):
+        """Test that get_global_pool returns a singleton."""
+        reset_global_pool()
+
+        assert get_global_pool() is get_global_pool()
+
+    def test_set_global_pool(self):
+        """Test that set_global_pool replaces the singleton."""
+        pool = ConnectionPool(max_connections_per_host=2)
+        set_global_pool(pool)
+
+        assert get_global_pool() is pool
+
+        reset_global_pool()
+        assert get_global_pool() is not pool
+
+    def test_forked_child_gets_fresh_pool(self):
+        """Test that the at-fork hook replaces the global pool without clearing it."""
+        pool = ConnectionPool()
+        set_global_pool(pool)
+        pool.release(("http", "example.com", 80), http.client.HTTPConnection("example.com"))
+
+        transport._reset_after_fork()
+
+        assert get_global_pool() is not pool
+        assert pool.idle_count() == 1